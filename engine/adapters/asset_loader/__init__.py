@@ -1,4 +1,6 @@
 # engine/adapters/asset_loader/__init__.py
 from .assets import Assets
+from .atlas import AtlasRegion, SpriteAtlas
+from .disk_cache import DecodedImageCache
 
-__all__ = ["Assets"]
+__all__ = ["Assets", "AtlasRegion", "SpriteAtlas", "DecodedImageCache"]
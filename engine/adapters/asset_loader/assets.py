@@ -1,11 +1,15 @@
 # engine/adapters/asset_loader/assets.py
 from __future__ import annotations
 
+import threading
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, Mapping, Set
 
 import pygame
 
+from .atlas import DEFAULT_PAGE_SIZE, DEFAULT_PADDING, SpriteAtlas
+from .disk_cache import DecodedImageCache
+
 
 class Assets:
     """Simple asset store for images and sounds.
@@ -13,12 +17,35 @@ class Assets:
     Lives in the adapters layer and is responsible for loading assets from disk
     using pygame. Game systems should only see this via the ResourceStore,
     not import pygame directly.
+
+    Images listed in the manifest ({sprite_id: filename}) are loaded lazily
+    on first use; prefetch() can decode them on a worker thread ahead of time.
     """
 
-    def __init__(self, base_path: str | Path) -> None:
+    def __init__(
+        self,
+        base_path: str | Path,
+        manifest: Mapping[str, str] | None = None,
+        disk_cache: DecodedImageCache | None = None,
+    ) -> None:
         self._base_path = Path(base_path)
+        # Optional cache of decoded pixels, so warm starts skip PNG decoding.
+        self._disk_cache = disk_cache
         self._images: Dict[str, pygame.Surface] = {}
         self._sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.atlas: SpriteAtlas | None = None
+
+        self._manifest: Dict[str, str] = dict(manifest or {})
+        # Ids whose file failed to load; not retried every frame.
+        self._failed: Set[str] = set()
+        # Surfaces decoded by the prefetch thread, waiting for convert_alpha()
+        # on the main thread.
+        self._decoded: Dict[str, pygame.Surface] = {}
+        self._decoded_lock = threading.Lock()
+        # Image decoding is not safe to run concurrently, so the prefetch
+        # thread and first-use loads on the main thread take turns.
+        self._load_lock = threading.Lock()
+        self._prefetch_thread: threading.Thread | None = None
 
     # ------------------------------------------------------------------
     # Images
@@ -26,14 +53,105 @@ class Assets:
     def load_image(self, sprite_id: str, filename: str) -> None:
         """Load an image file and store it under the given sprite_id."""
         path = self._base_path / filename
-        image = pygame.image.load(str(path)).convert_alpha()
-        self._images[sprite_id] = image
+        image = self._read(path)
+        self._images[sprite_id] = image.convert_alpha()
 
     def has_image(self, sprite_id: str) -> bool:
-        return sprite_id in self._images
+        return sprite_id in self._images or self._load_lazy(sprite_id)
 
     def get_image(self, sprite_id: str) -> pygame.Surface:
-        return self._images[sprite_id]
+        image = self._images.get(sprite_id)
+        if image is None and self._load_lazy(sprite_id):
+            image = self._images[sprite_id]
+        if image is None:
+            raise KeyError(sprite_id)
+        return image
+
+    def _load_lazy(self, sprite_id: str) -> bool:
+        """Load a manifest image on first use; False if unknown or broken."""
+        if sprite_id in self._failed:
+            return False
+        with self._decoded_lock:
+            decoded = self._decoded.pop(sprite_id, None)
+        if sprite_id in self._images:
+            # Already loaded on first use while the prefetch was still running.
+            return True
+        if decoded is not None:
+            self._images[sprite_id] = decoded.convert_alpha()
+            return True
+        filename = self._manifest.get(sprite_id)
+        if filename is None:
+            return False
+        try:
+            self.load_image(sprite_id, filename)
+        except (OSError, pygame.error):
+            # Missing assets are ok in headless/test runs.
+            self._failed.add(sprite_id)
+            return False
+        return True
+
+    # ------------------------------------------------------------------
+    # Prefetch
+    # ------------------------------------------------------------------
+    def prefetch(self, sprite_ids: Iterable[str] | None = None, background: bool = True) -> threading.Thread | None:
+        """Decode manifest images ahead of first use.
+
+        With background=True the PNG decoding runs on a worker thread; the
+        decoded surfaces are converted on the main thread by the next
+        get_image()/has_image() or poll_prefetch() call.
+        """
+        ids = [sid for sid in (sprite_ids if sprite_ids is not None else self._manifest)
+               if sid in self._manifest and sid not in self._images]
+        if not background:
+            for sid in ids:
+                self._load_lazy(sid)
+            return None
+        worker = threading.Thread(target=self._decode, args=(ids,), name="asset-prefetch", daemon=True)
+        self._prefetch_thread = worker
+        worker.start()
+        return worker
+
+    def _decode(self, sprite_ids: list[str]) -> None:
+        for sid in sprite_ids:
+            try:
+                surface = self._read(self._base_path / self._manifest[sid])
+            except (OSError, pygame.error):
+                self._failed.add(sid)
+                continue
+            with self._decoded_lock:
+                self._decoded[sid] = surface
+
+    def _read(self, path: Path) -> pygame.Surface:
+        with self._load_lock:
+            if self._disk_cache is not None:
+                return self._disk_cache.load(path)
+            return pygame.image.load(str(path))
+
+    def poll_prefetch(self) -> bool:
+        """Install decoded images; returns True once, when a background prefetch has finished."""
+        worker = self._prefetch_thread
+        if worker is None or worker.is_alive():
+            return False
+        self._prefetch_thread = None
+        with self._decoded_lock:
+            pending = list(self._decoded)
+        for sid in pending:
+            self._load_lazy(sid)
+        return True
+
+    def build_atlas(self, page_size: int = DEFAULT_PAGE_SIZE, padding: int = DEFAULT_PADDING) -> SpriteAtlas:
+        """Pack all loaded images into an atlas.
+
+        Afterwards get_image() returns subsurfaces of the atlas pages, so
+        unscaled draws of different sprites share one source surface.
+        """
+        images = dict(self._images)
+        atlas = SpriteAtlas.build(images, page_size=page_size, padding=padding)
+        if pygame.display.get_surface() is not None:
+            atlas.pages = [page.convert_alpha() for page in atlas.pages]
+        self._images = {sid: atlas.subsurface(sid) for sid in images}
+        self.atlas = atlas
+        return atlas
 
     # ------------------------------------------------------------------
     # Sounds (for later)
@@ -0,0 +1,137 @@
+# engine/adapters/asset_loader/atlas.py
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping
+
+import pygame
+
+DEFAULT_PAGE_SIZE = 1024
+DEFAULT_PADDING = 1
+
+
+@dataclass(frozen=True)
+class AtlasRegion:
+    """Where one sprite lives inside the atlas: page index + pixel rect."""
+    page: int
+    x: int
+    y: int
+    width: int
+    height: int
+
+    @property
+    def rect(self) -> pygame.Rect:
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+
+
+class SpriteAtlas:
+    """
+    A few large page surfaces holding many small sprites.
+
+    Sprites are looked up by id and come back as subsurfaces of their page,
+    so drawing code keeps working with ordinary surfaces while every blit
+    reads from the same source. Use `region()` when a (page, area) pair is
+    more convenient, e.g. for Surface.blits().
+    """
+
+    def __init__(self, pages: List[pygame.Surface], regions: Dict[str, AtlasRegion]) -> None:
+        self.pages = pages
+        self.regions = regions
+        self._subsurfaces: Dict[str, pygame.Surface] = {}
+
+    def __contains__(self, sprite_id: str) -> bool:
+        return sprite_id in self.regions
+
+    def region(self, sprite_id: str) -> AtlasRegion:
+        return self.regions[sprite_id]
+
+    def page_for(self, sprite_id: str) -> pygame.Surface:
+        return self.pages[self.regions[sprite_id].page]
+
+    def subsurface(self, sprite_id: str) -> pygame.Surface:
+        sub = self._subsurfaces.get(sprite_id)
+        if sub is None:
+            region = self.regions[sprite_id]
+            sub = self.pages[region.page].subsurface(region.rect)
+            self._subsurfaces[sprite_id] = sub
+        return sub
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+    @classmethod
+    def build(
+        cls,
+        images: Mapping[str, pygame.Surface],
+        page_size: int = DEFAULT_PAGE_SIZE,
+        padding: int = DEFAULT_PADDING,
+    ) -> "SpriteAtlas":
+        """
+        Shelf-pack `images` into as few pages as needed.
+
+        Sprites are placed tallest-first, left to right in rows ("shelves");
+        a sprite larger than page_size gets a page of its own.
+        """
+        order = sorted(images, key=lambda sid: (-images[sid].get_height(), -images[sid].get_width(), sid))
+
+        placements: Dict[str, AtlasRegion] = {}
+        page_sizes: List[tuple[int, int]] = []
+        # Current page cursor: shelf origin + shelf height.
+        cur_x = cur_y = shelf_h = 0
+        page = -1
+
+        for sid in order:
+            w, h = images[sid].get_size()
+            if w > page_size or h > page_size:
+                page_sizes.append((w, h))
+                placements[sid] = AtlasRegion(len(page_sizes) - 1, 0, 0, w, h)
+                continue
+            if page < 0 or cur_x + w > page_size:
+                # Start a new shelf (and a new page if the shelf would not fit).
+                cur_x = 0
+                cur_y += shelf_h + (padding if shelf_h else 0)
+                shelf_h = 0
+                if page < 0 or cur_y + h > page_size:
+                    page_sizes.append((page_size, page_size))
+                    page = len(page_sizes) - 1
+                    cur_y = 0
+            placements[sid] = AtlasRegion(page, cur_x, cur_y, w, h)
+            cur_x += w + padding
+            shelf_h = max(shelf_h, h)
+
+        pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+        for sid, region in placements.items():
+            pages[region.page].blit(images[sid], (region.x, region.y))
+        return cls(pages, placements)
+
+    # ------------------------------------------------------------------
+    # Offline cache
+    # ------------------------------------------------------------------
+    def save(self, directory: str | Path) -> None:
+        """Write pages as PNGs plus an index.json describing the regions."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for i, page in enumerate(self.pages):
+            pygame.image.save(page, str(directory / f"page_{i}.png"))
+        index = {
+            "pages": len(self.pages),
+            "regions": {
+                sid: [r.page, r.x, r.y, r.width, r.height] for sid, r in self.regions.items()
+            },
+        }
+        (directory / "index.json").write_text(json.dumps(index, indent=2), encoding="utf-8")
+
+    @classmethod
+    def load(cls, directory: str | Path) -> "SpriteAtlas":
+        directory = Path(directory)
+        index = json.loads((directory / "index.json").read_text(encoding="utf-8"))
+        pages = []
+        for i in range(int(index["pages"])):
+            page = pygame.image.load(str(directory / f"page_{i}.png"))
+            if pygame.display.get_surface() is not None:
+                page = page.convert_alpha()
+            pages.append(page)
+        regions = {sid: AtlasRegion(*values) for sid, values in index["regions"].items()}
+        return cls(pages, regions)
@@ -0,0 +1,102 @@
+# engine/adapters/asset_loader/disk_cache.py
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+from pathlib import Path
+from typing import Dict
+
+import pygame
+
+# Bump when the on-disk layout changes so stale entries are ignored.
+CACHE_VERSION = 1
+PIXEL_FORMAT = "RGBA"
+
+
+class DecodedImageCache:
+    """
+    On-disk cache of decoded image pixels.
+
+    Each entry is the raw RGBA buffer of one source image, stored as
+    `<hash>_<w>x<h>_<format>_v<version>.raw`, where <hash> is a digest of the
+    source file's bytes. Loading maps the file and wraps it with
+    pygame.image.frombuffer(), so a warm start skips PNG decoding entirely.
+    Editing a source file changes its hash, so stale entries are simply never
+    looked up again.
+    """
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        self.cache_dir = Path(cache_dir)
+        # frombuffer() surfaces borrow the mapping; keep it open while in use.
+        self._maps: Dict[Path, mmap.mmap] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def source_hash(path: Path) -> str:
+        return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+    def _entry(self, digest: str, size: tuple[int, int]) -> Path:
+        w, h = size
+        return self.cache_dir / f"{digest}_{w}x{h}_{PIXEL_FORMAT}_v{CACHE_VERSION}.raw"
+
+    def _find(self, digest: str) -> Path | None:
+        suffix = f"_{PIXEL_FORMAT}_v{CACHE_VERSION}.raw"
+        if not self.cache_dir.is_dir():
+            return None
+        for candidate in self.cache_dir.glob(f"{digest}_*{suffix}"):
+            return candidate
+        return None
+
+    def load(self, path: str | Path) -> pygame.Surface:
+        """Return the decoded image for `path`, decoding and caching it on a miss."""
+        path = Path(path)
+        digest = self.source_hash(path)
+        entry = self._find(digest)
+        if entry is not None:
+            surface = self._map(entry)
+            if surface is not None:
+                self.hits += 1
+                return surface
+
+        self.misses += 1
+        surface = pygame.image.load(str(path))
+        self.store(digest, surface)
+        return surface
+
+    def store(self, digest: str, surface: pygame.Surface) -> None:
+        entry = self._entry(digest, surface.get_size())
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = entry.with_suffix(".tmp")
+            tmp.write_bytes(pygame.image.tobytes(surface, PIXEL_FORMAT))
+            # Atomic rename: readers never see a half-written entry.
+            os.replace(tmp, entry)
+        except OSError:
+            # A read-only or full disk just means no cache.
+            pass
+
+    def _map(self, entry: Path) -> pygame.Surface | None:
+        try:
+            w, h = (int(v) for v in entry.name.split("_")[1].split("x"))
+        except (IndexError, ValueError):
+            return None
+        mapped = self._maps.get(entry)
+        if mapped is None:
+            try:
+                with entry.open("rb") as f:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                return None
+            if len(mapped) != w * h * 4:
+                mapped.close()
+                return None
+            self._maps[entry] = mapped
+        return pygame.image.frombuffer(mapped, (w, h), PIXEL_FORMAT)
+
+    def release(self) -> None:
+        """Close mappings; only call once no frombuffer() surface is in use."""
+        for mapped in self._maps.values():
+            mapped.close()
+        self._maps.clear()
@@ -3,8 +3,7 @@ from typing import Optional, Tuple
 
 import pygame
 
-from engine.app.constants import FALLBACK_SCREEN_SIZE
-from engine.resources import ResourceStore
+from engine.resources import ResourceStore, get_viewport
 from engine.game.events.input_events import ClickWorld, ClickUI, Scroll, PointerMove, KeyEvent
 
 class InputAdapter:
@@ -19,28 +18,7 @@ class InputAdapter:
 
     def _to_logical(self, screen_pos: Tuple[int, int]) -> Optional[Tuple[float, float]]:
         mx, my = screen_pos
-        screen_w, screen_h = self.resources.try_get("screen_size", FALLBACK_SCREEN_SIZE)
-        logical_w, logical_h = self.resources.try_get("logical_size", (screen_w, screen_h))
-        if logical_w <= 0 or logical_h <= 0:
-            logical_w, logical_h = screen_w, screen_h
-
-        scale_x = screen_w / logical_w
-        scale_y = screen_h / logical_h
-        scale = min(scale_x, scale_y)
-        if scale <= 0:
-            return None
-
-        render_w = logical_w * scale
-        render_h = logical_h * scale
-        offset_x = (screen_w - render_w) / 2.0
-        offset_y = (screen_h - render_h) / 2.0
-
-        if mx < offset_x or mx > offset_x + render_w or my < offset_y or my > offset_y + render_h:
-            return None
-
-        lx = (mx - offset_x) / scale
-        ly = (my - offset_y) / scale
-        return float(lx), float(ly)
+        return get_viewport(self.resources).screen_to_logical(mx, my)
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.MOUSEBUTTONUP:
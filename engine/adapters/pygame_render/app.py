@@ -5,9 +5,11 @@ from pathlib import Path
 
 import pygame
 
+from engine.adapters.pygame_render.prebake import sprite_variants
 from engine.adapters.pygame_render.renderer import Renderer
-from engine.adapters.asset_loader import Assets
+from engine.adapters.asset_loader import Assets, DecodedImageCache
 from engine.adapters.pygame_input import InputAdapter
+from engine.resources import get_viewport
 from engine.app.constants import (
     FPS,
     DEFAULT_WINDOW_SIZE,
@@ -65,7 +67,14 @@ class PygameApp:
         bg_color = tuple(
             ui_cfg.get("colors", {}).get("background", DEFAULT_BG_COLOR)
         )
-        renderer = Renderer(self.screen, bg_color=bg_color)
+        render_cfg = self.engine.resources.try_get("settings", {}).get("render", {})
+        renderer = Renderer(
+            self.screen,
+            bg_color=bg_color,
+            dirty_rects=bool(render_cfg.get("dirty_rects", False)),
+            scale_cache_bytes=int(float(render_cfg.get("scale_cache_mb", 32)) * 1024 * 1024),
+            scale_bucket_px=int(render_cfg.get("scale_bucket_px", 1)),
+        )
         self.engine.resources.set("renderer", renderer)
         self.engine.resources.set("screen_size", (self.width, self.height))
 
@@ -73,22 +82,30 @@ class PygameApp:
         self.input = InputAdapter(self.engine.resources)
 
         # --- Attach Assets as a resource (images + sounds) ---
-        # Base path is "assets" by default; adjust if your folder differs.
-        assets = Assets(base_path=Path("assets"))
-
-        # Try to load known sprites; skip silently if missing during dev/tests.
-        for sprite_id, filename in (
-            ("goldfish", "sprites/goldfish.png"),
-            ("debug_fish", "debug_fish.png"),
-            ("pellet", "sprites/pellet.png"),
-        ):
-            try:
-                assets.load_image(sprite_id, filename)
-            except Exception:
-                # Missing assets are ok in headless/test runs.
-                pass
-
+        # Images come from the manifest (assets.json) and load lazily on first
+        # draw; everything the game data references is decoded in the
+        # background so startup does not wait on PNG decoding.
+        manifest = self.engine.resources.try_get("asset_manifest") or {}
+        asset_cfg = self.engine.resources.try_get("settings", {}).get("assets", {})
+        disk_cache = None
+        if asset_cfg.get("disk_cache", False):
+            disk_cache = DecodedImageCache(asset_cfg.get("cache_dir", ".cache/assets"))
+        assets = Assets(
+            base_path=Path(manifest.get("base_path", "assets")),
+            manifest=manifest.get("images", {}),
+            disk_cache=disk_cache,
+        )
         self.engine.resources.set("assets", assets)
+        assets.prefetch(sorted(self.engine.resources.try_get("referenced_sprite_ids") or ()), background=True)
+
+    def _poll_assets(self) -> None:
+        """Finish a background prefetch: pack the atlas and pre-bake variants."""
+        assets = self.engine.resources.try_get("assets")
+        if assets is None or not assets.poll_prefetch():
+            return
+        # Pack the loaded sprites into shared atlas pages.
+        assets.build_atlas()
+        self._prebake_sprites(background=True)
 
     def _handle_resize(self, event: pygame.event.Event) -> None:
         """Handle VIDEORESIZE: recreate the window surface + update resources."""
@@ -102,8 +119,20 @@ class PygameApp:
 
         # Update renderer's surface and screen_size resource
         renderer = self.engine.resources.get("renderer")
-        renderer.screen = self.screen
+        renderer.set_screen(self.screen)
         self.engine.resources.set("screen_size", (self.width, self.height))
+        get_viewport(self.engine.resources)
+        self._prebake_sprites(background=True)
+
+    def _prebake_sprites(self, background: bool) -> None:
+        """Build every sprite variant needed at the current window scale."""
+        resources = self.engine.resources
+        renderer = resources.try_get("renderer")
+        assets = resources.try_get("assets")
+        if renderer is None or assets is None:
+            return
+        scale = get_viewport(resources).scale
+        renderer.prebake(sprite_variants(self.engine.world, assets, scale), background=background)
 
     # ------------------------------------------------------------------
     # Main loop
@@ -128,8 +157,11 @@ class PygameApp:
                 if self.input is not None:
                     self.input.handle_event(event)
 
+            self._poll_assets()
+
             # --- Engine update & render ---
             self.engine.update(dt)
             self.engine.render(dt)
 
+        self.engine.shutdown()
         pygame.quit()
@@ -0,0 +1,34 @@
+# engine/adapters/pygame_render/prebake.py
+from __future__ import annotations
+
+from typing import Iterator
+
+import pygame
+
+from engine.ecs import World
+from engine.game.components import SpriteRef
+
+
+def sprite_variants(
+    world: World,
+    assets,
+    scale: float,
+) -> Iterator[tuple[pygame.Surface, float, float, bool, str]]:
+    """
+    Yield (image, width_px, height_px, flip_x, sprite_id) for every distinct
+    sprite size currently in the world, in both facings, at `scale`.
+
+    Sizes are computed exactly like SpriteRenderSystem does so the results
+    land on the same scale-cache keys.
+    """
+    seen: set[tuple[str, float, float]] = set()
+    for _, sprite in world.view(SpriteRef):
+        key = (sprite.sprite_id, sprite.width, sprite.height)
+        if key in seen or not assets.has_image(sprite.sprite_id):
+            continue
+        seen.add(key)
+        image = assets.get_image(sprite.sprite_id)
+        w_px = sprite.width * scale
+        h_px = sprite.height * scale
+        yield image, w_px, h_px, False, sprite.sprite_id
+        yield image, w_px, h_px, True, sprite.sprite_id
@@ -1,10 +1,29 @@
 # engine/adapters/pygame_render/renderer.py
 from __future__ import annotations
 
+import threading
+from typing import Iterable
+
 import pygame
 from engine.app.constants import DEFAULT_BG_COLOR
 from pathlib import Path
 
+from engine.adapters.pygame_render.scale_cache import DEFAULT_BUDGET_BYTES, SurfaceLRU
+
+
+
+class PrebakeRequest:
+    """A background prebake(); join() waits until it is baked or superseded."""
+
+    def __init__(self, generation: int, jobs: list[tuple[object, pygame.Surface, tuple[int, int], bool]]) -> None:
+        self.generation = generation
+        self.jobs = jobs
+        self.cancelled = False
+        self._done = threading.Event()
+
+    def join(self, timeout: float | None = None) -> bool:
+        return self._done.wait(timeout)
+
 
 class Renderer:
     """
@@ -12,20 +31,153 @@ class Renderer:
     Systems will use this via the ResourceStore, not via raw pygame calls.
     """
 
-    def __init__(self, screen: pygame.Surface, bg_color=None) -> None:
+    def __init__(
+        self,
+        screen: pygame.Surface,
+        bg_color=None,
+        dirty_rects: bool = False,
+        scale_cache_bytes: int = DEFAULT_BUDGET_BYTES,
+        scale_bucket_px: int = 1,
+        text_cache_bytes: int = 4 * 1024 * 1024,
+    ) -> None:
         self.screen = screen
         self.bg_color = tuple(bg_color) if bg_color is not None else DEFAULT_BG_COLOR
-        # Cache of transformed surfaces: {(id(image), target_size, flip_x): surface}
-        self._scale_cache: dict[tuple[int, tuple[int, int], bool], pygame.Surface] = {}
+        # Transformed surfaces keyed by (sprite_id, bucketed size, flip_x).
+        # Target sizes are rounded to multiples of scale_bucket_px so nearby
+        # sizes (random species sizes, resize drags) share one entry.
+        self._scale_cache = SurfaceLRU(scale_cache_bytes)
+        self.scale_bucket_px = max(1, int(scale_bucket_px))
+        # Variants finished by a background prebake(), waiting to be swapped
+        # into the cache at the next frame boundary. At most one worker runs;
+        # each prebake() bumps the generation, which cancels older requests
+        # and drops their unfinished or uninstalled results.
+        self._baked: list[tuple[object, pygame.Surface]] = []
+        self._baked_lock = threading.Lock()
+        self._bake_generation = 0
+        self._bake_pending: PrebakeRequest | None = None
+        self._bake_worker: threading.Thread | None = None
         self._font_cache: dict[tuple[int, str], pygame.font.Font] = {}
+        self._font_paths: dict[str, str | None] = {}
+        # Rendered label surfaces keyed by (text, font, size, color).
+        self._text_cache = SurfaceLRU(text_cache_bytes)
+
+        # Dirty-rect mode: static content is captured once into a background
+        # surface; each frame only the rects drawn last frame are restored
+        # from it, and only previous + current rects are pushed to the display.
+        self.dirty_rects = bool(dirty_rects)
+        self._background: pygame.Surface | None = None
+        self._prev_dirty: list[pygame.Rect] = []
+        self._dirty: list[pygame.Rect] = []
+        self._full_present = True
+
+        # Cached static layers: {name: (surface, (x, y))}. While a layer is
+        # being rendered, draws go to it with coordinates shifted by its origin.
+        self._layers: dict[str, tuple[pygame.Surface, tuple[int, int]]] = {}
+        self._target: pygame.Surface | None = None
+        self._origin: tuple[int, int] = (0, 0)
+
+        # Pending submit_image() draws: (image, x, y, w, h, flip_x, sprite_id)
+        self._image_queue: list[tuple[pygame.Surface, int, int, int, int, bool, str | None]] = []
+
+    # ------------------------------------------------------------------
+    # Frame lifecycle
+    # ------------------------------------------------------------------
+    def set_screen(self, screen: pygame.Surface) -> None:
+        """Swap the target surface (e.g. after a resize); forces a full redraw."""
+        self.screen = screen
+        self._layers.clear()
+        self.invalidate_background()
+
+    @property
+    def has_background(self) -> bool:
+        return self._background is not None
+
+    def capture_background(self) -> None:
+        """Snapshot the current screen as the static background (dirty-rect mode)."""
+        if self.dirty_rects:
+            self._background = self.screen.copy()
+
+    def invalidate_background(self) -> None:
+        """Drop the static background; the next frame is redrawn and flipped in full."""
+        self._background = None
+        self._prev_dirty = []
+        self._dirty = []
+        self._full_present = True
 
     def clear(self) -> None:
-        """Fill the entire screen with the background color."""
+        """Fill the entire screen with the background color.
+
+        In dirty-rect mode with a captured background, only the rects drawn
+        last frame are restored from the background instead.
+        """
+        self._dirty = []
+        self._install_baked()
+        if self.dirty_rects and self._background is not None:
+            for rect in self._prev_dirty:
+                self.screen.blit(self._background, rect, rect)
+            return
         self.screen.fill(self.bg_color)
+        self._full_present = True
 
     def present(self) -> None:
-        """Present the backbuffer to the display."""
-        pygame.display.flip()
+        """Present the backbuffer to the display (flushing any queued images)."""
+        self.flush_images()
+        if self.dirty_rects and not self._full_present:
+            rects = self._prev_dirty + self._dirty
+            if rects:
+                pygame.display.update(rects)
+        else:
+            pygame.display.flip()
+        self._full_present = False
+        self._prev_dirty = self._dirty
+        self._dirty = []
+
+    # ------------------------------------------------------------------
+    # Cached layers
+    # ------------------------------------------------------------------
+    def begin_layer(self, name: str, x: float, y: float, width: float, height: float) -> None:
+        """Start (re)rendering layer `name` covering the given screen rect.
+
+        Until end_layer(), draw_* calls render into the layer surface using
+        normal screen coordinates.
+        """
+        # Per-pixel alpha: untouched pixels stay fully transparent and every
+        # draw is forced opaque, so compositing the layer looks exactly like
+        # drawing its contents onto the (opaque) screen, whatever the colors.
+        surface = pygame.Surface((max(1, int(width)), max(1, int(height))), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        origin = (int(x), int(y))
+        self._layers[name] = (surface, origin)
+        self._target = surface
+        self._origin = origin
+
+    def end_layer(self) -> None:
+        self._target = None
+        self._origin = (0, 0)
+
+    def has_layer(self, name: str) -> bool:
+        return name in self._layers
+
+    def drop_layer(self, name: str) -> None:
+        self._layers.pop(name, None)
+
+    def blit_layer(self, name: str) -> None:
+        """Composite a cached layer onto the screen."""
+        surface, origin = self._layers[name]
+        drawn = self.screen.blit(surface, origin)
+        if self.dirty_rects:
+            self._track(drawn)
+
+    def _surface_and_offset(self) -> tuple[pygame.Surface, int, int]:
+        if self._target is not None:
+            return self._target, self._origin[0], self._origin[1]
+        return self.screen, 0, 0
+
+    def _track(self, rect: pygame.Rect) -> None:
+        # Only draws on top of a captured background are dirty; anything drawn
+        # before capture_background() becomes part of the background itself.
+        if self._background is not None and rect.width > 0 and rect.height > 0:
+            self._dirty.append(rect)
 
     def draw_rect(
         self,
@@ -41,8 +193,15 @@ class Renderer:
         Draw a rectangle given primitive values (no pygame.Rect in game layer).
         Supports outline + rounded corners via border_radius.
         """
-        rect = pygame.Rect(int(x), int(y), int(width), int(height))
-        pygame.draw.rect(self.screen, color, rect, outline_width, border_radius=border_radius)
+        target, ox, oy = self._surface_and_offset()
+        rect = pygame.Rect(int(x) - ox, int(y) - oy, int(width), int(height))
+        if target is not self.screen:
+            # The screen ignores a color's alpha; match that on layers.
+            color = pygame.Color(color)
+            color.a = 255
+        drawn = pygame.draw.rect(target, color, rect, outline_width, border_radius=border_radius)
+        if self.dirty_rects and target is self.screen:
+            self._track(drawn)
 
     def draw_image(
         self,
@@ -52,38 +211,229 @@ class Renderer:
         width: float,
         height: float,
         flip_x: bool = False,
+        sprite_id: str | None = None,
     ) -> None:
-        """Draw a (possibly scaled/flipped) image at the given screen-space rect."""
+        """Draw a (possibly scaled/flipped) image at the given screen-space rect.
+
+        `sprite_id` names the source image in the scale cache; without it the
+        surface object itself is used as the key.
+        """
         if width <= 0 or height <= 0:
             return
 
-        target_size = (int(width), int(height))
-        cache_key = (id(image), target_size, bool(flip_x))
+        image = self._transformed(image, (int(width), int(height)), bool(flip_x), sprite_id)
+        target, ox, oy = self._surface_and_offset()
+        drawn = target.blit(image, (int(x) - ox, int(y) - oy))
+        if self.dirty_rects and target is self.screen:
+            self._track(drawn)
 
+    def submit_image(
+        self,
+        image: pygame.Surface,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        flip_x: bool = False,
+        sprite_id: str | None = None,
+    ) -> None:
+        """Queue an image draw; queued images go out in one blits() call on flush_images()."""
+        if width <= 0 or height <= 0:
+            return
+        self._image_queue.append((image, int(x), int(y), int(width), int(height), bool(flip_x), sprite_id))
+
+    def flush_images(self) -> None:
+        """Resolve transforms for all queued images and blit them in a single batch."""
+        queue = self._image_queue
+        if not queue:
+            return
+        self._image_queue = []
+
+        transformed = self._transformed
+        target, ox, oy = self._surface_and_offset()
+        batch = []
+        for image, x, y, w, h, flip_x, sprite_id in queue:
+            source = transformed(image, (w, h), flip_x, sprite_id)
+            page = source.get_abs_parent()
+            if page is not source:
+                # Atlas sprite drawn unscaled: blit straight from its page.
+                area = pygame.Rect(source.get_abs_offset(), source.get_size())
+                batch.append((page, (x - ox, y - oy), area))
+            else:
+                batch.append((source, (x - ox, y - oy)))
+        track = self.dirty_rects and target is self.screen
+        drawn = target.blits(batch, doreturn=track)
+        if track:
+            for rect in drawn:
+                self._track(rect)
+
+    def _transformed(
+        self,
+        image: pygame.Surface,
+        target_size: tuple[int, int],
+        flip_x: bool,
+        sprite_id: str | None = None,
+    ) -> pygame.Surface:
+        """Return `image` scaled to the bucketed target size and optionally flipped (cached)."""
+        cache_key, target_size = self._cache_key(image, target_size, flip_x, sprite_id)
         # Reuse transformed surfaces when possible to avoid per-frame allocations.
-        needs_transform = image.get_size() != target_size or flip_x
-        if needs_transform:
-            cached = self._scale_cache.get(cache_key)
-            if cached is None:
-                cached = image
-                if image.get_size() != target_size:
-                    cached = pygame.transform.smoothscale(image, target_size)
-                if flip_x:
-                    cached = pygame.transform.flip(cached, True, False)
-                self._scale_cache[cache_key] = cached
-            image = cached
-
-        self.screen.blit(image, (int(x), int(y)))
+        if cache_key is None:
+            return image
+        cached = self._scale_cache.get(cache_key)
+        if cached is None:
+            cached = self._transform(image, target_size, flip_x)
+            self._scale_cache.put(cache_key, cached)
+        return cached
+
+    def _cache_key(
+        self,
+        image: pygame.Surface,
+        target_size: tuple[int, int],
+        flip_x: bool,
+        sprite_id: str | None,
+    ) -> tuple[object | None, tuple[int, int]]:
+        """Bucket `target_size`; returns (None, size) when no transform is needed."""
+        step = self.scale_bucket_px
+        if step > 1:
+            target_size = (
+                max(step, round(target_size[0] / step) * step),
+                max(step, round(target_size[1] / step) * step),
+            )
+        if image.get_size() == target_size and not flip_x:
+            return None, target_size
+        # Keying on the surface itself (not id()) keeps it alive while cached,
+        # so a freed surface's id can never alias a stale entry.
+        return (sprite_id if sprite_id is not None else image, target_size, flip_x), target_size
+
+    @staticmethod
+    def _transform(image: pygame.Surface, target_size: tuple[int, int], flip_x: bool) -> pygame.Surface:
+        out = image
+        if image.get_size() != target_size:
+            out = pygame.transform.smoothscale(image, target_size)
+        if flip_x:
+            out = pygame.transform.flip(out, True, False)
+        return out
+
+    # ------------------------------------------------------------------
+    # Pre-baked variants
+    # ------------------------------------------------------------------
+    def prebake(
+        self,
+        variants: Iterable[tuple[pygame.Surface, float, float, bool, str | None]],
+        background: bool = False,
+    ) -> PrebakeRequest | None:
+        """
+        Build scaled/flipped variants ahead of time so the first draw at a new
+        size does not stall the frame.
+
+        `variants` yields (image, width_px, height_px, flip_x, sprite_id) using
+        the same sizes draw_image() will be called with. With background=True
+        the transforms run on the renderer's prebake thread (the returned
+        request can be joined); finished variants are swapped into the cache
+        together at the start of the next frame. Every call supersedes the
+        previous one, so a resize drag only bakes the latest scale.
+        """
+        jobs: list[tuple[object, pygame.Surface, tuple[int, int], bool]] = []
+        seen: set = set()
+        for image, width, height, flip_x, sprite_id in variants:
+            if width <= 0 or height <= 0:
+                continue
+            key, size = self._cache_key(image, (int(width), int(height)), bool(flip_x), sprite_id)
+            if key is None or key in seen or key in self._scale_cache:
+                continue
+            seen.add(key)
+            jobs.append((key, image, size, bool(flip_x)))
+
+        with self._baked_lock:
+            self._bake_generation += 1
+            self._baked = []
+            if self._bake_pending is not None:
+                self._bake_pending.cancelled = True
+                self._bake_pending._done.set()
+                self._bake_pending = None
+            generation = self._bake_generation
+        if not jobs:
+            return None
+        if not background:
+            for key, image, size, flip_x in jobs:
+                self._scale_cache.put(key, self._transform(image, size, flip_x))
+            return None
+        # Transforms lock their source (and an atlas page, for subsurfaces),
+        # which would make main-thread blits from it fail; bake from copies.
+        sources: dict[int, pygame.Surface] = {}
+        jobs = [
+            (key, sources.setdefault(id(image), image.copy()), size, flip_x)
+            for key, image, size, flip_x in jobs
+        ]
+        request = PrebakeRequest(generation, jobs)
+        with self._baked_lock:
+            self._bake_pending = request
+            if self._bake_worker is None:
+                self._bake_worker = threading.Thread(target=self._bake_loop, name="sprite-prebake", daemon=True)
+                self._bake_worker.start()
+        return request
+
+    def _bake_loop(self) -> None:
+        while True:
+            with self._baked_lock:
+                if self._bake_pending is None:
+                    # Idle: exit; the next background prebake() starts a new worker.
+                    self._bake_worker = None
+                    return
+                request, self._bake_pending = self._bake_pending, None
+            baked = []
+            for key, image, size, flip_x in request.jobs:
+                if request.generation != self._bake_generation:
+                    request.cancelled = True
+                    break
+                baked.append((key, self._transform(image, size, flip_x)))
+            with self._baked_lock:
+                if request.generation == self._bake_generation:
+                    self._baked.extend(baked)
+                else:
+                    request.cancelled = True
+            request._done.set()
+
+    def _install_baked(self) -> None:
+        if not self._baked:
+            return
+        with self._baked_lock:
+            baked, self._baked = self._baked, []
+        for key, surface in baked:
+            self._scale_cache.put(key, surface)
+
+    def scale_cache_stats(self) -> dict:
+        """Hit/miss/eviction counters and memory use of the scale cache."""
+        return self._scale_cache.stats()
 
     def draw_text(self, text: str, x: float, y: float, color=(255, 255, 255), font_size: int = 16, font_name: str | None = None) -> None:
+        font_path = self._resolve_font_path(font_name)
+        text_key = (text, font_path or font_name or "", font_size, tuple(color))
+        surface = self._text_cache.get(text_key)
+        if surface is None:
+            surface = self._font(font_path, font_name, font_size).render(text, True, color)
+            self._text_cache.put(text_key, surface)
+        target, ox, oy = self._surface_and_offset()
+        drawn = target.blit(surface, (int(x) - ox, int(y) - oy))
+        if self.dirty_rects and target is self.screen:
+            self._track(drawn)
+
+    def _resolve_font_path(self, font_name: str | None) -> str | None:
+        """Map a font name to a file under assets/ (resolved once per name)."""
+        if not font_name:
+            return None
+        if font_name in self._font_paths:
+            return self._font_paths[font_name]
         font_path: str | None = None
-        if font_name:
-            p = Path(font_name)
-            if not p.is_absolute():
-                p = Path("assets") / p
-            if p.exists():
-                font_path = str(p)
+        p = Path(font_name)
+        if not p.is_absolute():
+            p = Path("assets") / p
+        if p.exists():
+            font_path = str(p)
+        self._font_paths[font_name] = font_path
+        return font_path
 
+    def _font(self, font_path: str | None, font_name: str | None, font_size: int) -> pygame.font.Font:
         key = (font_size, font_path or font_name or "")
         font = self._font_cache.get(key)
         if font is None:
@@ -92,8 +442,7 @@ class Renderer:
             else:
                 font = pygame.font.SysFont(font_name, font_size)
             self._font_cache[key] = font
-        surface = font.render(text, True, color)
-        self.screen.blit(surface, (int(x), int(y)))
+        return font
 
     def draw_line(
         self,
@@ -102,4 +451,13 @@ class Renderer:
         color=(255, 255, 255),
         width: int = 1,
     ) -> None:
-        pygame.draw.line(self.screen, color, (int(start[0]), int(start[1])), (int(end[0]), int(end[1])), width)
+        target, ox, oy = self._surface_and_offset()
+        drawn = pygame.draw.line(
+            target,
+            color,
+            (int(start[0]) - ox, int(start[1]) - oy),
+            (int(end[0]) - ox, int(end[1]) - oy),
+            width,
+        )
+        if self.dirty_rects and target is self.screen:
+            self._track(drawn)
@@ -0,0 +1,76 @@
+# engine/adapters/pygame_render/scale_cache.py
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable
+
+import pygame
+
+DEFAULT_BUDGET_BYTES = 32 * 1024 * 1024
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Approximate pixel memory held by a surface."""
+    w, h = surface.get_size()
+    return w * h * surface.get_bytesize()
+
+
+class SurfaceLRU:
+    """
+    Least-recently-used cache of surfaces bounded by a pixel-memory budget.
+
+    Entries are evicted oldest-first once the total size exceeds
+    `budget_bytes`. A single entry larger than the whole budget is still
+    returned to the caller but is not kept.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES) -> None:
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._entries: "OrderedDict[Hashable, tuple[pygame.Surface, int]]" = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> pygame.Surface | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: Hashable, surface: pygame.Surface) -> None:
+        size = surface_bytes(surface)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes_used -= old[1]
+        if size > self.budget_bytes:
+            return
+        self._entries[key] = (surface, size)
+        self.bytes_used += size
+        while self.bytes_used > self.budget_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.bytes_used -= evicted
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes_used = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes_used,
+            "budget": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,218 @@
+# engine/app/autosave.py
+from __future__ import annotations
+
+import queue
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+from engine.ecs import System, World
+from engine.ecs.snapshot import (
+    IncrementalCapture,
+    WorldCapture,
+    apply_delta,
+    capture_world,
+    decode_snapshot,
+    encode_capture,
+    load_world,
+)
+from engine.resources import ResourceStore
+from engine.scheduling import Scheduler
+from engine.app.savegame import collect_extras, restore_extras, write_atomic
+
+if TYPE_CHECKING:
+    from engine.app.boot import Engine
+
+BASE_NAME = "base.snap"
+DELTA_GLOB = "delta-*.snap"
+
+
+def _delta_name(seq: int) -> str:
+    return f"delta-{seq:06d}.snap"
+
+
+class SnapshotWriter:
+    """
+    Encodes and writes captured snapshots on one background thread.
+
+    A full capture replaces base.snap and deletes older deltas; a delta is
+    written next to it as delta-NNNNNN.snap. Jobs run strictly in order,
+    so each delta lands after the checkpoint it was taken against.
+    """
+
+    def __init__(self, directory: str | Path, codec: str = "zlib") -> None:
+        self.directory = Path(directory)
+        self.codec = codec
+        self.written = 0
+        # Set by the worker when a write fails; the next capture must be full.
+        self.failed = threading.Event()
+        self.last_error: Optional[BaseException] = None
+        self._jobs: "queue.Queue[Optional[tuple[WorldCapture, int]]]" = queue.Queue()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread = threading.Thread(target=self._run, name="autosave-writer", daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self) -> bool:
+        return not self._idle.is_set()
+
+    def submit(self, capture: WorldCapture, seq: int) -> None:
+        with self._lock:
+            self._pending += 1
+            self._idle.clear()
+        self._jobs.put((capture, seq))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued writes; True if everything was written."""
+        return self._idle.wait(timeout)
+
+    def close(self) -> None:
+        self._jobs.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            capture, seq = job
+            try:
+                self._write(capture, seq)
+                self.written += 1
+            except Exception as exc:  # keep the thread alive; surface via last_error
+                self.last_error = exc
+                self.failed.set()
+            finally:
+                with self._lock:
+                    self._pending -= 1
+                    if self._pending == 0:
+                        self._idle.set()
+
+    def _write(self, capture: WorldCapture, seq: int) -> None:
+        data = encode_capture(capture, codec=self.codec)
+        if capture.since_tick is None:
+            write_atomic(self.directory / BASE_NAME, data)
+            for stale in self.directory.glob(DELTA_GLOB):
+                stale.unlink(missing_ok=True)
+        else:
+            write_atomic(self.directory / _delta_name(seq), data)
+
+
+class AutosaveSystem(System):
+    """
+    Periodically checkpoints the world without stalling the frame.
+
+    Runs first in pre_update, i.e. between frames after commands were
+    flushed. The frame thread only copies component values out, and
+    spreads even that over several frames (IncrementalCapture): each frame
+    spends at most about `step_budget` seconds on slices of the rarely
+    written stores, and the last one copies the per-frame columns
+    (positions, velocities, ...) plus the rows written meanwhile.
+    Encoding, compression and file I/O happen on the SnapshotWriter
+    thread. Every `keyframe_every`-th checkpoint is full, the rest are
+    deltas of components changed since the previous one. If the writer
+    is still busy the checkpoint is postponed, not queued.
+    """
+
+    phase = "pre_update"
+
+    def __init__(
+        self,
+        resources: ResourceStore,
+        scheduler: Scheduler,
+        directory: str | Path,
+        interval: float = 5.0,
+        keyframe_every: int = 12,
+        codec: str = "zlib",
+        step_budget: float = 0.002,
+    ) -> None:
+        super().__init__(resources)
+        self.scheduler = scheduler
+        self.interval = float(interval)
+        self.keyframe_every = max(1, int(keyframe_every))
+        self.step_budget = float(step_budget)
+        self.writer = SnapshotWriter(directory, codec=codec)
+        self._elapsed = 0.0
+        # Checkpoint the next delta builds on: (world it was taken from, tick).
+        self._world: Optional[World] = None
+        self._last_tick: Optional[int] = None
+        self._seq = 0
+        # Capture being copied across frames, if any.
+        self._capture: Optional[IncrementalCapture] = None
+
+    def update(self, world: World, dt: float) -> None:
+        self._elapsed += dt
+        capture = self._capture
+        if capture is not None and capture.world is not world:
+            capture = self._capture = None  # a save was loaded mid-capture
+        if capture is None:
+            if self._elapsed < self.interval or self.writer.busy:
+                return
+            self._elapsed = 0.0
+            capture = self._capture = IncrementalCapture(world, since_tick=self._next_since(world))
+            capture.step(self.step_budget)
+        elif not capture.done:
+            capture.step(self.step_budget)
+        else:
+            self._submit(capture.finish(extras=collect_extras(self.resources, self.scheduler)), world)
+
+    def checkpoint(self, world: World) -> None:
+        """Capture now (full or delta) and hand the capture to the writer."""
+        extras = collect_extras(self.resources, self.scheduler)
+        capture = self._capture
+        self._capture = None
+        if capture is not None and capture.world is world:
+            self._submit(capture.finish(extras=extras), world)
+        else:
+            self._submit(capture_world(world, since_tick=self._next_since(world), extras=extras), world)
+
+    def _next_since(self, world: World) -> Optional[int]:
+        """since_tick for the next checkpoint (None: it must be full)."""
+        if self.writer.failed.is_set():
+            self.writer.failed.clear()
+            self._last_tick = None
+        full = (
+            self._last_tick is None
+            or world is not self._world  # a save was loaded: ticks restarted
+            or self._seq >= self.keyframe_every - 1
+        )
+        self._seq = 0 if full else self._seq + 1
+        return None if full else self._last_tick
+
+    def _submit(self, capture: WorldCapture, world: World) -> None:
+        self._capture = None
+        self._world = world
+        self._last_tick = capture.change_tick
+        self.writer.submit(capture, self._seq)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+def load_autosave(engine: Engine, directory: str | Path) -> int:
+    """
+    Restore base.snap plus every delta that chains onto it; returns the
+    number of deltas applied. Stale deltas (left by an interrupted write
+    of a newer base) are ignored.
+    """
+    directory = Path(directory)
+    base = decode_snapshot((directory / BASE_NAME).read_bytes())
+    world, extras = load_world(base, tick_floor=engine.world.change_tick)
+
+    applied = 0
+    tick = base.change_tick
+    deltas: List[Path] = sorted(directory.glob(DELTA_GLOB))
+    for path in deltas:
+        delta = decode_snapshot(path.read_bytes())
+        if delta.since_tick != tick:
+            break
+        extras = apply_delta(world, delta)
+        tick = delta.change_tick
+        applied += 1
+
+    restore_extras(engine.resources, engine.scheduler, extras)
+    engine.world = world
+    return applied
@@ -3,17 +3,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 import random
 
-from engine.ecs import World
+from engine.ecs import EntityId, World
 from engine.scheduling import Scheduler
 from engine.resources import ResourceStore
 from engine.events import EventBus
 
 from engine.game.systems import MovementSystem, RectRenderSystem, FishFSMSystem
 from engine.game.factories import (
-    load_species_config,
     create_fish,      # still exported; handy later
     create_tank,
-    load_tank_config,
 )
 from engine.game.components import (
     Position,
@@ -25,18 +23,12 @@ from engine.game.components import (
     UILabel,
     UIPanel,
 )
-from engine.game.rules import spawn_fish_in_tank_if_allowed
+from engine.game.rules import spawn_fish_batch
 from engine.game.components.tank_bounds import TankBounds
 from engine.game.debug import DebugRegistry
-from engine.game.data.configs import (
-    load_settings_config,
-    load_ui_config,
-    load_debug_panels_config,
-    load_pellet_config,
-    load_falling_config,
-    load_fsm_config,
-    load_movement_config,
-)
+from engine.game.data.configs import referenced_sprite_ids
+from engine.game.data.registry import ConfigRegistry, get_config_registry
+from engine.app.autosave import AutosaveSystem
 from engine.app.constants import (
     RNG_ROOT_SEED,
     RNG_MAX_INT,
@@ -57,25 +49,17 @@ from engine.game.systems import (
     DebugManagerSystem,
     FishStateLabelSystem,
     MovementDebugSystem,
+    CullingSystem,
+    ConfigReloadSystem,
+    SharedColumnsSystem,
 )
 
 
-def _validate_ui_config(ui_cfg: dict) -> None:
-    styles = ui_cfg.get("styles", {})
-    comps = ui_cfg.get("components", [])
-    for comp in comps:
-        if "type" not in comp:
-            raise ValueError("UI component missing 'type'")
-        style_key = comp.get("style")
-        if style_key is not None and style_key not in styles:
-            raise ValueError(
-                f"UI component {comp.get('id', comp['type'])!r} references unknown style {style_key!r}"
-            )
-        ctype = comp["type"]
-        if ctype not in ("label",) and ("width" not in comp or "height" not in comp):
-            raise ValueError(
-                f"UI component {comp.get('id', comp['type'])!r} must define width/height"
-            )
+def _validate_sprite_refs(manifest: dict, sprite_ids: set[str]) -> None:
+    images = manifest.get("images", {})
+    missing = sorted(sid for sid in sprite_ids if sid not in images)
+    if missing:
+        raise ValueError(f"assets.json has no entry for referenced sprite ids: {', '.join(missing)}")
 
 
 @dataclass
@@ -94,6 +78,50 @@ class Engine:
     def render(self, dt: float) -> None:
         self.scheduler.render(self.world, dt)
 
+    def shutdown(self) -> None:
+        """Let systems with background work (e.g. autosave) finish it."""
+        for system in self.scheduler.systems():
+            close = getattr(system, "close", None)
+            if close is not None:
+                close()
+
+
+def _set_simulation_configs(resources: ResourceStore, configs: ConfigRegistry) -> None:
+    """Publish the game object configs the simulation systems read."""
+    resources.set("species_config", configs.get("species").get("species", {}))
+    resources.set("tank_config", configs.get("tanks"))
+    resources.set("pellet_config", configs.get("pellets"))
+    resources.set("falling_config", configs.get("falling"))
+    resources.set("fsm_config", configs.get("fsm"))
+    resources.set("movement_config", configs.get("movement"))
+
+
+def _create_configured_tank(world: World, tank_id: str, tank_def) -> EntityId:
+    """Create a tank entity from its tanks.json entry (validates bounds/max_fish)."""
+    bounds = tank_def.get("bounds")
+    if not (isinstance(bounds, (list, tuple)) and len(bounds) == 4):
+        raise ValueError(f"Tank {tank_id!r} is missing a 4-element 'bounds' list.")
+
+    x, y, width, height = (
+        float(bounds[0]),
+        float(bounds[1]),
+        float(bounds[2]),
+        float(bounds[3]),
+    )
+    max_fish = int(tank_def.get("max_fish", 0))
+    if max_fish <= 0:
+        raise ValueError(f"Tank {tank_id!r} must define max_fish > 0.")
+
+    return create_tank(
+        world,
+        tank_id=tank_id,
+        max_fish=max_fish,
+        x=x,
+        y=y,
+        width=width,
+        height=height,
+    )
+
 
 def _populate_debug_fish(
     world: World,
@@ -140,18 +168,20 @@ def _populate_debug_fish(
     margin = min(margin, max_margin)
 
     # Spawn within the tank rect, keeping a configurable margin from edges.
+    # Positions are drawn up front so the whole group goes in as one batch.
+    positions = []
     for _ in range(count):
         x = rng.uniform(left + margin, right - margin)
         y = rng.uniform(top + margin, bottom - margin)
-        spawn_fish_in_tank_if_allowed(
-            world,
-            tank_eid=tank_eid,
-            species_cfg=species_cfg,
-            species_id="debug_fish",
-            x=x,
-            y=y,
-            rng=rng,
-        )
+        positions.append((x, y))
+    spawn_fish_batch(
+        world,
+        tank_eid=tank_eid,
+        species_cfg=species_cfg,
+        species_id="debug_fish",
+        positions=positions,
+        rng=rng,
+    )
 
 
 def _create_ui_from_config(
@@ -337,12 +367,13 @@ def _create_ui_from_config(
     resources.set("ui_styles", styles)
 
 
-def build_engine() -> Engine:
+def build_engine(registry: ConfigRegistry | None = None) -> Engine:
     """
     Composition root for the core engine.
     - Creates ResourceStore + EventBus.
     - Creates deterministic RNGs.
-    - Loads settings, UI, species + tank config from data files.
+    - Loads settings, UI, species + tank config via the ConfigRegistry
+      (the shared process-wide one unless `registry` is given).
     - Creates World + Scheduler and registers systems.
     - Spawns a few bouncing fish rectangles per config.
     """
@@ -351,9 +382,14 @@ def build_engine() -> Engine:
     # ------------------------------------------------------------------
     # User-tweakable configs
     # ------------------------------------------------------------------
-    settings = load_settings_config()
-    ui_cfg = load_ui_config()
-    debug_panels_cfg = load_debug_panels_config()
+    # Each data file is parsed + validated once per process (and cached on
+    # disk between processes); everything below is frozen/read-only.
+    configs = registry if registry is not None else get_config_registry()
+    resources.set("config_registry", configs)
+
+    settings = configs.get("settings")
+    ui_cfg = configs.get("ui")
+    debug_panels_cfg = configs.get("debug_panels")
     resources.set("settings", settings)
     resources.set("ui_config", ui_cfg)
     resources.set("debug_panels_config", debug_panels_cfg)
@@ -385,26 +421,18 @@ def build_engine() -> Engine:
     # ------------------------------------------------------------------
     # Load game object configs
     # ------------------------------------------------------------------
-    species_cfg = load_species_config()
-    resources.set("species_config", species_cfg)
-
-    tank_cfg = load_tank_config()
-    resources.set("tank_config", tank_cfg)
-
-    pellet_cfg = load_pellet_config()
-    resources.set("pellet_config", pellet_cfg)
-
-    falling_cfg = load_falling_config()
-    resources.set("falling_config", falling_cfg)
-
-    fsm_cfg = load_fsm_config()
-    resources.set("fsm_config", fsm_cfg)
-
-    movement_cfg = load_movement_config()
-    resources.set("movement_config", movement_cfg)
-
-    # Validate UI config components reference defined styles
-    _validate_ui_config(ui_cfg)
+    _set_simulation_configs(resources, configs)
+    species_cfg = resources.get("species_config")
+    tank_cfg = resources.get("tank_config")
+    pellet_cfg = resources.get("pellet_config")
+
+    # Asset manifest + the sprite ids our data actually references; the
+    # adapter loads them lazily / prefetches them in the background.
+    asset_manifest = configs.get("assets")
+    sprite_ids = referenced_sprite_ids(species_cfg, pellet_cfg, ui_cfg)
+    _validate_sprite_refs(asset_manifest, sprite_ids)
+    resources.set("asset_manifest", asset_manifest)
+    resources.set("referenced_sprite_ids", sprite_ids)
 
     # ------------------------------------------------------------------
     # World + scheduler + systems
@@ -424,15 +452,42 @@ def build_engine() -> Engine:
     sprite_render_sys = SpriteRenderSystem(resources)
     fish_state_label_sys = FishStateLabelSystem(resources)
     movement_debug_sys = MovementDebugSystem(resources)
+    culling_sys = CullingSystem(resources)
 
     # Order matters:
+    # - AutosaveSystem (optional) checkpoints between frames, after the last flush
+    # - ConfigReloadSystem (optional) swaps reloaded configs before any logic runs
     # - FSM before Movement in logic
     # - UI buttons process clicks before placement
     # - Keyboard/mouse state update before other logic
     # - Placement consumes input events and queues commands before movement
     # - Falling applies gravity before integration/movement
+    # - CullingSystem runs first in render so every renderer sees this frame's culled set
     # - RectRenderSystem clears & presents
     # - SpriteRenderSystem draws on top (no clear/present)
+    # - SharedColumnsSystem (optional) publishes finished frame state last in post_update
+    autosave_cfg = settings.get("autosave", {})
+    if autosave_cfg.get("enabled", False):
+        scheduler.add_system(
+            AutosaveSystem(
+                resources,
+                scheduler,
+                directory=autosave_cfg.get("directory", "saves/autosave"),
+                interval=float(autosave_cfg.get("interval", 5.0)),
+                keyframe_every=int(autosave_cfg.get("keyframe_every", 12)),
+                codec=autosave_cfg.get("codec", "zlib"),
+                step_budget=float(autosave_cfg.get("step_budget", 0.002)),
+            ),
+            phase="pre_update",
+        )
+
+    reload_cfg = settings.get("config", {})
+    if reload_cfg.get("hot_reload", False):
+        scheduler.add_system(
+            ConfigReloadSystem(resources, poll_interval=float(reload_cfg.get("poll_interval", 0.5))),
+            phase="pre_update",
+        )
+
     scheduler.add_system(fsm_sys, phase="logic")
     scheduler.add_system(keyboard_sys, phase="logic")
     scheduler.add_system(mouse_sys, phase="logic")
@@ -442,6 +497,18 @@ def build_engine() -> Engine:
     scheduler.add_system(falling_sys, phase="logic")
     scheduler.add_system(move_sys, phase="logic")
 
+    shared_cfg = settings.get("shared_columns", {})
+    if shared_cfg.get("enabled", False):
+        scheduler.add_system(
+            SharedColumnsSystem(
+                resources,
+                name=shared_cfg.get("name") or None,
+                capacity=int(shared_cfg.get("capacity", 4096)),
+            ),
+            phase="post_update",
+        )
+
+    scheduler.add_system(culling_sys, phase="render")
     scheduler.add_system(rect_render_sys, phase="render")
     scheduler.add_system(UILabelSystem(resources), phase="render")
     scheduler.add_system(movement_debug_sys, phase="render")
@@ -456,36 +523,11 @@ def build_engine() -> Engine:
         raise ValueError("tanks.json must define at least one tank in 'tanks'.")
 
     starting_tank_id = tank_cfg.get("starting_tank_id", DEFAULT_TANK_ID)
-    tank_def = tanks_map.get(starting_tank_id)
-    if tank_def is None:
+    if starting_tank_id not in tanks_map:
         # Fallback to DEFAULT_TANK_ID if present, otherwise the first entry.
-        fallback_id = DEFAULT_TANK_ID if DEFAULT_TANK_ID in tanks_map else next(iter(tanks_map))
-        starting_tank_id = fallback_id
-        tank_def = tanks_map[starting_tank_id]
-
-    bounds = tank_def.get("bounds")
-    if not (isinstance(bounds, (list, tuple)) and len(bounds) == 4):
-        raise ValueError(f"Tank {starting_tank_id!r} is missing a 4-element 'bounds' list.")
-
-    x, y, width, height = (
-        float(bounds[0]),
-        float(bounds[1]),
-        float(bounds[2]),
-        float(bounds[3]),
-    )
-    max_fish = int(tank_def.get("max_fish", 0))
-    if max_fish <= 0:
-        raise ValueError(f"Tank {starting_tank_id!r} must define max_fish > 0.")
-
-    tank_eid = create_tank(
-        world,
-        tank_id=starting_tank_id,
-        max_fish=max_fish,
-        x=x,
-        y=y,
-        width=width,
-        height=height,
-    )
+        starting_tank_id = DEFAULT_TANK_ID if DEFAULT_TANK_ID in tanks_map else next(iter(tanks_map))
+    tank_def = tanks_map[starting_tank_id]
+    tank_eid = _create_configured_tank(world, starting_tank_id, tank_def)
 
     # ------------------------------------------------------------------
     # Debug entities so we see something
@@ -499,3 +541,52 @@ def build_engine() -> Engine:
     _create_ui_from_config(world, resources, logical_w, logical_h)
 
     return Engine(world=world, scheduler=scheduler, resources=resources)
+
+
+def build_tank_engine(
+    tank_id: str,
+    registry: ConfigRegistry | None = None,
+    name: str | None = None,
+    fish: int | None = None,
+) -> Engine:
+    """
+    Headless engine simulating a single tank: simulation systems only (no
+    UI, input or render systems) and a World holding just that tank.
+
+    Used by sharded mode (engine.app.sharding). RNGs are seeded from the
+    instance `name` (default: tank_id), so a tank evolves identically no
+    matter which worker process runs it or which tanks share that worker.
+    `fish` overrides the tank's debug_spawn count (raising max_fish to fit).
+    """
+    resources = ResourceStore()
+    configs = registry if registry is not None else get_config_registry()
+    resources.set("config_registry", configs)
+    resources.set("settings", configs.get("settings"))
+    resources.register("events", EventBus())
+
+    instance = name or tank_id
+    rng_root = random.Random(f"{RNG_ROOT_SEED}:{instance}")
+    resources.set("rng_root", rng_root)
+    resources.set("rng_ai", random.Random(rng_root.randint(0, RNG_MAX_INT)))
+    resources.set("rng_spawns", random.Random(rng_root.randint(0, RNG_MAX_INT)))
+
+    _set_simulation_configs(resources, configs)
+    tanks_map = resources.get("tank_config").get("tanks") or {}
+    if tank_id not in tanks_map:
+        raise ValueError(f"tanks.json has no tank {tank_id!r}.")
+    tank_def = tanks_map[tank_id]
+    if fish is not None:
+        spawn = dict(tank_def.get("debug_spawn", {}), count=int(fish))
+        max_fish = max(int(tank_def.get("max_fish", 0)), int(fish))
+        tank_def = dict(tank_def, debug_spawn=spawn, max_fish=max_fish)
+
+    world = World()
+    scheduler = Scheduler()
+    # Same logic order as build_engine: FSM, falling, then movement.
+    scheduler.add_system(FishFSMSystem(resources), phase="logic")
+    scheduler.add_system(FallingSystem(resources), phase="logic")
+    scheduler.add_system(MovementSystem(resources), phase="logic")
+
+    tank_eid = _create_configured_tank(world, tank_id, tank_def)
+    _populate_debug_fish(world, resources.get("species_config"), tank_eid, tank_def, resources.get("rng_spawns"))
+    return Engine(world=world, scheduler=scheduler, resources=resources)
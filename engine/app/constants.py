@@ -21,6 +21,8 @@ FPS: int = 60
 # ----------------------------------------------------------------------
 RNG_ROOT_SEED: int = 42
 RNG_MAX_INT: int = 2**31 - 1
+# Resources holding random.Random streams; their states are saved with snapshots.
+RNG_RESOURCES: Tuple[str, ...] = ("rng_root", "rng_ai", "rng_spawns")
 
 # ----------------------------------------------------------------------
 # Window / screen defaults
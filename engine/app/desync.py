@@ -0,0 +1,143 @@
+# engine/app/desync.py
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import itertools
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Sequence, Tuple, Type
+
+from engine.ecs.state_hash import Difference, StateHasher, first_difference
+from engine.events import EventBus
+from engine.game.components import Brain, Position, Velocity
+
+if TYPE_CHECKING:
+    from engine.app.boot import Engine
+
+# Stores that define "the simulation" for desync purposes. Render-side
+# components (sprites, labels, UI) are deliberately left out.
+HASHED_COMPONENTS: Tuple[Type[Any], ...] = (Position, Velocity, Brain)
+
+DEFAULT_DT = 1 / 60
+
+
+@dataclasses.dataclass
+class CompareResult:
+    ticks: int              # updates run on each engine
+    checks: int             # hash comparisons made
+    divergent_tick: Optional[int] = None
+    difference: Optional[Difference] = None
+    update_seconds: Tuple[float, float] = (0.0, 0.0)
+    hash_seconds: float = 0.0
+
+    @property
+    def diverged(self) -> bool:
+        return self.divergent_tick is not None
+
+
+def compare_engines(
+    a: Engine,
+    b: Engine,
+    frames: Iterable[Tuple[Sequence[Any], float]],
+    every: int = 1,
+    component_types: Sequence[Type[Any]] = HASHED_COMPONENTS,
+    incremental: bool = True,
+) -> CompareResult:
+    """
+    Step two engines in lockstep and compare state hashes every `every` ticks.
+
+    `frames` yields (events, dt); both engines get the same events before
+    each update. Stops at the first hash mismatch and locates it with
+    first_difference(), so the report names the tick and the entity.
+    A divergence between checks is reported at the next check.
+    """
+    every = max(1, int(every))
+    hashers = (StateHasher(component_types, incremental), StateHasher(component_types, incremental))
+    buses: Tuple[EventBus, EventBus] = (a.resources.get("events"), b.resources.get("events"))
+    result = CompareResult(ticks=0, checks=0)
+    spent = [0.0, 0.0]
+
+    for events, dt in frames:
+        for i, (engine, bus) in enumerate(zip((a, b), buses)):
+            for event in events:
+                bus.publish(event)
+            start = time.perf_counter()
+            engine.update(dt)
+            spent[i] += time.perf_counter() - start
+        result.ticks += 1
+        if result.ticks % every:
+            continue
+        start = time.perf_counter()
+        digest_a = hashers[0].digest(a.world)
+        digest_b = hashers[1].digest(b.world)
+        result.hash_seconds += time.perf_counter() - start
+        result.checks += 1
+        if digest_a != digest_b:
+            result.divergent_tick = result.ticks
+            result.difference = first_difference(a.world, b.world, component_types)
+            break
+
+    result.update_seconds = (spent[0], spent[1])
+    return result
+
+
+def _fixed_frames(ticks: int, dt: float) -> Iterable[Tuple[List[Any], float]]:
+    return itertools.repeat(([], dt), ticks)
+
+
+def main(argv=None) -> int:
+    from engine.app.boot import build_engine
+    from engine.app.replay import apply_session_header, read_session, session_frames
+    from engine.game.data.registry import ConfigRegistry
+
+    parser = argparse.ArgumentParser(
+        description="Run two engine configurations in lockstep and report the first state divergence."
+    )
+    parser.add_argument("--data-a", type=Path, default=None, help="data directory for engine A (default: shipped data)")
+    parser.add_argument("--data-b", type=Path, default=None, help="data directory for engine B (default: shipped data)")
+    parser.add_argument("--session", type=Path, default=None, help="drive both engines with a recorded session")
+    parser.add_argument("--ticks", type=int, default=600, help="ticks to run without a session (or the cap with one)")
+    parser.add_argument("--every", type=int, default=10, help="compare hashes every N ticks")
+    parser.add_argument("--full", action="store_true", help="rehash every store at every check")
+    args = parser.parse_args(argv)
+
+    def _engine(data_dir: Optional[Path]) -> Engine:
+        if data_dir is None:
+            return build_engine(ConfigRegistry(cache_dir=None))
+        return build_engine(ConfigRegistry(data_dir=data_dir, cache_dir=None))
+
+    a, b = _engine(args.data_a), _engine(args.data_b)
+    try:
+        if args.session is not None:
+            records = read_session(args.session)
+            header = next(records, {})
+            apply_session_header(a, header)
+            apply_session_header(b, header)
+            frames = itertools.islice(session_frames(records), args.ticks)
+        else:
+            frames = _fixed_frames(args.ticks, DEFAULT_DT)
+        result = compare_engines(a, b, frames, every=args.every, incremental=not args.full)
+    finally:
+        a.shutdown()
+        b.shutdown()
+
+    def ms(seconds: float, n: int) -> float:
+        return 1000.0 * seconds / max(1, n)
+
+    print(
+        f"{result.ticks} ticks, {result.checks} checks: "
+        f"update A {ms(result.update_seconds[0], result.ticks):.3f} ms/tick, "
+        f"update B {ms(result.update_seconds[1], result.ticks):.3f} ms/tick, "
+        f"hash {ms(result.hash_seconds, 2 * result.checks):.3f} ms/world"
+    )
+    if not result.diverged:
+        print("no divergence")
+        return 0
+    print(f"first divergence at tick {result.divergent_tick}: {result.difference}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
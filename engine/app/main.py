@@ -1,17 +1,23 @@
 # engine/app/main.py
 from __future__ import annotations
 
+import argparse
+
 from engine.app.boot import build_engine
+from engine.app.replay import SessionRecorder
 from engine.adapters.pygame_render.app import PygameApp
-from engine.game.data.configs import load_settings_config
 from engine.app.constants import DEFAULT_WINDOW_SIZE, DEFAULT_WINDOW_TITLE
 
 
-def main() -> None:
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Run FishSim3.")
+    parser.add_argument("--record", metavar="PATH", help="record input to a session file for engine.app.replay")
+    args = parser.parse_args(argv)
+
     engine = build_engine()
 
-    # Window settings are user-tweakable in settings.json
-    settings = load_settings_config()
+    # Window settings are user-tweakable in settings.json (already loaded by boot)
+    settings = engine.resources.get("settings")
     window_cfg = settings.get("window", {})
 
     default_w, default_h = DEFAULT_WINDOW_SIZE
@@ -20,6 +26,9 @@ def main() -> None:
     title = window_cfg.get("title", DEFAULT_WINDOW_TITLE)
 
     app = PygameApp(engine, width=width, height=height, title=title)
+    if args.record:
+        # After the window exists so the header records the real screen size.
+        engine.scheduler.add_system(SessionRecorder(engine.resources, args.record), phase="pre_update")
     app.run()
 
 
@@ -0,0 +1,164 @@
+# engine/app/replay.py
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import time
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from engine.ecs import System, World
+from engine.events import EventBus
+from engine.resources import ResourceStore
+from engine.app.constants import RNG_ROOT_SEED
+from engine.game.events.input_events import ClickWorld, KeyEvent, PointerMove, Scroll
+
+SESSION_VERSION = 1
+
+# Domain input events a session captures; everything else is derived from them.
+RECORDED_EVENTS: Dict[str, Type[Any]] = {
+    cls.__name__: cls for cls in (ClickWorld, KeyEvent, PointerMove, Scroll)
+}
+
+
+class SessionRecorder(System):
+    """
+    Writes a replayable session log (JSON lines).
+
+    Input events are logged as they are published on the EventBus (the
+    adapter publishes them between frames); the system itself runs in
+    pre_update and logs each frame's dt. File order is therefore exactly
+    "events, then the update they fed into", which is all the replayer
+    needs. Events carry logical coordinates, so a session replays the same
+    at any window size.
+    """
+
+    phase = "pre_update"
+
+    def __init__(self, resources: ResourceStore, path: str | Path) -> None:
+        super().__init__(resources)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._out: Optional[IO[str]] = self.path.open("w", encoding="utf-8")
+        self.frame = 0
+        self._write({
+            "kind": "header",
+            "version": SESSION_VERSION,
+            "rng_seed": RNG_ROOT_SEED,
+            "screen_size": list(resources.try_get("screen_size") or ()),
+        })
+        bus: EventBus = resources.get("events")
+        for event_type in RECORDED_EVENTS.values():
+            bus.subscribe(event_type, self._on_event)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        if self._out is not None:
+            self._out.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def _on_event(self, event: Any) -> None:
+        self._write({
+            "kind": "event",
+            "frame": self.frame,
+            "type": type(event).__name__,
+            "data": dataclasses.asdict(event),
+        })
+
+    def update(self, world: World, dt: float) -> None:
+        self._write({"kind": "frame", "frame": self.frame, "dt": dt})
+        self.frame += 1
+
+    def close(self) -> None:
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+
+
+# ----------------------------------------------------------------------
+# Replay
+# ----------------------------------------------------------------------
+def read_session(path: str | Path) -> Iterator[Dict[str, Any]]:
+    with Path(path).open("r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+@dataclasses.dataclass
+class ReplayResult:
+    frames: int
+    events: int
+    seconds: float
+
+
+def apply_session_header(engine, header: Dict[str, Any]) -> None:
+    """Check a session header against this build and apply its screen size."""
+    if header.get("kind") != "header":
+        raise ValueError("session does not start with a header record")
+    if header.get("version") != SESSION_VERSION:
+        raise ValueError(f"unsupported session version {header.get('version')!r}")
+    if header.get("rng_seed") != RNG_ROOT_SEED:
+        raise ValueError("session was recorded with a different RNG_ROOT_SEED")
+    if header.get("screen_size"):
+        engine.resources.set("screen_size", tuple(header["screen_size"]))
+
+
+def session_frames(records: Iterable[Dict[str, Any]]) -> Iterator[Tuple[List[Any], float]]:
+    """Group session records (after the header) into (events, dt) per frame."""
+    events: List[Any] = []
+    for record in records:
+        kind = record.get("kind")
+        if kind == "event":
+            events.append(RECORDED_EVENTS[record["type"]](**record["data"]))
+        elif kind == "frame":
+            yield events, float(record["dt"])
+            events = []
+
+
+def replay_session(engine, path: str | Path, max_frames: Optional[int] = None, on_frame=None) -> ReplayResult:
+    """
+    Feed a recorded session into `engine` as fast as possible (no rendering).
+
+    `engine` must be freshly built with the same data files as the
+    recording. on_frame(frame_index, engine) is called after each update.
+    """
+    bus: EventBus = engine.resources.get("events")
+    frames = events = 0
+    start = time.perf_counter()
+    records = read_session(path)
+    apply_session_header(engine, next(records, {}))
+    for frame_events, dt in session_frames(records):
+        if max_frames is not None and frames >= max_frames:
+            break
+        for event in frame_events:
+            bus.publish(event)
+        events += len(frame_events)
+        engine.update(dt)
+        if on_frame is not None:
+            on_frame(frames, engine)
+        frames += 1
+    return ReplayResult(frames=frames, events=events, seconds=time.perf_counter() - start)
+
+
+def main(argv=None) -> None:
+    from engine.app.boot import build_engine
+
+    parser = argparse.ArgumentParser(description="Replay a recorded session headlessly.")
+    parser.add_argument("session", help="session .jsonl written with main --record")
+    parser.add_argument("--frames", type=int, default=None, help="stop after this many frames")
+    args = parser.parse_args(argv)
+
+    engine = build_engine()
+    try:
+        result = replay_session(engine, args.session, max_frames=args.frames)
+    finally:
+        engine.shutdown()
+    rate = result.frames / result.seconds if result.seconds > 0 else float("inf")
+    print(
+        f"replayed {result.frames} frames ({result.events} events) "
+        f"in {result.seconds:.3f}s ({rate:.0f} frames/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# engine/app/savegame.py
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Tuple
+
+from engine.ecs import dump_world, load_world
+from engine.resources import ResourceStore
+from engine.scheduling import Scheduler
+from engine.app.constants import RNG_RESOURCES
+
+if TYPE_CHECKING:
+    from engine.app.boot import Engine
+
+SAVE_FORMAT = 3
+
+
+def _keyed_systems(scheduler: Scheduler) -> Iterator[Tuple[Tuple[str, int], Any]]:
+    """
+    Yield ((class name, occurrence), system). Keys survive systems being
+    added or reordered, e.g. an optional AutosaveSystem in one engine only.
+    """
+    seen: Dict[str, int] = {}
+    for system in scheduler.systems():
+        name = type(system).__qualname__
+        nth = seen.get(name, 0)
+        seen[name] = nth + 1
+        yield (name, nth), system
+
+
+def collect_extras(resources: ResourceStore, scheduler: Scheduler) -> Dict[str, Any]:
+    """
+    State that lives outside the world but is needed to continue
+    deterministically: RNG stream states and each system's snapshot_state().
+    """
+    rng_states: Dict[str, Any] = {}
+    for key in RNG_RESOURCES:
+        rng = resources.try_get(key)
+        if rng is not None:
+            rng_states[key] = rng.getstate()
+
+    systems: List[Tuple[Tuple[str, int], Any]] = []
+    for key, system in _keyed_systems(scheduler):
+        state = system.snapshot_state()
+        if state is not None:
+            systems.append((key, state))
+
+    return {"format": SAVE_FORMAT, "rng": rng_states, "systems": systems}
+
+
+def restore_extras(resources: ResourceStore, scheduler: Scheduler, extras: Dict[str, Any]) -> None:
+    """
+    Inverse of collect_extras(). The scheduler must come from the same
+    build_engine() wiring that saved it; RNG objects are restored in place
+    because systems hold references to them.
+    """
+    extras = extras or {}
+    if extras.get("format") != SAVE_FORMAT:
+        raise ValueError(f"unsupported save format {extras.get('format')!r}")
+
+    for key, state in extras.get("rng", {}).items():
+        rng = resources.try_get(key)
+        if rng is not None:
+            rng.setstate(state)
+
+    saved = dict(extras.get("systems", []))
+    for key, system in _keyed_systems(scheduler):
+        state = saved.get(key)
+        if state is not None:
+            system.restore_state(state)
+
+
+def snapshot_engine(engine: Engine, codec: str = "zlib") -> bytes:
+    """Serialize the world plus RNG and system state (see collect_extras)."""
+    extras = collect_extras(engine.resources, engine.scheduler)
+    return dump_world(engine.world, extras=extras, codec=codec)
+
+
+def restore_engine(engine: Engine, data: bytes) -> None:
+    """Replace engine.world with the snapshot and rewind RNGs/system state."""
+    world, extras = load_world(data, tick_floor=engine.world.change_tick)
+    restore_extras(engine.resources, engine.scheduler, extras)
+    engine.world = world
+
+
+def write_atomic(path: str | Path, data: bytes) -> None:
+    """Write via a temp file + rename so readers never see a partial save."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def save_game(engine: Engine, path: str | Path, codec: str = "zlib") -> None:
+    write_atomic(path, snapshot_engine(engine, codec=codec))
+
+
+def load_game(engine: Engine, path: str | Path) -> None:
+    restore_engine(engine, Path(path).read_bytes())
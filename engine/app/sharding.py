@@ -0,0 +1,319 @@
+# engine/app/sharding.py
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import operator
+import time
+import traceback
+from array import array
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from engine.ecs.shared_columns import SharedColumns, SharedColumnsReader
+from engine.ecs.state_hash import StateHasher
+from engine.game.components import Brain, Position, RectSprite, SpriteRef, Velocity
+from engine.game.data.registry import DATA_DIR, ConfigRegistry
+
+# Per-worker render columns, published through SharedColumns after each
+# step and copied out by the main process once per frame.
+_COLUMNS: Tuple[Tuple[str, str], ...] = (("eid", "q"), ("slot", "q"), ("x", "d"), ("y", "d"), ("facing", "B"))
+DEFAULT_CAPACITY = 1024
+_get_x = operator.attrgetter("x")
+_get_y = operator.attrgetter("y")
+
+
+@dataclass(frozen=True)
+class TankSpec:
+    """One simulated tank: unique instance `name`, its tanks.json entry, optional fish count."""
+    name: str
+    tank_id: str
+    fish: Optional[int] = None
+
+
+def tank_specs(tank_ids: Sequence[str], fish: Optional[int] = None) -> List[TankSpec]:
+    """Specs for a list of tank ids; repeats get unique names ("tank_1", "tank_1#2", ...)."""
+    seen: Dict[str, int] = {}
+    specs = []
+    for tank_id in tank_ids:
+        n = seen[tank_id] = seen.get(tank_id, 0) + 1
+        specs.append(TankSpec(name=tank_id if n == 1 else f"{tank_id}#{n}", tank_id=tank_id, fish=fish))
+    return specs
+
+
+@dataclass
+class RenderFrame:
+    """Render state of one worker's tanks for the current frame (copied out of shared memory)."""
+    tanks: Tuple[str, ...]
+    frame: int
+    eids: array
+    slots: array
+    xs: array
+    ys: array
+    facing: array
+
+    def __len__(self) -> int:
+        return len(self.eids)
+
+    def rows(self) -> Iterator[Tuple[str, int, float, float, bool]]:
+        """(tank name, eid, x, y, facing_left); eids are per-tank."""
+        tanks = self.tanks
+        for eid, slot, x, y, facing in zip(self.eids, self.slots, self.xs, self.ys, self.facing):
+            yield tanks[slot], eid, x, y, bool(facing)
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+def _render_columns(engines) -> Dict[str, array]:
+    columns: Dict[str, array] = {name: array(code) for name, code in _COLUMNS}
+    for slot, engine in enumerate(engines):
+        world = engine.world
+        positions = world.get_components(Position)
+        rects = world.get_components(RectSprite)
+        sprites = world.get_components(SpriteRef)
+        eids = [eid for eid in positions if eid in rects]
+        comps = [positions[eid] for eid in eids]
+        columns["eid"].extend(eids)
+        columns["slot"].extend([slot] * len(eids))
+        columns["x"].extend(map(_get_x, comps))
+        columns["y"].extend(map(_get_y, comps))
+        columns["facing"].extend([1 if getattr(sprites.get(eid), "facing_left", False) else 0 for eid in eids])
+    return columns
+
+
+def _publish(writer: SharedColumns, engines, frame: int) -> SharedColumns:
+    columns = _render_columns(engines)
+    count = len(columns["eid"])
+    if count > writer.capacity:
+        # Grow: the reply carries the new block name and main reattaches.
+        writer.close()
+        writer = SharedColumns(_COLUMNS, max(count, 2 * writer.capacity))
+    writer.publish(columns, frame=frame)
+    return writer
+
+
+def _worker_main(conn: Connection, data_dir: str, specs: Sequence[TankSpec], capacity: int) -> None:
+    from engine.app.boot import build_tank_engine
+
+    writer: Optional[SharedColumns] = None
+    try:
+        registry = ConfigRegistry(data_dir=Path(data_dir), cache_dir=None)
+        engines = [build_tank_engine(s.tank_id, registry, name=s.name, fish=s.fish) for s in specs]
+        hasher_types = (Position, Velocity, Brain)
+        frame = 0
+        writer = _publish(SharedColumns(_COLUMNS, capacity), engines, frame)
+        conn.send(("frame", writer.name))
+        while True:
+            msg = conn.recv()
+            if msg[0] == "step":
+                dt = msg[1]
+                for engine in engines:
+                    engine.update(dt)
+                frame += 1
+                writer = _publish(writer, engines, frame)
+                conn.send(("frame", writer.name))
+            elif msg[0] == "digest":
+                conn.send(("digest", [StateHasher(hasher_types, incremental=False).digest(e.world) for e in engines]))
+            else:  # "stop"
+                break
+    except BaseException:
+        conn.send(("error", traceback.format_exc()))
+    finally:
+        if writer is not None:
+            writer.close()
+        conn.close()
+
+
+# ----------------------------------------------------------------------
+# Main process
+# ----------------------------------------------------------------------
+class ShardWorkerError(RuntimeError):
+    """A shard worker raised; the message carries its traceback."""
+
+
+class _Shard:
+    def __init__(self, ctx, specs: Sequence[TankSpec], data_dir: Path, capacity: int) -> None:
+        self.specs = tuple(specs)
+        self.tanks = tuple(s.name for s in specs)
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child, str(data_dir), self.specs, capacity),
+            name=f"shard-{'+'.join(self.tanks)}",
+            daemon=True,
+        )
+        self.process.start()
+        child.close()
+        self.reader: Optional[SharedColumnsReader] = None
+        self.frame: Optional[RenderFrame] = None
+
+    def reply(self):
+        try:
+            msg = self.conn.recv()
+        except EOFError:
+            raise ShardWorkerError(f"shard worker {self.process.name} exited") from None
+        if msg[0] == "error":
+            raise ShardWorkerError(f"shard worker {self.process.name} failed:\n{msg[1]}")
+        return msg
+
+    def read_frame(self, name: str) -> None:
+        if self.reader is None or self.reader.shm.name != name:
+            if self.reader is not None:
+                self.reader.close()
+            self.reader = SharedColumnsReader(name)
+        frame, columns = self.reader.read()
+        self.frame = RenderFrame(
+            tanks=self.tanks, frame=frame, eids=columns["eid"], slots=columns["slot"],
+            xs=columns["x"], ys=columns["y"], facing=columns["facing"],
+        )
+
+    def close(self) -> None:
+        if self.process.is_alive():
+            try:
+                self.conn.send(("stop",))
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.join(timeout=5.0)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+
+
+def assign_shards(specs: Sequence[TankSpec], workers: int, registry: ConfigRegistry) -> List[List[TankSpec]]:
+    """Greedy largest-first packing of tanks onto workers by fish count."""
+    tanks_map = registry.get("tanks").get("tanks") or {}
+
+    def weight(spec: TankSpec) -> int:
+        if spec.fish is not None:
+            return spec.fish
+        return int(tanks_map.get(spec.tank_id, {}).get("debug_spawn", {}).get("count", 8))
+
+    groups: List[List[TankSpec]] = [[] for _ in range(max(1, min(workers, len(specs))))]
+    loads = [0] * len(groups)
+    for spec in sorted(specs, key=weight, reverse=True):
+        i = loads.index(min(loads))
+        groups[i].append(spec)
+        loads[i] += weight(spec)
+    return groups
+
+
+class ShardedEngine:
+    """
+    Simulates independent tanks in worker processes.
+
+    Each tank is its own headless engine (build_tank_engine); tanks are
+    packed onto `workers` processes. update(dt) steps every worker in
+    parallel and returns once all have published their render state to
+    shared memory, which is then copied out (no pickling) into frames().
+    Input, UI and rendering stay in the main process.
+    """
+
+    def __init__(
+        self,
+        tanks: Sequence[TankSpec],
+        workers: Optional[int] = None,
+        data_dir: Path = DATA_DIR,
+        capacity: int = DEFAULT_CAPACITY,
+        start_method: Optional[str] = None,
+    ) -> None:
+        if not tanks:
+            raise ValueError("ShardedEngine needs at least one tank")
+        if len({t.name for t in tanks}) != len(tanks):
+            raise ValueError("tank names must be unique")
+        registry = ConfigRegistry(data_dir=data_dir, cache_dir=None)
+        workers = workers or mp.cpu_count()
+        ctx = mp.get_context(start_method)
+        self.frame = 0
+        self._shards: List[_Shard] = []
+        try:
+            for group in assign_shards(tanks, workers, registry):
+                self._shards.append(_Shard(ctx, group, data_dir, capacity))
+            self._collect()
+        except BaseException:
+            self.shutdown()
+            raise
+
+    def _collect(self) -> None:
+        for shard in self._shards:
+            _, name = shard.reply()
+            shard.read_frame(name)
+
+    def update(self, dt: float) -> None:
+        for shard in self._shards:
+            shard.conn.send(("step", dt))
+        self._collect()
+        self.frame += 1
+
+    def frames(self) -> List[RenderFrame]:
+        """This frame's render state, one RenderFrame per worker."""
+        return [shard.frame for shard in self._shards if shard.frame is not None]
+
+    def digests(self) -> Dict[str, int]:
+        """Full state hash (Position, Velocity, Brain) per tank name."""
+        for shard in self._shards:
+            shard.conn.send(("digest",))
+        out: Dict[str, int] = {}
+        for shard in self._shards:
+            _, values = shard.reply()
+            out.update(zip(shard.tanks, values))
+        return out
+
+    def shutdown(self) -> None:
+        for shard in self._shards:
+            shard.close()
+        self._shards = []
+
+    def __enter__(self) -> "ShardedEngine":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+
+# ----------------------------------------------------------------------
+# Benchmark
+# ----------------------------------------------------------------------
+def main(argv=None) -> None:
+    from engine.app.boot import build_tank_engine
+
+    parser = argparse.ArgumentParser(description="Compare sharded vs in-process multi-tank simulation.")
+    parser.add_argument("--tank", default="tank_1", help="tanks.json entry to replicate")
+    parser.add_argument("--tanks", type=int, default=8, help="number of tank instances")
+    parser.add_argument("--fish", type=int, default=500, help="fish per tank")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args(argv)
+
+    specs = tank_specs([args.tank] * args.tanks, fish=args.fish)
+    dt = 1 / 60
+
+    registry = ConfigRegistry(cache_dir=None)
+    engines = [build_tank_engine(s.tank_id, registry, name=s.name, fish=s.fish) for s in specs]
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        for engine in engines:
+            engine.update(dt)
+    serial = time.perf_counter() - start
+
+    with ShardedEngine(specs, workers=args.workers) as sharded:
+        start = time.perf_counter()
+        for _ in range(args.frames):
+            sharded.update(dt)
+        parallel = time.perf_counter() - start
+        rows = sum(len(f) for f in sharded.frames())
+        workers = len(sharded.frames())
+
+    print(f"{args.tanks} tanks x {args.fish} fish, {args.frames} frames")
+    print(f"in-process: {1000 * serial / args.frames:.2f} ms/frame")
+    print(f"sharded ({workers} workers): {1000 * parallel / args.frames:.2f} ms/frame, {rows} render rows/frame")
+
+
+if __name__ == "__main__":
+    main()
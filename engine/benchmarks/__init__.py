@@ -0,0 +1,11 @@
+# engine/benchmarks/__init__.py
+from .simulation import (
+    DEFAULT_SIZES,
+    Regression,
+    Scenario,
+    compare_results,
+    run_scenario,
+    run_suite,
+)
+
+__all__ = ["DEFAULT_SIZES", "Regression", "Scenario", "compare_results", "run_scenario", "run_suite"]
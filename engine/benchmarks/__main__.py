@@ -0,0 +1,71 @@
+# engine/benchmarks/__main__.py
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from engine.benchmarks.simulation import DEFAULT_SIZES, compare_results, run_suite
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+REPORTED = ("frame", "FishFSMSystem", "MovementSystem", "FallingSystem", "flush_commands")
+
+
+def _print_scenario(scenario, result) -> None:
+    timings = result["timings"]
+    cells = "  ".join(f"{key} {timings[key]['median_ms']:.2f}" for key in REPORTED if key in timings)
+    if "autosave_max_share" in result:
+        cells += f"  autosave max {timings['AutosaveSystem']['max_ms']:.2f} ({result['autosave_max_share']:.0%} of frame)"
+    print(f"{scenario.name:<28} {result['entities']:>6} entities  {cells}  (median ms)", flush=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m engine.benchmarks",
+        description="Headless simulation benchmarks with per-system timings.",
+    )
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma-separated fish counts")
+    parser.add_argument("--pellets", choices=("both", "on", "off"), default="both")
+    parser.add_argument(
+        "--autosave", choices=("both", "on", "off"), default="off",
+        help="also run with an AutosaveSystem checkpointing every frame",
+    )
+    parser.add_argument("--frames", type=int, default=60, help="timed frames per scenario")
+    parser.add_argument("--warmup", type=int, default=10, help="untimed frames per scenario")
+    parser.add_argument("--out", type=Path, default=None, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline results to compare against")
+    parser.add_argument("--no-compare", action="store_true", help="skip the baseline comparison")
+    parser.add_argument("--save-baseline", action="store_true", help="overwrite --baseline with these results")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    pellets = {"both": (False, True), "on": (True,), "off": (False,)}[args.pellets]
+    autosave = {"both": (False, True), "on": (True,), "off": (False,)}[args.autosave]
+    results = run_suite(
+        sizes, pellets, frames=args.frames, warmup=args.warmup, progress=_print_scenario, autosave=autosave
+    )
+
+    if args.out is not None:
+        args.out.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if args.no_compare or not args.baseline.exists():
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare_results(results, baseline, tolerance=args.tolerance)
+    if not regressions:
+        print(f"no regressions vs {args.baseline} (tolerance {args.tolerance:.0%})")
+        return 0
+    print(f"{len(regressions)} regression(s) vs {args.baseline}:")
+    for regression in regressions:
+        print(f"  {regression}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
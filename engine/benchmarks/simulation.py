@@ -0,0 +1,236 @@
+# engine/benchmarks/simulation.py
+from __future__ import annotations
+
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from engine.app.autosave import AutosaveSystem
+from engine.app.boot import Engine, build_tank_engine
+from engine.game.components import Brain, Fish, MovementIntent, Position, RectSprite, Tank, TankBounds, Velocity
+from engine.game.data.registry import ConfigRegistry
+from engine.game.factories.pellet_factory import create_pellets_cmd
+from engine.scheduling import UPDATE_PHASES
+
+RESULTS_VERSION = 1
+DEFAULT_SIZES: Tuple[int, ...] = (100, 1_000, 10_000, 50_000)
+BENCH_TANK = "tank_1"
+DT = 1 / 60
+
+# Views the hot systems iterate every frame, timed on their own.
+VIEWS: Tuple[Tuple[Type[Any], ...], ...] = (
+    (Fish, Brain, MovementIntent),
+    (Position, Velocity, RectSprite),
+)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    fish: int
+    pellets: bool
+    frames: int = 60
+    warmup: int = 10
+    # With pellets: a batch of fish // 50 (at least 1) is dropped every
+    # `pellet_every` frames, so flush_commands and FallingSystem have work.
+    pellet_every: int = 10
+    # With autosave: an AutosaveSystem checkpoints back to back (interval
+    # 0), so its frame-thread share is timed as "AutosaveSystem".
+    autosave: bool = False
+
+    @property
+    def name(self) -> str:
+        name = f"fish={self.fish},pellets={'on' if self.pellets else 'off'}"
+        return name + ",autosave=on" if self.autosave else name
+
+
+def build_scenario_engine(scenario: Scenario, registry: Optional[ConfigRegistry] = None) -> Engine:
+    """Headless single-tank engine (simulation systems only) with scenario.fish fish."""
+    return build_tank_engine(BENCH_TANK, registry or ConfigRegistry(cache_dir=None), name="bench", fish=scenario.fish)
+
+
+def _drop_pellets(engine: Engine, count: int, rng: random.Random) -> None:
+    world = engine.world
+    tank_eid = next(iter(world.get_components(Tank)))
+    b = world.get_components(TankBounds)[tank_eid]
+    positions = [(rng.uniform(b.x + 10.0, b.x + b.width - 10.0), b.y + 5.0) for _ in range(count)]
+    world.queue_command(create_pellets_cmd(positions, tank_eid, engine.resources.try_get("pellet_config"), rng))
+
+
+def _view_key(types: Sequence[Type[Any]]) -> str:
+    return "view(" + ",".join(t.__name__ for t in types) + ")"
+
+
+def _step_timed(engine: Engine, dt: float, samples: Dict[str, List[float]]) -> None:
+    """Scheduler.update(), timing each phase, system and the command flush."""
+    world = engine.world
+    clock = time.perf_counter
+    frame_start = clock()
+    for phase in UPDATE_PHASES:
+        phase_start = clock()
+        for system in engine.scheduler.systems_in(phase):
+            start = clock()
+            system.update(world, dt)
+            samples[type(system).__name__].append(clock() - start)
+        if phase == "post_update":
+            start = clock()
+            world.flush_commands()
+            samples["flush_commands"].append(clock() - start)
+        samples[f"phase:{phase}"].append(clock() - phase_start)
+    samples["frame"].append(clock() - frame_start)
+
+
+def _time_views(engine: Engine, samples: Dict[str, List[float]]) -> None:
+    world = engine.world
+    for types in VIEWS:
+        start = time.perf_counter()
+        for _ in world.view(*types):
+            pass
+        samples[_view_key(types)].append(time.perf_counter() - start)
+
+
+def run_scenario(scenario: Scenario, registry: Optional[ConfigRegistry] = None) -> Dict[str, Any]:
+    """
+    Build, warm up and time one scenario. Returns
+    {"fish", "pellets", "entities", "timings": {key: {"mean_ms", "median_ms", "max_ms"}}}
+    where keys are system class names, "flush_commands", "phase:<name>",
+    "frame" and "view(<types>)". Autosave scenarios also report
+    "autosave_max_share": the slowest AutosaveSystem step over the median
+    frame.
+    """
+    with tempfile.TemporaryDirectory(prefix="bench-autosave-") as save_dir:
+        start = time.perf_counter()
+        engine = build_scenario_engine(scenario, registry)
+        if scenario.autosave:
+            engine.scheduler.add_system(
+                AutosaveSystem(engine.resources, engine.scheduler, save_dir, interval=0.0), phase="pre_update"
+            )
+        build_ms = 1000.0 * (time.perf_counter() - start)
+        try:
+            samples = _run_frames(engine, scenario)
+        finally:
+            engine.shutdown()
+
+    timings = {
+        key: {
+            "mean_ms": 1000.0 * statistics.fmean(values),
+            "median_ms": 1000.0 * statistics.median(values),
+            "max_ms": 1000.0 * max(values),
+        }
+        for key, values in sorted(samples.items())
+    }
+    result = {
+        "fish": scenario.fish,
+        "pellets": scenario.pellets,
+        "entities": len(engine.world.get_components(Position)),
+        "build_ms": build_ms,
+        "timings": timings,
+    }
+    if scenario.autosave:
+        result["autosave"] = True
+        result["autosave_max_share"] = timings["AutosaveSystem"]["max_ms"] / timings["frame"]["median_ms"]
+    return result
+
+
+def _run_frames(engine: Engine, scenario: Scenario) -> Dict[str, List[float]]:
+    rng = random.Random(1234)
+    batch = max(1, scenario.fish // 50)
+    samples: Dict[str, List[float]] = defaultdict(list)
+    for frame in range(scenario.warmup + scenario.frames):
+        if scenario.pellets and frame % scenario.pellet_every == 0:
+            _drop_pellets(engine, batch, rng)
+        if frame < scenario.warmup:
+            engine.update(DT)
+            continue
+        _step_timed(engine, DT, samples)
+        _time_views(engine, samples)
+    return samples
+
+
+def run_suite(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    pellets: Sequence[bool] = (False, True),
+    frames: int = 60,
+    warmup: int = 10,
+    progress=None,
+    autosave: Sequence[bool] = (False,),
+) -> Dict[str, Any]:
+    """Run every (size, pellets, autosave) scenario; the result is JSON-serializable."""
+    registry = ConfigRegistry(cache_dir=None)
+    scenarios: Dict[str, Any] = {}
+    for fish in sizes:
+        for with_pellets in pellets:
+            for with_autosave in autosave:
+                scenario = Scenario(
+                    fish=int(fish), pellets=with_pellets, frames=frames, warmup=warmup, autosave=with_autosave
+                )
+                scenarios[scenario.name] = run_scenario(scenario, registry)
+                if progress is not None:
+                    progress(scenario, scenarios[scenario.name])
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "frames": frames,
+            "warmup": warmup,
+        },
+        "scenarios": scenarios,
+    }
+
+
+# ----------------------------------------------------------------------
+# Baseline comparison
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class Regression:
+    scenario: str
+    key: str
+    baseline_ms: float
+    current_ms: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ms / self.baseline_ms if self.baseline_ms > 0 else float("inf")
+
+    def __str__(self) -> str:
+        return (
+            f"{self.scenario} {self.key}: {self.baseline_ms:.3f} -> {self.current_ms:.3f} ms "
+            f"({100.0 * (self.ratio - 1.0):+.0f}%)"
+        )
+
+
+def compare_results(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = 0.25,
+    min_delta_ms: float = 0.05,
+    metric: str = "median_ms",
+) -> List[Regression]:
+    """
+    Timings in `current` slower than `baseline` by more than `tolerance`
+    (relative) and `min_delta_ms` (absolute, filters timer noise on tiny
+    systems). Scenarios or keys missing from either side are skipped.
+    """
+    if baseline.get("version") != current.get("version"):
+        raise ValueError("benchmark results have different versions")
+    out: List[Regression] = []
+    for name, scenario in current.get("scenarios", {}).items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        for key, stats in scenario["timings"].items():
+            base_stats = base["timings"].get(key)
+            if base_stats is None:
+                continue
+            old, new = base_stats[metric], stats[metric]
+            if new > old * (1.0 + tolerance) and new - old > min_delta_ms:
+                out.append(Regression(name, key, old, new))
+    return out
@@ -2,5 +2,10 @@
 from .world import World, EntityId
 from .system import System
 from .view import View
+from .relations import RelationIndex, parent_link
+from .snapshot import SnapshotError, dump_world, load_world, save_snapshot, load_snapshot
 
-__all__ = ["World", "EntityId", "System", "View"]
+__all__ = [
+    "World", "EntityId", "System", "View", "RelationIndex", "parent_link",
+    "SnapshotError", "dump_world", "load_world", "save_snapshot", "load_snapshot",
+]
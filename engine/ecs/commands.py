@@ -1,6 +1,6 @@
 # engine/ecs/commands.py
 from dataclasses import dataclass
-from typing import Dict, Type, Any
+from typing import Dict, List, Type, Any
 
 # Simple alias so we don't create circular imports.
 # World can also define EntityId = int; they don't need to be literally the same object.
@@ -19,6 +19,25 @@ class CreateEntityCmd:
     components: Dict[Type[Any], Any]
 
 
+@dataclass
+class CreateEntitiesCmd:
+    """
+    Request to create N entities at once, with components given column-wise.
+
+    components:
+        dict mapping ComponentType -> list of component instances, one per
+        entity. Every list must have the same length.
+        e.g. {Position: [Position(...), ...], Velocity: [Velocity(...), ...]}
+    """
+    components: Dict[Type[Any], List[Any]]
+
+    @property
+    def count(self) -> int:
+        for column in self.components.values():
+            return len(column)
+        return 0
+
+
 @dataclass
 class DestroyEntityCmd:
     """
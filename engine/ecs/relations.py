@@ -0,0 +1,113 @@
+# engine/ecs/relations.py
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional, Set, Type, TypeVar
+
+EntityId = int
+
+T = TypeVar("T")
+
+# Empty result shared by children() lookups for parents without children.
+_NO_CHILDREN: frozenset = frozenset()
+
+
+def parent_link(field: str, cascade_destroy: bool = True) -> Callable[[Type[T]], Type[T]]:
+    """
+    Class decorator marking a component type as a child -> parent link.
+
+    `field` names the attribute that holds the parent entity id. The World
+    keeps a RelationIndex for every marked component type, so lookups in
+    both directions are O(1):
+
+        @parent_link("tank")
+        @dataclass
+        class InTank:
+            tank: EntityId
+
+        world.children(InTank, tank_eid)  # -> entities linked to that tank
+        world.parent(InTank, fish_eid)    # -> the fish's tank (or None)
+
+    With cascade_destroy=True, destroying a parent also destroys every child.
+    """
+    def decorate(cls: Type[T]) -> Type[T]:
+        cls.__ecs_parent_field__ = field  # type: ignore[attr-defined]
+        cls.__ecs_cascade_destroy__ = bool(cascade_destroy)  # type: ignore[attr-defined]
+        return cls
+
+    return decorate
+
+
+class RelationIndex:
+    """
+    Bidirectional parent/child index for one link component type.
+
+    The World updates it whenever a link component is added, removed or its
+    entity is destroyed. Components are plain data, so if a system rewrites
+    the parent field in place it must call world.relink(...) afterwards.
+    """
+
+    def __init__(self, field: str, cascade_destroy: bool = True) -> None:
+        self.field = field
+        self.cascade_destroy = cascade_destroy
+        self._parent_of: Dict[EntityId, EntityId] = {}
+        self._children_of: Dict[EntityId, Set[EntityId]] = {}
+
+    @classmethod
+    def for_component(cls, component_type: Type[Any]) -> Optional["RelationIndex"]:
+        """Build an index if the type was marked with @parent_link, else None."""
+        field = getattr(component_type, "__ecs_parent_field__", None)
+        if field is None:
+            return None
+        cascade = bool(getattr(component_type, "__ecs_cascade_destroy__", True))
+        return cls(field, cascade_destroy=cascade)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+    def link(self, child: EntityId, component: Any) -> None:
+        """(Re)link `child` to the parent stored on its link component."""
+        parent = getattr(component, self.field)
+        old = self._parent_of.get(child)
+        if old == parent and old is not None:
+            return
+        if old is not None:
+            self._drop_child(old, child)
+        if parent is None:
+            self._parent_of.pop(child, None)
+            return
+        self._parent_of[child] = parent
+        self._children_of.setdefault(parent, set()).add(child)
+
+    def unlink(self, child: EntityId) -> None:
+        parent = self._parent_of.pop(child, None)
+        if parent is not None:
+            self._drop_child(parent, child)
+
+    def forget_parent(self, parent: EntityId) -> Set[EntityId]:
+        """Detach and return all children of `parent` (used on destroy)."""
+        children = self._children_of.pop(parent, set())
+        for child in children:
+            self._parent_of.pop(child, None)
+        return children
+
+    def _drop_child(self, parent: EntityId, child: EntityId) -> None:
+        siblings = self._children_of.get(parent)
+        if siblings is None:
+            return
+        siblings.discard(child)
+        if not siblings:
+            del self._children_of[parent]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def parent(self, child: EntityId) -> Optional[EntityId]:
+        return self._parent_of.get(child)
+
+    def children(self, parent: EntityId) -> Set[EntityId] | frozenset:
+        """Live set of children; copy it before destroying entities while iterating."""
+        return self._children_of.get(parent, _NO_CHILDREN)
+
+    def parents(self) -> Set[EntityId]:
+        """All parents that currently have at least one child."""
+        return set(self._children_of)
@@ -0,0 +1,237 @@
+# engine/ecs/shared_columns.py
+from __future__ import annotations
+
+import json
+import operator
+import struct
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type
+
+from .world import World
+
+# Block layout (all integers little-endian, every section 8-byte aligned):
+#
+#   header   MAGIC | published u64 | capacity u64 | schema length u64 | schema JSON
+#   buffer 0 seq u64 | frame u64 | count u64 | columns...
+#   buffer 1 (same)
+#
+# Writers fill the buffer the *last* frame is not in, guarding it with a
+# per-buffer seqlock (seq odd while writing), then bump `published`.
+# Readers take zero-copy views of buffer[published % 2] and check the seq
+# afterwards (ColumnFrame.valid()); they only lose a frame if the writer
+# laps them by two publishes while they are still reading it.
+MAGIC = b"ECSCOLS1"
+_U64 = struct.Struct("<Q")
+_BUF_HEADER = struct.Struct("<QQQ")
+_PUBLISHED = len(MAGIC)
+_CAPACITY = _PUBLISHED + 8
+_SCHEMA_LEN = _CAPACITY + 8
+_SCHEMA = _SCHEMA_LEN + 8
+
+ColumnSpec = Tuple[str, str]  # (column name, array typecode)
+
+
+def _align(n: int) -> int:
+    return -(-n // 8) * 8
+
+
+def _layout(columns: Sequence[ColumnSpec], capacity: int, schema_len: int) -> Tuple[List[int], Dict[str, int], int]:
+    """(buffer offsets, column offset within a buffer, total size)."""
+    col_offsets: Dict[str, int] = {}
+    offset = _BUF_HEADER.size
+    for name, code in columns:
+        col_offsets[name] = offset
+        offset += _align(array(code).itemsize * capacity)
+    buffer_size = offset
+    first = _align(_SCHEMA + schema_len)
+    return [first, first + buffer_size], col_offsets, first + 2 * buffer_size
+
+
+class SharedColumns:
+    """
+    Writer side: publishes fixed-schema numeric columns into shared memory.
+
+    `columns` is [(name, typecode), ...] using array typecodes ("d" for
+    floats, "q" for ints/entity ids, "B" for flags). Readers in other
+    processes attach by `name` (SharedColumnsReader) and see whole frames
+    only. The writer owns the block and unlinks it on close().
+    """
+
+    def __init__(self, columns: Sequence[ColumnSpec], capacity: int, name: Optional[str] = None) -> None:
+        self.columns: Tuple[ColumnSpec, ...] = tuple(columns)
+        self.capacity = max(1, int(capacity))
+        schema = json.dumps([list(c) for c in self.columns]).encode("utf-8")
+        self._buffers, self._col_offsets, size = _layout(self.columns, self.capacity, len(schema))
+        self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        buf = self.shm.buf
+        buf[_SCHEMA:_SCHEMA + len(schema)] = schema
+        _U64.pack_into(buf, _CAPACITY, self.capacity)
+        _U64.pack_into(buf, _SCHEMA_LEN, len(schema))
+        _U64.pack_into(buf, _PUBLISHED, 0)
+        for base in self._buffers:
+            _BUF_HEADER.pack_into(buf, base, 0, 0, 0)
+        buf[:len(MAGIC)] = MAGIC  # last: readers treat the block as ready once MAGIC is there
+        self.published = 0
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def publish(self, values: Mapping[str, Any], frame: Optional[int] = None) -> int:
+        """
+        Write one frame. `values` maps every column name to an equally long
+        sequence (arrays of the column's typecode are copied without
+        conversion). Returns the published sequence number.
+        """
+        count = len(values[self.columns[0][0]]) if self.columns else 0
+        if count > self.capacity:
+            raise ValueError(f"{count} rows exceed shared column capacity {self.capacity}")
+        buf = self.shm.buf
+        base = self._buffers[(self.published + 1) % 2]
+        seq = _U64.unpack_from(buf, base)[0]
+        _U64.pack_into(buf, base, seq + 1)  # odd: writing
+        for name, code in self.columns:
+            column = values[name]
+            if len(column) != count:
+                raise ValueError(f"column {name!r} has {len(column)} rows, expected {count}")
+            if not (isinstance(column, array) and column.typecode == code):
+                column = array(code, column)
+            start = base + self._col_offsets[name]
+            buf[start:start + column.itemsize * count] = memoryview(column).cast("B")
+        self.published += 1
+        _BUF_HEADER.pack_into(buf, base, seq + 2, self.published if frame is None else frame, count)
+        _U64.pack_into(buf, _PUBLISHED, self.published)
+        return self.published
+
+    def close(self) -> None:
+        self.shm.close()
+        self.shm.unlink()
+
+
+class ColumnFrame:
+    """
+    Zero-copy view of one published frame. Check valid() after reading:
+    False means the writer reused the buffer meanwhile and the values read
+    may be torn. Release (or use as a context manager) when done.
+    """
+
+    def __init__(self, reader: "SharedColumnsReader", base: int, seq: int, frame: int, count: int) -> None:
+        self._reader = reader
+        self._base = base
+        self._seq = seq
+        self.frame = frame
+        self.count = count
+        self.columns: Dict[str, memoryview] = {}
+        buf = reader.shm.buf
+        for name, code in reader.columns:
+            start = base + reader._col_offsets[name]
+            raw = buf[start:start + array(code).itemsize * count]
+            self.columns[name] = raw.cast(code)
+            raw.release()
+
+    def __getitem__(self, name: str) -> memoryview:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def valid(self) -> bool:
+        return _U64.unpack_from(self._reader.shm.buf, self._base)[0] == self._seq
+
+    def release(self) -> None:
+        for view in self.columns.values():
+            view.release()
+        self.columns = {}
+        self._reader._frames.discard(self)
+
+    def __enter__(self) -> "ColumnFrame":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+class SharedColumnsReader:
+    """Reader side: attach to a SharedColumns block by name (any process)."""
+
+    def __init__(self, name: str) -> None:
+        self.shm = shared_memory.SharedMemory(name=name)
+        # Attaching registers the block with this process's resource
+        # tracker, which would unlink it at exit; the writer owns it.
+        resource_tracker.unregister(self.shm._name, "shared_memory")  # type: ignore[attr-defined]
+        buf = self.shm.buf
+        if bytes(buf[:len(MAGIC)]) != MAGIC:
+            self.shm.close()
+            raise ValueError(f"shared memory block {name!r} holds no shared columns")
+        self.capacity = _U64.unpack_from(buf, _CAPACITY)[0]
+        schema_len = _U64.unpack_from(buf, _SCHEMA_LEN)[0]
+        self.columns: Tuple[ColumnSpec, ...] = tuple(
+            (str(n), str(c)) for n, c in json.loads(bytes(buf[_SCHEMA:_SCHEMA + schema_len]))
+        )
+        self._buffers, self._col_offsets, _ = _layout(self.columns, self.capacity, schema_len)
+        self._frames: set = set()
+
+    @property
+    def published(self) -> int:
+        return _U64.unpack_from(self.shm.buf, _PUBLISHED)[0]
+
+    def acquire(self, max_spins: int = 10_000) -> ColumnFrame:
+        """Zero-copy views of the newest complete frame."""
+        buf = self.shm.buf
+        for _ in range(max_spins):
+            base = self._buffers[self.published % 2]
+            seq, frame, count = _BUF_HEADER.unpack_from(buf, base)
+            if seq % 2:
+                continue  # lapped: the writer is refilling this buffer
+            view = ColumnFrame(self, base, seq, frame, count)
+            self._frames.add(view)
+            return view
+        raise TimeoutError("shared columns writer never left the buffer")
+
+    def read(self, max_spins: int = 10_000) -> Tuple[int, Dict[str, array]]:
+        """(frame, copied columns) of the newest frame, retrying torn reads."""
+        for _ in range(max_spins):
+            with self.acquire(max_spins) as view:
+                out = {name: array(code, view.columns[name]) for name, code in self.columns}
+                if view.valid():
+                    return view.frame, out
+        raise TimeoutError("could not read a consistent shared columns frame")
+
+    def close(self) -> None:
+        for view in list(self._frames):
+            view.release()
+        self.shm.close()
+
+
+# ----------------------------------------------------------------------
+# Component columns
+# ----------------------------------------------------------------------
+def _typecode(field_type: Any) -> str:
+    if field_type in (bool, "bool"):
+        return "B"
+    if field_type in (int, "int", "EntityId"):
+        return "q"
+    return "d"
+
+
+def component_column_specs(fields: Sequence[Tuple[Type[Any], str]]) -> List[ColumnSpec]:
+    """Column schema for [(ComponentType, field), ...]: "eid" plus "Type.field" columns."""
+    specs: List[ColumnSpec] = [("eid", "q")]
+    for ctype, field in fields:
+        annotation = getattr(ctype, "__dataclass_fields__", {}).get(field)
+        specs.append((f"{ctype.__name__}.{field}", _typecode(annotation.type if annotation else float)))
+    return specs
+
+
+def gather_component_columns(world: World, fields: Sequence[Tuple[Type[Any], str]]) -> Dict[str, List[Any]]:
+    """Columns for every entity that has all the listed component types, in store order."""
+    ctypes = list(dict.fromkeys(ctype for ctype, _ in fields))
+    stores = [world._components.get(ctype, {}) for ctype in ctypes]
+    first, rest = stores[0], stores[1:]
+    eids = [eid for eid in first if all(eid in store for store in rest)]
+    out: Dict[str, List[Any]] = {"eid": eids}
+    for ctype, field in fields:
+        store = world._components[ctype] if eids else {}
+        out[f"{ctype.__name__}.{field}"] = list(map(operator.attrgetter(field), map(store.__getitem__, eids)))
+    return out
@@ -0,0 +1,660 @@
+# engine/ecs/snapshot.py
+from __future__ import annotations
+
+import copy
+import dataclasses
+import functools
+import gc
+import importlib
+import io
+import lzma
+import operator
+import pickle
+import struct
+import sys
+import time
+import zlib
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from .world import World, EntityId
+
+# ----------------------------------------------------------------------
+# Format
+# ----------------------------------------------------------------------
+# header:  MAGIC | u16 version | u8 codec id | u8 little-endian flag
+# payload (compressed with the codec):
+#   i64 next_id | i64 change_tick | i64 since_tick (-1 = full) | blob extras (pickle)
+#   u32 store count, then per store:
+#     str type path | u8 layout | u32 entity count | blob eids (array 'q')
+#     layout COLUMNS:  u32 field count, then per field: str name | u8 tag | blob data
+#     layout OBJECTS:  blob pickled list of components
+#   u32 live count, then per store with removals (deltas only):
+#     str type path | blob surviving eids (array 'q')
+# str/blob = u32 length + bytes.
+MAGIC = b"ECSNAP"
+FORMAT_VERSION = 2
+
+LAYOUT_COLUMNS = 0
+LAYOUT_OBJECTS = 1
+
+# Column tags: fixed-width arrays for numeric fields, pickle for the rest.
+TAG_FLOAT = b"d"
+TAG_INT = b"q"
+TAG_BOOL = b"B"
+TAG_ENTITY = b"e"
+TAG_OBJECT = b"O"
+
+_HEADER = struct.Struct("<HBB")
+_I64 = struct.Struct("<q")
+_U32 = struct.Struct("<I")
+_U8 = struct.Struct("<B")
+_NATIVE_LITTLE = sys.byteorder == "little"
+
+
+class SnapshotError(ValueError):
+    """The data is not a snapshot this version can read."""
+
+
+# ----------------------------------------------------------------------
+# Codecs
+# ----------------------------------------------------------------------
+def _optional_codec(module: str, compress: str, decompress: str) -> Optional[Tuple[Callable, Callable]]:
+    try:
+        mod = importlib.import_module(module)
+    except ImportError:
+        return None
+    return getattr(mod, compress), getattr(mod, decompress)
+
+
+def _zstd() -> Optional[Tuple[Callable, Callable]]:
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return (
+        lambda data: zstandard.ZstdCompressor(level=3).compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+
+
+# id -> (name, factory returning (compress, decompress) or None if unavailable)
+_CODECS: Dict[int, Tuple[str, Callable[[], Optional[Tuple[Callable, Callable]]]]] = {
+    0: ("none", lambda: (bytes, bytes)),
+    1: ("zlib", lambda: (lambda d: zlib.compress(d, 6), zlib.decompress)),
+    2: ("lzma", lambda: (lzma.compress, lzma.decompress)),
+    3: ("zstd", _zstd),
+    4: ("lz4", lambda: _optional_codec("lz4.frame", "compress", "decompress")),
+}
+_CODEC_IDS = {name: cid for cid, (name, _) in _CODECS.items()}
+
+
+def available_codecs() -> List[str]:
+    """Codec names usable here; zstd/lz4 need their optional packages."""
+    return [name for name, factory in _CODECS.values() if factory() is not None]
+
+
+def _codec(cid: int) -> Tuple[Callable, Callable]:
+    entry = _CODECS.get(cid)
+    if entry is None:
+        raise SnapshotError(f"unknown snapshot codec id {cid}")
+    name, factory = entry
+    funcs = factory()
+    if funcs is None:
+        raise SnapshotError(f"snapshot codec {name!r} is not installed")
+    return funcs
+
+
+# ----------------------------------------------------------------------
+# Writing
+# ----------------------------------------------------------------------
+def _type_path(ctype: Type[Any]) -> str:
+    return f"{ctype.__module__}:{ctype.__qualname__}"
+
+
+def _resolve_type(path: str) -> Type[Any]:
+    module, _, qualname = path.partition(":")
+    obj: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _column(values: Sequence[Any]) -> Tuple[bytes, bytes]:
+    """Pick the tightest encoding that round-trips every value exactly."""
+    kinds = set(map(type, values))
+    if kinds == {float}:
+        return TAG_FLOAT, array("d", values).tobytes()
+    if kinds == {bool}:
+        return TAG_BOOL, bytes(values)
+    if kinds == {EntityId}:
+        return TAG_ENTITY, array("q", values).tobytes()
+    if kinds == {int} and all(-(1 << 63) <= v < (1 << 63) for v in values):
+        return TAG_INT, array("q", values).tobytes()
+    return TAG_OBJECT, pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class _Writer:
+    def __init__(self) -> None:
+        self.buf = io.BytesIO()
+
+    def u8(self, v: int) -> None:
+        self.buf.write(_U8.pack(v))
+
+    def u32(self, v: int) -> None:
+        self.buf.write(_U32.pack(v))
+
+    def i64(self, v: int) -> None:
+        self.buf.write(_I64.pack(v))
+
+    def blob(self, data: bytes) -> None:
+        self.buf.write(_U32.pack(len(data)))
+        self.buf.write(data)
+
+    def str(self, s: str) -> None:
+        self.blob(s.encode("utf-8"))
+
+
+@contextmanager
+def _gc_paused():
+    # Hundreds of thousands of fresh objects would otherwise trigger repeated
+    # full GC passes over a heap that cannot contain garbage yet.
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+# ----------------------------------------------------------------------
+# Capture (main thread) -> encode (any thread)
+# ----------------------------------------------------------------------
+@dataclass
+class CapturedStore:
+    """
+    Immutable copy of one component store, detached from the live objects.
+
+    Dataclass stores keep one list of values per field (`columns`), or one
+    tuple per entity (`rows`) when assembled slice by slice; anything else
+    is pickled up front (`blob`).
+    """
+    ctype: Type[Any]
+    eids: List[EntityId]
+    names: Optional[List[str]] = None
+    rows: Optional[List[Tuple[Any, ...]]] = None
+    blob: Optional[bytes] = None
+    columns: Optional[List[List[Any]]] = None
+
+
+@dataclass
+class WorldCapture:
+    """
+    Everything dump/encode needs, copied out of a World at one instant.
+
+    since_tick is None for a full snapshot. For a delta it is the tick of
+    the checkpoint it applies on top of; `stores` then holds only changed
+    components and `live` lists the surviving entity ids of every store
+    that had removals, so the loader can drop the rest.
+    """
+    next_id: int
+    change_tick: int
+    since_tick: Optional[int]
+    stores: List[CapturedStore]
+    live: Dict[Type[Any], List[EntityId]] = field(default_factory=dict)
+    extras: Any = None
+
+
+@functools.lru_cache(maxsize=None)
+def _layout(ctype: Type[Any]) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]], Tuple[int, ...]]:
+    """(field names, row getter, indexes of container fields that need a deep copy)."""
+    fields = dataclasses.fields(ctype)
+    names = tuple(f.name for f in fields)
+    if len(names) == 1:
+        name = names[0]
+        getter = lambda c: (getattr(c, name),)  # noqa: E731
+    else:
+        getter = operator.attrgetter(*names)
+    # default_factory fields (dict/list state) are the mutable ones here.
+    mutable = tuple(i for i, f in enumerate(fields) if f.default_factory is not dataclasses.MISSING)
+    return names, getter, mutable
+
+
+def _plain(ctype: Type[Any], comps: Sequence[Any]) -> bool:
+    """True if every component is exactly a dataclass `ctype` (no subclasses)."""
+    return dataclasses.is_dataclass(ctype) and set(map(type, comps)) <= {ctype}
+
+
+def _copy_rows(ctype: Type[Any], comps: Sequence[Any]) -> List[Tuple[Any, ...]]:
+    _, getter, mutable = _layout(ctype)
+    rows = list(map(getter, comps))
+    if mutable:
+        rows = [
+            tuple(copy.deepcopy(v) if i in mutable else v for i, v in enumerate(row))
+            for row in rows
+        ]
+    return rows
+
+
+def capture_store(ctype: Type[Any], eids: Sequence[EntityId], comps: Sequence[Any]) -> CapturedStore:
+    """Copy component values out so they can be encoded off-thread."""
+    eids = list(eids)
+    comps = list(comps)
+    if not _plain(ctype, comps):
+        return CapturedStore(ctype, eids, blob=pickle.dumps(comps, protocol=pickle.HIGHEST_PROTOCOL))
+    names, _, mutable = _layout(ctype)
+    # One attrgetter pass per field beats building a tuple per entity.
+    columns = [list(map(operator.attrgetter(name), comps)) for name in names]
+    for i in mutable:
+        columns[i] = [copy.deepcopy(v) for v in columns[i]]
+    return CapturedStore(ctype, eids, names=list(names), columns=columns)
+
+
+def _capture_changes(world: World, ctype: Type[Any], store: Dict[EntityId, Any], since_tick: Optional[int]) -> Optional[CapturedStore]:
+    if since_tick is None or world._bulk_ticks.get(ctype, 0) > since_tick:
+        # Whole store: skip building (eid, component) pairs.
+        return capture_store(ctype, store.keys(), store.values())
+    changed = world.changed(ctype, since_tick)
+    if not changed:
+        return None
+    eids, comps = zip(*changed)
+    return capture_store(ctype, eids, comps)
+
+
+def capture_world(world: World, since_tick: Optional[int] = None, extras: Any = None) -> WorldCapture:
+    """
+    Copy the world's state for encoding in one go on the calling thread.
+
+    With since_tick, only components changed after that tick are captured
+    (see World.changed()), plus live-id lists for stores with removals.
+    IncrementalCapture spreads the same copy over several frames.
+    """
+    stores: List[CapturedStore] = []
+    live: Dict[Type[Any], List[EntityId]] = {}
+    for ctype, store in world._components.items():
+        if since_tick is not None and world.last_removal(ctype) > since_tick:
+            live[ctype] = list(store.keys())
+        if not store:
+            continue
+        captured = _capture_changes(world, ctype, store, since_tick)
+        if captured is not None:
+            stores.append(captured)
+    return WorldCapture(
+        next_id=world._next_id,
+        change_tick=world.change_tick,
+        since_tick=since_tick,
+        stores=stores,
+        live=live,
+        extras=extras,
+    )
+
+
+class IncrementalCapture:
+    """
+    capture_world() spread over several calls, e.g. one step() per frame.
+
+    step() copies rows of the rarely written stores a slice at a time
+    until its time budget is spent. Stores bulk-marked since `since_tick`
+    (at any point, for a full capture) change every frame anyway; they
+    are left to finish(), which copies them whole, column-wise. finish()
+    also copies again every row written after the capture started and
+    drops rows of removed components, so the result is consistent at the
+    tick finish() runs at. This relies on the world's change tracking:
+    components edited between steps must be marked like they are for
+    deltas (mark_changed(), get_mut(), mark_all_changed()).
+    """
+
+    SLICE = 1024
+
+    def __init__(self, world: World, since_tick: Optional[int] = None) -> None:
+        self.world = world
+        self.since_tick = since_tick
+        self.started = world.change_tick
+        # {ComponentType: {EntityId: row}} for stores copied in slices.
+        self._rows: Dict[Type[Any], Dict[EntityId, Tuple[Any, ...]]] = {}
+        self._slices: "deque[Tuple[Type[Any], List[EntityId]]]" = deque()
+        floor = since_tick or 0
+        for ctype, store in world._components.items():
+            if not store or not dataclasses.is_dataclass(ctype) or world._bulk_ticks.get(ctype, 0) > floor:
+                continue
+            if since_tick is None:
+                eids = list(store)
+            else:
+                eids = [eid for eid, _ in world.changed(ctype, since_tick)]
+            self._rows[ctype] = {}
+            for start in range(0, len(eids), self.SLICE):
+                self._slices.append((ctype, eids[start:start + self.SLICE]))
+
+    @property
+    def done(self) -> bool:
+        """True once only finish() is left."""
+        return not self._slices
+
+    def step(self, budget: float) -> bool:
+        """Copy slices for about `budget` seconds (at least one); returns done."""
+        deadline = time.perf_counter() + budget
+        components = self.world._components
+        while self._slices:
+            ctype, eids = self._slices.popleft()
+            rows = self._rows.get(ctype)
+            if rows is not None:
+                store = components.get(ctype, {})
+                eids = [eid for eid in eids if eid in store]
+                comps = [store[eid] for eid in eids]
+                if _plain(ctype, comps):
+                    rows.update(zip(eids, _copy_rows(ctype, comps)))
+                else:
+                    del self._rows[ctype]  # left to finish()
+            if time.perf_counter() >= deadline:
+                break
+        return self.done
+
+    def finish(self, extras: Any = None) -> WorldCapture:
+        """Copy whatever is left and return the capture; call once."""
+        while not self.done:
+            self.step(float("inf"))
+        world = self.world
+        since_tick = self.since_tick
+        stores: List[CapturedStore] = []
+        live: Dict[Type[Any], List[EntityId]] = {}
+        for ctype, store in world._components.items():
+            if since_tick is not None and world.last_removal(ctype) > since_tick:
+                live[ctype] = list(store.keys())
+            if not store:
+                continue
+            rows = self._rows.get(ctype)
+            if rows is not None and world._bulk_ticks.get(ctype, 0) > self.started:
+                rows = None  # bulk-written while slicing: copy it whole
+            if rows is not None:
+                changed = world.changed(ctype, self.started)
+                if changed:
+                    eids, comps = zip(*changed)
+                    if _plain(ctype, comps):
+                        rows.update(zip(eids, _copy_rows(ctype, comps)))
+                    else:
+                        rows = None
+            if rows is None:
+                captured = _capture_changes(world, ctype, store, since_tick)
+                if captured is not None:
+                    stores.append(captured)
+                continue
+            if world.last_removal(ctype) > self.started:
+                # Drop removed rows and follow the store's order.
+                rows = {eid: rows[eid] for eid in store if eid in rows}
+            if rows:
+                names, _, _ = _layout(ctype)
+                stores.append(CapturedStore(ctype, list(rows), names=list(names), rows=list(rows.values())))
+        return WorldCapture(
+            next_id=world._next_id,
+            change_tick=world.change_tick,
+            since_tick=since_tick,
+            stores=stores,
+            live=live,
+            extras=extras,
+        )
+
+
+def _write_store(w: _Writer, captured: CapturedStore) -> None:
+    w.str(_type_path(captured.ctype))
+    w.u8(LAYOUT_OBJECTS if captured.blob is not None else LAYOUT_COLUMNS)
+    w.u32(len(captured.eids))
+    w.blob(array("q", captured.eids).tobytes())
+    if captured.blob is not None:
+        w.blob(captured.blob)
+        return
+    if captured.columns is not None:
+        columns = captured.columns
+    elif captured.rows:
+        columns = list(zip(*captured.rows))
+    else:
+        columns = [() for _ in captured.names]
+    w.u32(len(captured.names))
+    for name, values in zip(captured.names, columns):
+        tag, data = _column(values)
+        w.str(name)
+        w.buf.write(tag)
+        w.blob(data)
+
+
+def encode_capture(capture: WorldCapture, codec: str = "zlib") -> bytes:
+    """Serialize a WorldCapture; safe to call from a background thread."""
+    cid = _CODEC_IDS.get(codec)
+    if cid is None:
+        raise ValueError(f"unknown snapshot codec {codec!r}; expected one of {sorted(_CODEC_IDS)}")
+    compress, _ = _codec(cid)
+
+    w = _Writer()
+    w.i64(capture.next_id)
+    w.i64(capture.change_tick)
+    w.i64(-1 if capture.since_tick is None else capture.since_tick)
+    w.blob(pickle.dumps(capture.extras, protocol=pickle.HIGHEST_PROTOCOL))
+    w.u32(len(capture.stores))
+    for captured in capture.stores:
+        _write_store(w, captured)
+    w.u32(len(capture.live))
+    for ctype, eids in capture.live.items():
+        w.str(_type_path(ctype))
+        w.blob(array("q", eids).tobytes())
+
+    header = MAGIC + _HEADER.pack(FORMAT_VERSION, cid, 1 if _NATIVE_LITTLE else 0)
+    return header + compress(w.buf.getvalue())
+
+
+def dump_world(world: World, extras: Any = None, codec: str = "zlib") -> bytes:
+    """
+    Serialize every component store of `world` plus the id/tick counters.
+
+    `extras` is any picklable value stored alongside (RNG states, system
+    state, ...). Queued commands and cached views are not saved.
+    """
+    return encode_capture(capture_world(world, extras=extras), codec=codec)
+
+
+def save_snapshot(world: World, path: str | Path, extras: Any = None, codec: str = "zlib") -> None:
+    Path(path).write_bytes(dump_world(world, extras=extras, codec=codec))
+
+
+# ----------------------------------------------------------------------
+# Reading
+# ----------------------------------------------------------------------
+class _Reader:
+    def __init__(self, data: bytes) -> None:
+        self.view = memoryview(data)
+        self.pos = 0
+
+    def _take(self, n: int) -> memoryview:
+        end = self.pos + n
+        if end > len(self.view):
+            raise SnapshotError("truncated snapshot")
+        chunk = self.view[self.pos:end]
+        self.pos = end
+        return chunk
+
+    def u8(self) -> int:
+        return _U8.unpack(self._take(1))[0]
+
+    def u32(self) -> int:
+        return _U32.unpack(self._take(4))[0]
+
+    def i64(self) -> int:
+        return _I64.unpack(self._take(8))[0]
+
+    def blob(self) -> memoryview:
+        return self._take(self.u32())
+
+    def str(self) -> str:
+        return bytes(self.blob()).decode("utf-8")
+
+
+def _decode_array(code: str, data: memoryview, swap: bool) -> array:
+    arr = array(code)
+    arr.frombytes(data)
+    if swap:
+        arr.byteswap()
+    return arr
+
+
+def _read_column(tag: bytes, data: memoryview, swap: bool) -> List[Any]:
+    if tag == TAG_FLOAT:
+        return _decode_array("d", data, swap).tolist()
+    if tag == TAG_INT:
+        return _decode_array("q", data, swap).tolist()
+    if tag == TAG_ENTITY:
+        return list(map(EntityId, _decode_array("q", data, swap)))
+    if tag == TAG_BOOL:
+        return [b != 0 for b in bytes(data)]
+    if tag == TAG_OBJECT:
+        return pickle.loads(data)
+    raise SnapshotError(f"unknown column tag {tag!r}")
+
+
+def _positional_init(ctype: Type[Any], names: List[str]) -> bool:
+    """True if ctype(*row) rebuilds a component exactly from the saved columns."""
+    if hasattr(ctype, "__post_init__"):
+        return False
+    fields = dataclasses.fields(ctype)
+    return [f.name for f in fields] == names and all(f.init and not f.kw_only for f in fields)
+
+
+def _build_components(ctype: Type[Any], names: List[str], columns: List[List[Any]], count: int) -> List[Any]:
+    if not columns:
+        return [ctype() for _ in range(count)]
+    if _positional_init(ctype, names):
+        # The generated __init__ mapped over whole columns is the fastest
+        # way to make many instances from pure Python.
+        return list(map(ctype, *columns))
+    # Otherwise bypass __init__ and set every stored field directly.
+    new = object.__new__
+    setter = object.__setattr__
+    out = []
+    for row in zip(*columns):
+        comp = new(ctype)
+        for name, value in zip(names, row):
+            setter(comp, name, value)
+        out.append(comp)
+    return out
+
+
+@dataclass
+class DecodedSnapshot:
+    next_id: int
+    change_tick: int
+    since_tick: Optional[int]
+    extras: Any
+    stores: List[Tuple[Type[Any], List[EntityId], List[Any]]]
+    live: Dict[Type[Any], List[EntityId]]
+
+    @property
+    def is_delta(self) -> bool:
+        return self.since_tick is not None
+
+
+def decode_snapshot(data: bytes) -> DecodedSnapshot:
+    """Parse full or delta snapshot bytes back into components."""
+    head = len(MAGIC) + _HEADER.size
+    if len(data) < head or data[: len(MAGIC)] != MAGIC:
+        raise SnapshotError("not a world snapshot")
+    version, cid, little = _HEADER.unpack_from(data, len(MAGIC))
+    if version != FORMAT_VERSION:
+        raise SnapshotError(f"snapshot format v{version} is not supported (expected v{FORMAT_VERSION})")
+    _, decompress = _codec(cid)
+    swap = bool(little) != _NATIVE_LITTLE
+
+    r = _Reader(decompress(data[head:]))
+    next_id = r.i64()
+    change_tick = r.i64()
+    since_tick = r.i64()
+    extras = pickle.loads(r.blob())
+
+    stores = []
+    # Most stores of an archetype share the same entity column; decode it once.
+    eid_columns: Dict[bytes, List[EntityId]] = {}
+    for _ in range(r.u32()):
+        ctype = _resolve_type(r.str())
+        layout = r.u8()
+        count = r.u32()
+        raw = bytes(r.blob())
+        eids = eid_columns.get(raw)
+        if eids is None:
+            eids = eid_columns[raw] = list(map(EntityId, _decode_array("q", memoryview(raw), swap)))
+        if layout == LAYOUT_OBJECTS:
+            comps = pickle.loads(r.blob())
+        elif layout == LAYOUT_COLUMNS:
+            names: List[str] = []
+            columns: List[List[Any]] = []
+            for _ in range(r.u32()):
+                names.append(r.str())
+                tag = bytes(r._take(1))
+                columns.append(_read_column(tag, r.blob(), swap))
+            comps = _build_components(ctype, names, columns, count)
+        else:
+            raise SnapshotError(f"unknown store layout {layout}")
+        if len(comps) != count or len(eids) != count:
+            raise SnapshotError(f"store {ctype.__name__} is corrupt")
+        stores.append((ctype, eids, comps))
+
+    live = {}
+    for _ in range(r.u32()):
+        ctype = _resolve_type(r.str())
+        live[ctype] = list(map(EntityId, _decode_array("q", r.blob(), swap)))
+
+    return DecodedSnapshot(
+        next_id=next_id,
+        change_tick=change_tick,
+        since_tick=None if since_tick < 0 else since_tick,
+        extras=extras,
+        stores=stores,
+        live=live,
+    )
+
+
+def load_world(data: bytes | DecodedSnapshot, tick_floor: int = 0) -> Tuple[World, Any]:
+    """
+    Rebuild a World from dump_world() bytes; returns (world, extras).
+
+    Every restored component is stamped as changed after both the saved
+    tick and `tick_floor`, so systems that remember ticks from a previous
+    world (pass its change_tick) still see everything as new.
+    Snapshots may contain pickled values: only load trusted files.
+    """
+    with _gc_paused():
+        snap = data if isinstance(data, DecodedSnapshot) else decode_snapshot(data)
+        if snap.is_delta:
+            raise SnapshotError("this is a delta snapshot; load its base and use apply_delta()")
+        world = World()
+        world._change_tick = max(snap.change_tick, tick_floor)
+        for ctype, eids, comps in snap.stores:
+            world.add_components(ctype, eids, comps)
+        world._next_id = max(snap.next_id, world._next_id)
+    return world, snap.extras
+
+
+def apply_delta(world: World, data: bytes | DecodedSnapshot) -> Any:
+    """
+    Apply a delta snapshot on top of `world` in place; returns its extras.
+
+    The caller is responsible for applying deltas in order on top of the
+    checkpoint they were taken against (compare since_tick/change_tick).
+    """
+    with _gc_paused():
+        snap = data if isinstance(data, DecodedSnapshot) else decode_snapshot(data)
+        if not snap.is_delta:
+            raise SnapshotError("not a delta snapshot")
+        for ctype, live_eids in snap.live.items():
+            store = world.get_components(ctype)
+            keep = set(live_eids)
+            for eid in [eid for eid in store if eid not in keep]:
+                world.remove_component(eid, ctype)
+        for ctype, eids, comps in snap.stores:
+            world.add_components(ctype, eids, comps)
+        world._next_id = max(snap.next_id, world._next_id)
+    return snap.extras
+
+
+def load_snapshot(path: str | Path, tick_floor: int = 0) -> Tuple[World, Any]:
+    return load_world(Path(path).read_bytes(), tick_floor=tick_floor)
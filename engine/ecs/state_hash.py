@@ -0,0 +1,141 @@
+# engine/ecs/state_hash.py
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import operator
+import struct
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from .world import World, EntityId
+
+DIGEST_SIZE = 8
+
+
+def _column_bytes(values: Sequence[Any]) -> bytes:
+    """Canonical bytes for one field column (exact float bits, no pickle)."""
+    kinds = set(map(type, values))
+    if kinds == {float}:
+        return b"d" + array("d", values).tobytes()
+    if kinds == {str}:
+        return b"s" + "\0".join(values).encode("utf-8")
+    if kinds <= {int, EntityId} and kinds:
+        try:
+            return b"q" + array("q", values).tobytes()
+        except OverflowError:
+            pass
+    # str / bool / None / tuples: repr is stable across processes, unlike
+    # hash() (randomized for str) or pickle (depends on object identity).
+    return b"r" + repr(list(values)).encode("utf-8")
+
+
+def store_digest(world: World, component_type: Type[Any]) -> bytes:
+    """
+    Digest of one component store, independent of insertion order.
+
+    Entities are visited in id order and every dataclass field is hashed
+    column-wise; non-dataclass components fall back to repr().
+    """
+    h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    h.update(component_type.__qualname__.encode("utf-8"))
+    store = world._components.get(component_type)
+    if not store:
+        return h.digest()
+    eids = sorted(store)
+    comps = [store[eid] for eid in eids]
+    h.update(array("q", eids).tobytes())
+    if dataclasses.is_dataclass(component_type):
+        for f in dataclasses.fields(component_type):
+            h.update(f.name.encode("utf-8"))
+            h.update(_column_bytes(list(map(operator.attrgetter(f.name), comps))))
+    else:
+        h.update(repr([vars(c) if hasattr(c, "__dict__") else c for c in comps]).encode("utf-8"))
+    return h.digest()
+
+
+class StateHasher:
+    """
+    64-bit hash over selected component stores, e.g. (Position, Velocity, Brain).
+
+    Incremental at store granularity: a store's digest is only recomputed
+    when World.last_change() says it was written since the last call, so
+    static stores cost O(1). This relies on systems marking in-place edits
+    (mark_changed / mark_all_changed); pass incremental=False to rehash
+    everything every time.
+    """
+
+    def __init__(self, component_types: Sequence[Type[Any]], incremental: bool = True) -> None:
+        self.component_types = tuple(component_types)
+        self.incremental = incremental
+        self._world: Optional[World] = None
+        # {ComponentType: (tick the digest was taken at, digest)}
+        self._cache: Dict[Type[Any], Tuple[int, bytes]] = {}
+
+    def digest(self, world: World) -> int:
+        if world is not self._world:
+            self._world = world
+            self._cache.clear()
+        h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+        for ctype in self.component_types:
+            h.update(self._store_digest(world, ctype))
+        return int.from_bytes(h.digest(), "little")
+
+    def _store_digest(self, world: World, ctype: Type[Any]) -> bytes:
+        if self.incremental:
+            cached = self._cache.get(ctype)
+            if cached is not None and world.last_change(ctype) <= cached[0]:
+                return cached[1]
+        digest = store_digest(world, ctype)
+        self._cache[ctype] = (world.change_tick, digest)
+        return digest
+
+
+# ----------------------------------------------------------------------
+# Locating a divergence
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class Difference:
+    """First mismatch between two worlds; field is None if the entity is missing on one side."""
+    component_type: Type[Any]
+    eid: EntityId
+    field: Optional[str]
+    a: Any
+    b: Any
+
+    def __str__(self) -> str:
+        what = self.component_type.__name__ + (f".{self.field}" if self.field else "")
+        return f"entity {int(self.eid)} {what}: {self.a!r} != {self.b!r}"
+
+
+def _same(a: Any, b: Any) -> bool:
+    if type(a) is float and type(b) is float:
+        return struct.pack("<d", a) == struct.pack("<d", b)
+    return type(a) is type(b) and a == b
+
+
+def first_difference(a: World, b: World, component_types: Sequence[Type[Any]]) -> Optional[Difference]:
+    """Lowest-id entity whose selected components differ between two worlds (None if equal)."""
+    found: List[Tuple[int, int, Difference]] = []
+    for order, ctype in enumerate(component_types):
+        store_a = a._components.get(ctype, {})
+        store_b = b._components.get(ctype, {})
+        for eid in sorted(store_a.keys() | store_b.keys()):
+            ca, cb = store_a.get(eid), store_b.get(eid)
+            if ca is None or cb is None:
+                found.append((eid, order, Difference(ctype, eid, None, ca, cb)))
+                break
+            names = [f.name for f in dataclasses.fields(ctype)] if dataclasses.is_dataclass(ctype) else None
+            if names is None:
+                if vars(ca) != vars(cb):
+                    found.append((eid, order, Difference(ctype, eid, None, ca, cb)))
+                    break
+                continue
+            diff = next((n for n in names if not _same(getattr(ca, n), getattr(cb, n))), None)
+            if diff is not None:
+                found.append((eid, order, Difference(ctype, eid, diff, getattr(ca, diff), getattr(cb, diff))))
+                break
+    if not found:
+        return None
+    return min(found, key=lambda item: (item[0], item[1]))[2]
@@ -27,6 +27,16 @@ class System:
         """
         return {}
 
+    def snapshot_state(self) -> Any:
+        """
+        Optional: picklable per-system state that is not stored in components
+        (e.g. per-entity caches). Saved with world snapshots; None = stateless.
+        """
+        return None
+
+    def restore_state(self, state: Any) -> None:
+        """Optional: inverse of snapshot_state(), called after a snapshot is loaded."""
+
     def update(self, world, dt: float) -> None:
         """Perform one frame of work."""
         raise NotImplementedError("System.update must be implemented by subclasses")
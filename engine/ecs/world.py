@@ -1,9 +1,10 @@
 # engine/ecs/world.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict, Type, TypeVar, Iterable, Tuple, List, Any
+from typing import Dict, Type, TypeVar, Iterable, Tuple, List, Any, Sequence, Optional, Set
 
-from .commands import CreateEntityCmd, DestroyEntityCmd
+from .commands import CreateEntityCmd, CreateEntitiesCmd, DestroyEntityCmd
+from .relations import RelationIndex
 
 
 class EntityId(int):
@@ -13,6 +14,9 @@ class EntityId(int):
 
 TComponent = TypeVar("TComponent")
 
+# Marks component types already checked for @parent_link but not link types.
+_NOT_A_LINK = object()
+
 
 class World:
     """
@@ -21,6 +25,8 @@ class World:
     - Stores components grouped by type
     - Provides basic views over entities with given component sets
     - Has a simple command queue for create/destroy operations
+    - Indexes parent/child links for @parent_link components (e.g. InTank)
+    - Stamps component writes with change ticks for incremental systems
     """
 
     def __init__(self) -> None:
@@ -32,6 +38,17 @@ class World:
         self._views: Dict[Tuple[Type[Any], ...], "View"] = {}
         # Deferred commands like CreateEntityCmd / DestroyEntityCmd
         self._command_queue: List[Any] = []
+        # {LinkComponentType: RelationIndex} (or _NOT_A_LINK once checked)
+        self._relations: Dict[Type[Any], Any] = {}
+        # Monotonic change counter + {ComponentType: {EntityId: tick}}.
+        # Each per-type dict is kept in tick order (re-marked entries move to
+        # the end), so changed() only walks entries newer than `since`.
+        self._change_tick: int = 0
+        self._change_ticks: Dict[Type[Any], Dict[EntityId, int]] = {}
+        # {ComponentType: tick of the last removal from that store}
+        self._removal_ticks: Dict[Type[Any], int] = {}
+        # {ComponentType: tick of the last mark_all_changed() on that store}
+        self._bulk_ticks: Dict[Type[Any], int] = {}
 
     # ------------------------------------------------------------------
     # Entity management
@@ -41,10 +58,32 @@ class World:
         self._next_id += 1
         return eid
 
+    def create_entities(self, count: int) -> List[EntityId]:
+        """Allocate `count` consecutive entity ids in one step."""
+        start = self._next_id
+        self._next_id += max(0, int(count))
+        return [EntityId(i) for i in range(start, self._next_id)]
+
     def destroy_entity(self, eid: EntityId) -> None:
-        """Remove the entity from all component stores."""
-        for comp_dict in self._components.values():
-            comp_dict.pop(eid, None)
+        """Remove the entity from all component stores.
+
+        Children linked through a cascading @parent_link component are
+        destroyed as well (e.g. destroying a tank removes its fish).
+        """
+        pending = [eid]
+        while pending:
+            current = pending.pop()
+            for ctype, comp_dict in self._components.items():
+                if current in comp_dict:
+                    del comp_dict[current]
+                    self._forget_change(ctype, current)
+            for rel in self._relations.values():
+                if rel is _NOT_A_LINK:
+                    continue
+                rel.unlink(current)
+                children = rel.forget_parent(current)
+                if rel.cascade_destroy:
+                    pending.extend(children)
 
     # ------------------------------------------------------------------
     # Component management
@@ -53,18 +92,173 @@ class World:
         ctype = type(component)
         store = self._components.setdefault(ctype, {})
         store[eid] = component
+        self.mark_changed(eid, ctype)
+        rel = self._relation_index(ctype)
+        if rel is not None:
+            rel.link(eid, component)
         self._invalidate_views_involving(ctype)
 
+    def add_components(
+        self,
+        component_type: Type[Any],
+        eids: Sequence[EntityId],
+        components: Sequence[Any],
+    ) -> None:
+        """Attach one component of `component_type` to each entity, column-wise.
+
+        Equivalent to calling add_component() for each (eid, component) pair,
+        but views are invalidated once for the whole column.
+        """
+        if len(eids) != len(components):
+            raise ValueError(
+                f"add_components got {len(eids)} entities but {len(components)} components"
+            )
+        if not eids:
+            return
+        store = self._components.setdefault(component_type, {})
+        store.update(zip(eids, components))
+        self._change_tick += 1
+        tick = self._change_tick
+        ticks = self._change_ticks.setdefault(component_type, {})
+        for eid in eids:
+            ticks.pop(eid, None)
+            ticks[eid] = tick
+        rel = self._relation_index(component_type)
+        if rel is not None:
+            for eid, component in zip(eids, components):
+                rel.link(eid, component)
+        self._invalidate_views_involving(component_type)
+
     def remove_component(self, eid: EntityId, component_type: Type[Any]) -> None:
         store = self._components.get(component_type)
         if store is not None and eid in store:
             del store[eid]
+            self._forget_change(component_type, eid)
+            rel = self._relation_index(component_type)
+            if rel is not None:
+                rel.unlink(eid)
             self._invalidate_views_involving(component_type)
 
     def get_components(self, component_type: Type[TComponent]) -> Dict[EntityId, TComponent]:
         """Direct access to the raw dict for a single component type."""
         return self._components.setdefault(component_type, {})
 
+    # ------------------------------------------------------------------
+    # Change detection
+    # ------------------------------------------------------------------
+    @property
+    def change_tick(self) -> int:
+        """Current change counter; remember it to query changed() later."""
+        return self._change_tick
+
+    def mark_changed(self, eid: EntityId, component_type: Type[Any]) -> None:
+        """Stamp a component as changed (call after editing it in place)."""
+        self._change_tick += 1
+        ticks = self._change_ticks.setdefault(component_type, {})
+        ticks.pop(eid, None)
+        ticks[eid] = self._change_tick
+
+    def mark_all_changed(self, component_type: Type[Any]) -> None:
+        """Stamp every component of a type as changed in O(1).
+
+        For systems that edit most of a store in place each frame (movement,
+        AI); cheaper than calling mark_changed() per entity.
+        """
+        self._change_tick += 1
+        self._bulk_ticks[component_type] = self._change_tick
+
+    def get_mut(self, eid: EntityId, component_type: Type[TComponent]) -> Optional[TComponent]:
+        """Return a component for writing and mark it changed (None if absent)."""
+        component = self._components.get(component_type, {}).get(eid)
+        if component is not None:
+            self.mark_changed(eid, component_type)
+        return component
+
+    def changed(self, component_type: Type[TComponent], since_tick: int) -> List[Tuple[EntityId, TComponent]]:
+        """(eid, component) pairs added or marked changed after `since_tick`, oldest first.
+
+        Only explicit writes are seen: add_component(), add_components(),
+        mark_changed(), mark_all_changed() and get_mut(). Plain attribute
+        edits are invisible. After mark_all_changed() the whole store is
+        returned, in store order.
+        """
+        if self._bulk_ticks.get(component_type, 0) > since_tick:
+            return list(self._components.get(component_type, {}).items())
+        ticks = self._change_ticks.get(component_type)
+        if not ticks:
+            return []
+        store = self._components.get(component_type, {})
+        out: List[Tuple[EntityId, TComponent]] = []
+        for eid, tick in reversed(ticks.items()):
+            if tick <= since_tick:
+                break
+            out.append((eid, store[eid]))
+        out.reverse()
+        return out
+
+    def last_change(self, component_type: Type[Any], include_bulk: bool = True) -> int:
+        """Tick of the most recent add/mark/removal for a component type (0 if never).
+
+        include_bulk=False ignores mark_all_changed(), for readers that only
+        care about entities the bulk writers never touch (e.g. static rects,
+        which the movement system's bulk Position marks do not cover).
+        """
+        last = self._removal_ticks.get(component_type, 0)
+        if include_bulk:
+            last = max(last, self._bulk_ticks.get(component_type, 0))
+        ticks = self._change_ticks.get(component_type)
+        if ticks:
+            last = max(last, next(reversed(ticks.values())))
+        return last
+
+    def last_removal(self, component_type: Type[Any]) -> int:
+        """Tick of the most recent removal from a component store (0 if never)."""
+        return self._removal_ticks.get(component_type, 0)
+
+    def _forget_change(self, component_type: Type[Any], eid: EntityId) -> None:
+        ticks = self._change_ticks.get(component_type)
+        if ticks is not None:
+            ticks.pop(eid, None)
+        self._change_tick += 1
+        self._removal_ticks[component_type] = self._change_tick
+
+    # ------------------------------------------------------------------
+    # Relationships
+    # ------------------------------------------------------------------
+    def children(self, link_type: Type[Any], parent: EntityId) -> Set[EntityId] | frozenset:
+        """Entities whose `link_type` component points at `parent`.
+
+        Returns the live index set; copy it before destroying entities
+        while iterating.
+        """
+        return self._require_relation(link_type).children(parent)
+
+    def parent(self, link_type: Type[Any], child: EntityId) -> Optional[EntityId]:
+        """The entity that `child`'s `link_type` component points at, if any."""
+        return self._require_relation(link_type).parent(child)
+
+    def relink(self, eid: EntityId, link_type: Type[Any]) -> None:
+        """Refresh the index after a link component's parent field was edited in place."""
+        rel = self._require_relation(link_type)
+        component = self._components.get(link_type, {}).get(eid)
+        if component is None:
+            rel.unlink(eid)
+        else:
+            rel.link(eid, component)
+
+    def _relation_index(self, component_type: Type[Any]) -> Optional[RelationIndex]:
+        rel = self._relations.get(component_type)
+        if rel is None:
+            rel = RelationIndex.for_component(component_type) or _NOT_A_LINK
+            self._relations[component_type] = rel
+        return None if rel is _NOT_A_LINK else rel
+
+    def _require_relation(self, link_type: Type[Any]) -> RelationIndex:
+        rel = self._relation_index(link_type)
+        if rel is None:
+            raise TypeError(f"{link_type.__name__} is not a @parent_link component")
+        return rel
+
     # ------------------------------------------------------------------
     # Views
     # ------------------------------------------------------------------
@@ -98,7 +292,7 @@ class World:
     # Commands
     # ------------------------------------------------------------------
     def queue_command(self, cmd: Any) -> None:
-        """Queue a command to be applied later (CreateEntityCmd, DestroyEntityCmd)."""
+        """Queue a command to be applied later (CreateEntityCmd, CreateEntitiesCmd, DestroyEntityCmd)."""
         self._command_queue.append(cmd)
 
     def flush_commands(self) -> None:
@@ -107,15 +301,21 @@ class World:
         This should be called exactly once per frame by the Scheduler,
         typically after the 'post_update' phase.
         """
+        # Swap the queue out instead of pop(0) so large batches stay O(n).
+        # Commands queued while flushing are applied in the same flush.
         while self._command_queue:
-            cmd = self._command_queue.pop(0)
-            if isinstance(cmd, CreateEntityCmd):
-                self._apply_create_entity(cmd)
-            elif isinstance(cmd, DestroyEntityCmd):
-                # canonical field name is 'entity_id'
-                self.destroy_entity(EntityId(cmd.entity_id))
-            else:
-                raise TypeError(f"Unknown command type: {type(cmd)!r}")
+            queue = self._command_queue
+            self._command_queue = []
+            for cmd in queue:
+                if isinstance(cmd, CreateEntityCmd):
+                    self._apply_create_entity(cmd)
+                elif isinstance(cmd, CreateEntitiesCmd):
+                    self._apply_create_entities(cmd)
+                elif isinstance(cmd, DestroyEntityCmd):
+                    # canonical field name is 'entity_id'
+                    self.destroy_entity(EntityId(cmd.entity_id))
+                else:
+                    raise TypeError(f"Unknown command type: {type(cmd)!r}")
 
     def _apply_create_entity(self, cmd: CreateEntityCmd) -> EntityId:
         """Create a new entity and attach all components from cmd.components.
@@ -128,3 +328,10 @@ class World:
         for component in cmd.components.values():
             self.add_component(eid, component)
         return eid
+
+    def _apply_create_entities(self, cmd: CreateEntitiesCmd) -> List[EntityId]:
+        """Create cmd.count entities and attach each component column at once."""
+        eids = self.create_entities(cmd.count)
+        for ctype, column in cmd.components.items():
+            self.add_components(ctype, eids, column)
+        return eids
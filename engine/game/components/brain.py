@@ -9,11 +9,13 @@ class Brain:
 
     Fields:
       - state: current state name ("idle", "cruise", ...)
-      - time_in_state: seconds spent in current state
+      - entered_at: FishFSMSystem clock (simulated seconds) when the
+        current state began; time in state is derived from it, so a brain
+        only changes when its state does
       - state_duration: planned duration of current state
       - initialized: whether on_enter has run at least once for the current state
     """
     state: str = "idle"
-    time_in_state: float = 0.0
+    entered_at: float = 0.0
     state_duration: float = 0.0
     initialized: bool = False
@@ -1,11 +1,15 @@
 # engine/game/components/in_tank.py
 from dataclasses import dataclass
-from engine.ecs import EntityId
+from engine.ecs import EntityId, parent_link
 
+@parent_link("tank", cascade_destroy=True)
 @dataclass
 class InTank:
     """
     Links an entity (fish, pellet, plant, etc.) to a specific tank entity.
     This lets systems operate per tank without global state.
+
+    The World indexes this link both ways (world.children / world.parent),
+    and destroying a tank destroys everything linked to it.
     """
     tank: EntityId
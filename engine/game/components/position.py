@@ -4,5 +4,12 @@ from dataclasses import dataclass
 
 @dataclass
 class Position:
+    """
+    Logical-space position of an entity.
+
+    Static rects (no Velocity) are redrawn only when their Position or
+    RectSprite is marked changed; edit them through world.get_mut() or
+    call world.mark_changed() after an in-place edit.
+    """
     x: float
     y: float
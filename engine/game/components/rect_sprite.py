@@ -11,6 +11,10 @@ class RectSprite:
     Very simple sprite definition for MVP:
     - width, height in pixels
     - solid fill color (RGB)
+
+    Rects without a Velocity are drawn from cached static layers, so an
+    in-place edit of a static rect only shows up once it is marked
+    (world.get_mut() or world.mark_changed()).
     """
     width: float
     height: float
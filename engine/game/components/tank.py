@@ -5,6 +5,11 @@ from dataclasses import dataclass
 class Tank:
     """
     Logical tank properties (identity + rules).
+
+    visible:
+        Hidden tanks keep simulating, but CullingSystem skips rendering
+        everything inside them.
     """
     tank_id: str
     max_fish: int
+    visible: bool = True
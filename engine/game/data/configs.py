@@ -1,6 +1,6 @@
 # engine/game/data/configs.py
 from __future__ import annotations
-from typing import Any, Dict
+from typing import Any, Dict, Set
 from .jsonio import load_json
 
 
@@ -51,3 +51,34 @@ def load_movement_config() -> Dict[str, Any]:
     Movement tuning (max acceleration, max speed).
     """
     return load_json("movement.json")
+
+
+def load_asset_manifest() -> Dict[str, Any]:
+    """
+    Asset manifest: base path + {sprite_id: file} for every loadable image.
+    """
+    return load_json("assets.json")
+
+
+def referenced_sprite_ids(
+    species_cfg: Dict[str, Any],
+    pellet_cfg: Dict[str, Any],
+    ui_cfg: Dict[str, Any],
+) -> Set[str]:
+    """
+    Collect every sprite id the game data can ask the renderer for.
+
+    `species_cfg` is the species map returned by load_species_config().
+    """
+    ids: Set[str] = set()
+    for species in species_cfg.values():
+        if species.get("sprite_id"):
+            ids.add(species["sprite_id"])
+    pellet = pellet_cfg.get("pellet", {})
+    if pellet.get("sprite_id"):
+        ids.add(pellet["sprite_id"])
+    for comp in ui_cfg.get("components", []):
+        icon = comp.get("icon") or {}
+        if icon.get("sprite_id"):
+            ids.add(icon["sprite_id"])
+    return ids
@@ -0,0 +1,234 @@
+# engine/game/data/registry.py
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from .jsonio import DATA_DIR
+
+# Bump when the frozen layout or validation rules change so old pickles
+# are recompiled instead of trusted.
+COMPILED_VERSION = 1
+DEFAULT_CACHE_DIR = Path(".cache") / "config"
+
+# Logical config name -> data file.
+CONFIG_FILES: Dict[str, str] = {
+    "settings": "settings.json",
+    "ui": "ui.json",
+    "debug_panels": "debug_panels.json",
+    "species": "species.json",
+    "tanks": "tanks.json",
+    "pellets": "pellets.json",
+    "falling": "falling.json",
+    "fsm": "fsm.json",
+    "movement": "movement.json",
+    "assets": "assets.json",
+}
+
+
+class ConfigError(ValueError):
+    """A data file failed validation."""
+
+
+# ----------------------------------------------------------------------
+# Frozen values
+# ----------------------------------------------------------------------
+class FrozenDict(dict):
+    """
+    Read-only dict. Still a dict (json-compatible, isinstance checks and
+    .get() keep working) but every mutating method raises TypeError.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("config data is read-only")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo) -> "FrozenDict":
+        return self
+
+
+def freeze(value: Any) -> Any:
+    """Recursively turn dicts into FrozenDicts and lists into tuples."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+# ----------------------------------------------------------------------
+# Validation
+# ----------------------------------------------------------------------
+def _validate_ui(cfg: dict) -> None:
+    styles = cfg.get("styles", {})
+    for comp in cfg.get("components", []):
+        if "type" not in comp:
+            raise ConfigError("UI component missing 'type'")
+        style_key = comp.get("style")
+        if style_key is not None and style_key not in styles:
+            raise ConfigError(
+                f"UI component {comp.get('id', comp['type'])!r} references unknown style {style_key!r}"
+            )
+        if comp["type"] not in ("label",) and ("width" not in comp or "height" not in comp):
+            raise ConfigError(
+                f"UI component {comp.get('id', comp['type'])!r} must define width/height"
+            )
+
+
+def _validate_species(cfg: dict) -> None:
+    for species_id, species in cfg.get("species", {}).items():
+        for key in ("width", "height"):
+            if key not in species:
+                raise ConfigError(f"species {species_id!r} must define {key!r}")
+
+
+def _validate_tanks(cfg: dict) -> None:
+    for tank_id, tank in (cfg.get("tanks") or {}).items():
+        bounds = tank.get("bounds")
+        if not (isinstance(bounds, (list, tuple)) and len(bounds) == 4):
+            raise ConfigError(f"Tank {tank_id!r} is missing a 4-element 'bounds' list.")
+
+
+VALIDATORS: Dict[str, Callable[[dict], None]] = {
+    "ui": _validate_ui,
+    "species": _validate_species,
+    "tanks": _validate_tanks,
+}
+
+
+# ----------------------------------------------------------------------
+# Registry
+# ----------------------------------------------------------------------
+class ConfigRegistry:
+    """
+    Loads each data file once, validates it and keeps a frozen copy.
+
+    Compiled (validated + frozen) results are also pickled to `cache_dir`,
+    keyed by the source file's mtime/size and content hash, so the next
+    process that builds an engine skips JSON parsing and validation.
+    Pass cache_dir=None to keep everything in memory only.
+    """
+
+    def __init__(self, data_dir: Path = DATA_DIR, cache_dir: Optional[Path] = DEFAULT_CACHE_DIR) -> None:
+        self.data_dir = Path(data_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._values: Dict[str, FrozenDict] = {}
+        # name -> (mtime_ns, size) of the file the value was compiled from
+        self._stamps: Dict[str, tuple[int, int]] = {}
+
+    def path(self, name: str) -> Path:
+        return self.data_dir / CONFIG_FILES[name]
+
+    def get(self, name: str) -> FrozenDict:
+        value = self._values.get(name)
+        if value is None:
+            value = self._load(name)
+        return value
+
+    def reload(self, name: str) -> bool:
+        """Re-read `name` if its file changed on disk; True if the value changed."""
+        path = self.path(name)
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if self._stamps.get(name) == (stat.st_mtime_ns, stat.st_size):
+            return False
+        old = self._values.get(name)
+        new = self._load(name)
+        return new != old
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _load(self, name: str) -> FrozenDict:
+        path = self.path(name)
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._read_compiled(name)
+        value = None
+        if cached is not None and cached.get("stamp") == stamp:
+            value = cached["value"]
+        else:
+            data = path.read_bytes()
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            if cached is not None and cached.get("digest") == digest:
+                # Touched but unchanged: reuse and refresh the stamp.
+                value = cached["value"]
+            else:
+                raw = json.loads(data.decode("utf-8"))
+                validator = VALIDATORS.get(name)
+                if validator is not None:
+                    validator(raw)
+                value = freeze(raw)
+            self._write_compiled(name, {"stamp": stamp, "digest": digest, "value": value})
+
+        self._values[name] = value
+        self._stamps[name] = stamp
+        return value
+
+    def _compiled_path(self, name: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        # Keyed by the resolved source path too, so registries over
+        # different data dirs can share one cache_dir.
+        source = hashlib.blake2b(str(self.path(name).resolve()).encode("utf-8"), digest_size=8).hexdigest()
+        return self.cache_dir / f"{name}.{source}.v{COMPILED_VERSION}.pickle"
+
+    def _read_compiled(self, name: str) -> Optional[dict]:
+        path = self._compiled_path(name)
+        if path is None:
+            return None
+        try:
+            with path.open("rb") as f:
+                cached = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        return cached if isinstance(cached, dict) else None
+
+    def _write_compiled(self, name: str, payload: dict) -> None:
+        path = self._compiled_path(name)
+        if path is None:
+            return
+        tmp: Optional[str] = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique temp name: other processes may be compiling the same file.
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+            ) as f:
+                tmp = f.name
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            # Read-only checkout: fall back to in-memory only.
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+
+
+_default_registry: Optional[ConfigRegistry] = None
+
+
+def get_config_registry() -> ConfigRegistry:
+    """Process-wide registry shared by every build_engine() call."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = ConfigRegistry()
+    return _default_registry
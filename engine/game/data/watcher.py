@@ -0,0 +1,46 @@
+# engine/game/data/watcher.py
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+from .registry import ConfigRegistry
+
+
+class ConfigWatcher:
+    """
+    Polls data file mtimes and reloads changed files into a ConfigRegistry.
+
+    poll() returns the names whose value actually changed. A file that fails
+    to read, parse or validate keeps its previous value and is not retried
+    until it is modified again (`errors` holds the last failure per name).
+    Read failures include files an editor deletes or renames mid-save,
+    after poll() saw the new stamp.
+    """
+
+    def __init__(self, registry: ConfigRegistry, names: Iterable[str]) -> None:
+        self.registry = registry
+        self.names = list(names)
+        self.errors: Dict[str, Exception] = {}
+        self._stamps: Dict[str, Tuple[int, int]] = {name: self._stamp(name) for name in self.names}
+
+    def _stamp(self, name: str) -> Tuple[int, int]:
+        try:
+            stat = self.registry.path(name).stat()
+        except OSError:
+            return (0, 0)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def poll(self) -> List[str]:
+        changed: List[str] = []
+        for name in self.names:
+            stamp = self._stamp(name)
+            if stamp == self._stamps.get(name):
+                continue
+            self._stamps[name] = stamp
+            try:
+                if self.registry.reload(name):
+                    changed.append(name)
+                self.errors.pop(name, None)
+            except (OSError, ValueError) as exc:  # I/O races, JSONDecodeError, ConfigError
+                self.errors[name] = exc
+        return changed
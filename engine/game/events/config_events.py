@@ -0,0 +1,9 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ConfigChanged:
+    """A data file was reloaded; `resource` now holds the new (frozen) value."""
+    name: str
+    resource: str
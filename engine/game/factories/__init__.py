@@ -1,5 +1,5 @@
 # engine/game/factories/__init__.py
-from .fish_factory import load_species_config, create_fish
+from .fish_factory import load_species_config, create_fish, create_fish_batch
 from .tank_factory import create_tank, load_tank_config
 
-__all__ = ["load_species_config", "create_fish", "create_tank", "load_tank_config"]
+__all__ = ["load_species_config", "create_fish", "create_fish_batch", "create_tank", "load_tank_config"]
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import random
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Sequence
 
 from engine.ecs import World, EntityId
 from engine.game.components import (
@@ -82,3 +82,50 @@ def create_fish(
     world.add_component(eid, MovementIntent())
 
     return eid
+
+
+def create_fish_batch(
+    world: World,
+    species_cfg: SpeciesConfigMap,
+    species_id: str,
+    positions: Iterable[Sequence[float]],
+    rng: random.Random,
+) -> List[EntityId]:
+    """
+    Create one fish per (x, y) in `positions`, writing components column-wise.
+
+    Produces the same component set as create_fish, but allocates all entity
+    ids in one step and attaches each component type with a single
+    world.add_components() call. `positions` may be any iterable of pairs,
+    e.g. a list of tuples or an (N, 2) array.
+    """
+    spec = species_cfg[species_id]
+
+    width = float(spec["width"])
+    height = float(spec["height"])
+    color = tuple(spec["color"])
+    sprite_id = spec.get("sprite_id")
+
+    coords = [(float(p[0]), float(p[1])) for p in positions]
+    eids = world.create_entities(len(coords))
+    if not eids:
+        return eids
+
+    world.add_components(Position, eids, [Position(x=x, y=y) for x, y in coords])
+    world.add_components(Velocity, eids, [Velocity(vx=0.0, vy=0.0) for _ in eids])
+    world.add_components(
+        RectSprite,
+        eids,
+        [RectSprite(width=width, height=height, color=color) for _ in eids],
+    )
+    if sprite_id:
+        world.add_components(
+            SpriteRef,
+            eids,
+            [SpriteRef(sprite_id=sprite_id, width=width, height=height) for _ in eids],
+        )
+    world.add_components(Fish, eids, [Fish(species_id=species_id) for _ in eids])
+    world.add_components(Brain, eids, [Brain() for _ in eids])
+    world.add_components(MovementIntent, eids, [MovementIntent() for _ in eids])
+
+    return eids
@@ -1,28 +1,22 @@
 from __future__ import annotations
 import random
-from typing import Mapping, Any, Iterable
+from typing import Mapping, Any, Iterable, Sequence
 
 from engine.ecs import World, EntityId
-from engine.ecs.commands import CreateEntityCmd
+from engine.ecs.commands import CreateEntityCmd, CreateEntitiesCmd
 from engine.game.components import Position, RectSprite, SpriteRef, InTank, Velocity
 from engine.game.components.pellet import Pellet
 from engine.game.components.falling import Falling
 
-def create_pellet_cmd(
+
+def _pellet_components(
     x: float,
     y: float,
     tank_eid: EntityId,
-    pellet_cfg: Mapping[str, Any] | None = None,
-    rng: random.Random | None = None,
-) -> CreateEntityCmd:
-    """
-    Build a queued entity command for a pellet at logical coords (x, y).
-
-    pellet_cfg keys (all optional):
-      - size: float
-      - color: [r, g, b]
-      - sprite_id: str
-    """
+    cfg: Mapping[str, Any],
+    rng: random.Random | None,
+) -> dict:
+    """Build the component dict for one pellet (shared by single + batch commands)."""
     def _pick(cfg: Mapping[str, Any], key: str, default=None):
         range_key = f"{key}_range"
         if range_key in cfg:
@@ -32,7 +26,6 @@ def create_pellet_cmd(
             return cfg[key]
         return default
 
-    cfg = pellet_cfg or {}
     size = float(cfg.get("size", 12.0))
     color_val: Iterable[Any] = cfg.get("color", (0, 0, 0))
     color_tuple = tuple(color_val)
@@ -59,4 +52,43 @@ def create_pellet_cmd(
     }
     if sprite_id:
         components[SpriteRef] = SpriteRef(sprite_id=sprite_id, width=size, height=size)
-    return CreateEntityCmd(components)
+    return components
+
+
+def create_pellet_cmd(
+    x: float,
+    y: float,
+    tank_eid: EntityId,
+    pellet_cfg: Mapping[str, Any] | None = None,
+    rng: random.Random | None = None,
+) -> CreateEntityCmd:
+    """
+    Build a queued entity command for a pellet at logical coords (x, y).
+
+    pellet_cfg keys (all optional):
+      - size: float
+      - color: [r, g, b]
+      - sprite_id: str
+    """
+    return CreateEntityCmd(_pellet_components(x, y, tank_eid, pellet_cfg or {}, rng))
+
+
+def create_pellets_cmd(
+    positions: Iterable[Sequence[float]],
+    tank_eid: EntityId,
+    pellet_cfg: Mapping[str, Any] | None = None,
+    rng: random.Random | None = None,
+) -> CreateEntitiesCmd:
+    """
+    Build one batched command creating a pellet at each (x, y) in `positions`.
+
+    Random draws happen in the same order as repeated create_pellet_cmd calls,
+    so a batch is reproducible against the one-at-a-time path.
+    """
+    cfg = pellet_cfg or {}
+    columns: dict = {}
+    for p in positions:
+        comps = _pellet_components(float(p[0]), float(p[1]), tank_eid, cfg, rng)
+        for ctype, comp in comps.items():
+            columns.setdefault(ctype, []).append(comp)
+    return CreateEntitiesCmd(columns)
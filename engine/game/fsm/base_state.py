@@ -24,6 +24,13 @@ class FishState(ABC):
     #: Human-/debug-readable state name. Must be unique per state type.
     name: str
 
+    #: FishFSMSystem clock (simulated seconds), set before each update.
+    now: float = 0.0
+
+    def time_in_state(self, brain: Brain) -> float:
+        """Seconds `brain` has spent in its current state."""
+        return self.now - brain.entered_at
+
     @abstractmethod
     def on_enter(
         self,
@@ -38,7 +45,7 @@ class FishState(ABC):
         Called exactly once when entering this state.
 
         Should:
-          - initialise timers on Brain (time_in_state, state_duration)
+          - initialise timers on Brain (entered_at = self.now, state_duration)
           - set up initial MovementIntent, if relevant
         """
         raise NotImplementedError
@@ -81,3 +88,11 @@ class FishState(ABC):
         Use this for cleanup / bookkeeping if needed.
         """
         raise NotImplementedError
+
+    # Persistence hooks (FishFSMSystem forwards these to world snapshots).
+    def snapshot_state(self):
+        """Picklable per-fish bookkeeping kept outside components, if any."""
+        return None
+
+    def restore_state(self, state) -> None:
+        """Inverse of snapshot_state()."""
@@ -34,6 +34,35 @@ class CruiseState(FishState):
         transition_weights=None,
         fallback_next: str = "idle",
     ) -> None:
+        # Per-fish targets & speeds while cruising
+        self._targets: Dict[EntityId, Tuple[float, float]] = {}
+        self._speeds: Dict[EntityId, float] = {}
+
+        self.configure(
+            duration_range,
+            species_cfg,
+            default_speed,
+            inner_margin=inner_margin,
+            fallback_radius=fallback_radius,
+            retarget_min_distance=retarget_min_distance,
+            retarget_distance_factor=retarget_distance_factor,
+            transition_weights=transition_weights,
+            fallback_next=fallback_next,
+        )
+
+    def configure(
+        self,
+        duration_range,
+        species_cfg: Dict[str, Dict],
+        default_speed: float,
+        inner_margin: float = 40.0,
+        fallback_radius: float = 60.0,
+        retarget_min_distance: float = 5.0,
+        retarget_distance_factor: float = 0.2,
+        transition_weights=None,
+        fallback_next: str = "idle",
+    ) -> None:
+        """(Re)bind tuning parameters; per-fish targets and speeds are kept."""
         self._dur_min = float(duration_range[0])
         self._dur_max = float(duration_range[1])
         self._species_cfg = species_cfg or {}
@@ -45,9 +74,12 @@ class CruiseState(FishState):
         self._transition_weights = transition_weights or {}
         self._fallback_next = fallback_next
 
-        # Per-fish targets & speeds while cruising
-        self._targets: Dict[EntityId, Tuple[float, float]] = {}
-        self._speeds: Dict[EntityId, float] = {}
+    def snapshot_state(self):
+        return {"targets": dict(self._targets), "speeds": dict(self._speeds)}
+
+    def restore_state(self, state) -> None:
+        self._targets = dict(state.get("targets", {}))
+        self._speeds = dict(state.get("speeds", {}))
 
     # --- Helpers -------------------------------------------------------------
 
@@ -71,13 +103,10 @@ class CruiseState(FishState):
         configurable margin from the walls. If we can't find tank bounds,
         pick a point in a small radius around the current position.
         """
-        in_tank_store = world.get_components(InTank)
-        tank_bounds_store = world.get_components(TankBounds)
-
-        in_tank = in_tank_store.get(eid)
         bounds = None
-        if in_tank is not None:
-            bounds = tank_bounds_store.get(in_tank.tank)
+        tank_eid = world.parent(InTank, eid)
+        if tank_eid is not None:
+            bounds = world.get_components(TankBounds).get(tank_eid)
 
         if bounds is not None:
             margin = self._inner_margin
@@ -121,7 +150,7 @@ class CruiseState(FishState):
         intent: MovementIntent,
         rng: random.Random,
     ) -> None:
-        brain.time_in_state = 0.0
+        brain.entered_at = self.now
         brain.state_duration = self._choose_duration(rng)
 
         speed = self._choose_speed(fish, rng)
@@ -164,7 +193,7 @@ class CruiseState(FishState):
         rng: random.Random,
     ) -> str | None:
         # Transition out when cruise duration is over
-        if brain.time_in_state >= brain.state_duration:
+        if self.time_in_state(brain) >= brain.state_duration:
             return _pick_weighted_next(self._transition_weights, rng, self._fallback_next)
 
         pos_store = world.get_components(Position)
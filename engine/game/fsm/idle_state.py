@@ -20,6 +20,10 @@ class IdleState(FishState):
     name = "idle"
 
     def __init__(self, duration_range, transition_weights, fallback_next: str = "cruise") -> None:
+        self.configure(duration_range, transition_weights, fallback_next)
+
+    def configure(self, duration_range, transition_weights, fallback_next: str = "cruise") -> None:
+        """(Re)bind tuning parameters; safe to call while fish are idling."""
         self._dur_range = duration_range
         self._transition_weights = transition_weights or {}
         self._fallback_next = fallback_next
@@ -33,7 +37,7 @@ class IdleState(FishState):
         intent: MovementIntent,
         rng: random.Random,
     ) -> None:
-        brain.time_in_state = 0.0
+        brain.entered_at = self.now
         lo, hi = self._dur_range if isinstance(self._dur_range, (list, tuple)) else (self._dur_range, self._dur_range)
         brain.state_duration = rng.uniform(float(lo), float(hi))
         intent.target_vx = 0.0
@@ -50,8 +54,8 @@ class IdleState(FishState):
         dt: float,
         rng: random.Random,
     ) -> str | None:
-        # time_in_state is advanced by the FSM system before this call
-        if brain.time_in_state >= brain.state_duration:
+        # `now` is advanced by the FSM system before this call
+        if self.time_in_state(brain) >= brain.state_duration:
             return _pick_weighted_next(self._transition_weights, rng, self._fallback_next)
         return None
 
@@ -2,7 +2,15 @@
 from .population import (
     count_fish_in_tank,
     can_spawn_fish_in_tank,
+    remaining_fish_capacity,
     spawn_fish_in_tank_if_allowed,
+    spawn_fish_batch,
 )
 
-__all__ = ["count_fish_in_tank", "can_spawn_fish_in_tank", "spawn_fish_in_tank_if_allowed"]
+__all__ = [
+    "count_fish_in_tank",
+    "can_spawn_fish_in_tank",
+    "remaining_fish_capacity",
+    "spawn_fish_in_tank_if_allowed",
+    "spawn_fish_batch",
+]
@@ -1,21 +1,19 @@
 # engine/game/rules/population.py
 from __future__ import annotations
-from typing import Optional
+from typing import Iterable, List, Optional, Sequence
 from engine.ecs import World, EntityId
 from engine.game.components.fish import Fish
 from engine.game.components.in_tank import InTank
 from engine.game.components.tank import Tank
-from engine.game.factories import create_fish
+from engine.game.factories import create_fish, create_fish_batch
 
 def count_fish_in_tank(world: World, tank_eid: EntityId) -> int:
     """
     Count how many Fish are in a given tank (by InTank.tank).
+    Walks only that tank's children via the world's InTank relation index.
     """
-    count = 0
-    for eid, fish, in_tank in world.view(Fish, InTank):
-        if in_tank.tank == tank_eid:
-            count += 1
-    return count
+    fish_store = world.get_components(Fish)
+    return sum(1 for eid in world.children(InTank, tank_eid) if eid in fish_store)
 
 def can_spawn_fish_in_tank(world: World, tank_eid: EntityId) -> bool:
     """
@@ -31,6 +29,16 @@ def can_spawn_fish_in_tank(world: World, tank_eid: EntityId) -> bool:
     current = count_fish_in_tank(world, tank_eid)
     return current < tank.max_fish
 
+def remaining_fish_capacity(world: World, tank_eid: EntityId) -> Optional[int]:
+    """
+    How many more fish the tank accepts, or None when it has no Tank component
+    (same 'no cap' rule as can_spawn_fish_in_tank).
+    """
+    tank = world.get_components(Tank).get(tank_eid)
+    if tank is None:
+        return None
+    return max(0, tank.max_fish - count_fish_in_tank(world, tank_eid))
+
 def spawn_fish_in_tank_if_allowed(
     world: World,
     tank_eid: EntityId,
@@ -53,6 +61,32 @@ def spawn_fish_in_tank_if_allowed(
     fish_eid = create_fish(world, species_cfg, species_id, x, y, rng)
 
     # Attach tank link
-    from engine.game.components.in_tank import InTank  # local import to avoid cycles
     world.add_component(fish_eid, InTank(tank=tank_eid))
     return fish_eid
+
+def spawn_fish_batch(
+    world: World,
+    tank_eid: EntityId,
+    species_cfg,
+    species_id: str,
+    positions: Iterable[Sequence[float]],
+    rng,
+) -> List[EntityId]:
+    """
+    Bulk counterpart of spawn_fish_in_tank_if_allowed.
+
+    - Checks the tank's max_fish once for the whole batch.
+    - Spawns fish for the leading positions up to the remaining capacity;
+      the rest are dropped.
+    - Returns the new entity ids (possibly empty).
+    """
+    positions = list(positions)
+    remaining = remaining_fish_capacity(world, tank_eid)
+    if remaining is not None:
+        positions = positions[:remaining]
+    if not positions:
+        return []
+
+    eids = create_fish_batch(world, species_cfg, species_id, positions, rng)
+    world.add_components(InTank, eids, [InTank(tank=tank_eid) for _ in eids])
+    return eids
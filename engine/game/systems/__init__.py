@@ -12,6 +12,9 @@ from .ui_label_system import UILabelSystem
 from .debug_menu_system import DebugManagerSystem
 from .fish_state_label_system import FishStateLabelSystem
 from .movement_debug_system import MovementDebugSystem
+from .culling_system import CullingSystem
+from .config_reload_system import ConfigReloadSystem
+from .shared_columns_system import SharedColumnsSystem
 
 __all__ = [
     "MovementSystem",
@@ -27,4 +30,7 @@ __all__ = [
     "DebugManagerSystem",
     "FishStateLabelSystem",
     "MovementDebugSystem",
+    "CullingSystem",
+    "ConfigReloadSystem",
+    "SharedColumnsSystem",
 ]
@@ -0,0 +1,51 @@
+# engine/game/systems/config_reload_system.py
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Tuple
+
+from engine.ecs import System, World
+from engine.resources import ResourceStore
+from engine.game.data.watcher import ConfigWatcher
+from engine.game.events.config_events import ConfigChanged
+
+# Config name -> (resource key, projection of the file into that resource).
+# Only configs that systems read at runtime are listed; settings, tanks and
+# assets shape the world at boot and still need a restart.
+HOT_RELOADABLE: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    "movement": ("movement_config", lambda cfg: cfg),
+    "fsm": ("fsm_config", lambda cfg: cfg),
+    "falling": ("falling_config", lambda cfg: cfg),
+    "pellets": ("pellet_config", lambda cfg: cfg),
+    "species": ("species_config", lambda cfg: cfg.get("species", {})),
+    "ui": ("ui_styles", lambda cfg: cfg.get("styles", {})),
+}
+
+
+class ConfigReloadSystem(System):
+    """
+    Polls data files every `poll_interval` seconds (pre_update). Changed
+    files are reloaded into the config registry, the matching resource is
+    swapped and a ConfigChanged event is published so systems can rebind
+    cached parameters. The world itself is never touched.
+    """
+
+    phase = "pre_update"
+
+    def __init__(self, resources: ResourceStore, poll_interval: float = 0.5) -> None:
+        super().__init__(resources)
+        self.poll_interval = float(poll_interval)
+        self._elapsed = 0.0
+        self._watcher = ConfigWatcher(resources.get("config_registry"), HOT_RELOADABLE)
+
+    def update(self, world: World, dt: float) -> None:
+        self._elapsed += dt
+        if self._elapsed < self.poll_interval:
+            return
+        self._elapsed = 0.0
+
+        registry = self._watcher.registry
+        bus = self.resources.get("events")
+        for name in self._watcher.poll():
+            resource, project = HOT_RELOADABLE[name]
+            self.resources.set(resource, project(registry.get(name)))
+            bus.publish(ConfigChanged(name=name, resource=resource))
@@ -0,0 +1,68 @@
+# engine/game/systems/culling_system.py
+from __future__ import annotations
+
+from engine.ecs import System, World
+from engine.resources import ResourceStore, get_viewport
+from engine.game.components import InTank, Position, RectSprite, SpriteRef, Tank, TankBounds
+
+
+class CullingSystem(System):
+    """
+    First render-phase system: decides which tank contents are off screen.
+
+    Publishes the "culled_entities" resource (a set of entity ids) that the
+    render systems skip. Work is done per tank through the InTank relation
+    index:
+      - hidden tanks, or tanks whose bounds miss the visible logical rect,
+        cull all of their children without looking at them individually;
+      - otherwise each child's bounds (Position + RectSprite/SpriteRef size)
+        is tested against the visible rect.
+
+    Entities outside any tank (UI, the tanks themselves) are never culled.
+    """
+
+    phase = "render"
+
+    def update(self, world: World, dt: float) -> None:
+        resources: ResourceStore = self.resources  # type: ignore[assignment]
+
+        vx, vy, vw, vh = get_viewport(resources).visible_logical_rect
+        view_x2 = vx + vw
+        view_y2 = vy + vh
+
+        pos_store = world.get_components(Position)
+        rect_store = world.get_components(RectSprite)
+        sprite_store = world.get_components(SpriteRef)
+        bounds_store = world.get_components(TankBounds)
+
+        culled: set[int] = set()
+        for tank_eid, tank in world.get_components(Tank).items():
+            children = world.children(InTank, tank_eid)
+            if not children:
+                continue
+
+            bounds = bounds_store.get(tank_eid)
+            if not tank.visible or (
+                bounds is not None
+                and (
+                    bounds.x > view_x2
+                    or bounds.y > view_y2
+                    or bounds.x + bounds.width < vx
+                    or bounds.y + bounds.height < vy
+                )
+            ):
+                culled.update(children)
+                continue
+
+            # Tank (partly) visible: test children one by one.
+            for eid in children:
+                pos = pos_store.get(eid)
+                if pos is None:
+                    continue
+                size = rect_store.get(eid) or sprite_store.get(eid)
+                w = size.width if size is not None else 0.0
+                h = size.height if size is not None else 0.0
+                if pos.x > view_x2 or pos.y > view_y2 or pos.x + w < vx or pos.y + h < vy:
+                    culled.add(eid)
+
+        resources.set("culled_entities", culled)
@@ -70,10 +70,13 @@ class DebugManagerSystem(System):
         for provider in self.registry.text_providers:
             text_map.update(provider(world, self.resources))
 
-        for _, label in world.view(UILabel):
+        for eid, label in world.view(UILabel):
             key = label.text_key or label.text
-            if key in text_map:
-                label.text = text_map[key]
+            text = text_map.get(key)
+            # Skip no-op rewrites so label consumers only see real changes.
+            if text is not None and text != label.text:
+                label.text = text
+                world.mark_changed(eid, UILabel)
 
     def _set_active_panel(self, panel_id: str | None) -> None:
         self.resources.set("active_debug_panel", panel_id)
@@ -104,6 +107,16 @@ class DebugManagerSystem(System):
         fish_store = world.get_components(Fish)
         fish_count = len(fish_store)
         debug_fish_count = sum(1 for fish in fish_store.values() if fish.species_id.lower().startswith("debug"))
+        renderer = resources.try_get("renderer")
+        cache_stats = getattr(renderer, "scale_cache_stats", None)
+        if cache_stats is not None:
+            st = cache_stats()
+            scale_text = (
+                f"Scale cache: {st['hits']}h/{st['misses']}m/{st['evictions']}e "
+                f"{st['bytes'] / (1024 * 1024):.1f}MB"
+            )
+        else:
+            scale_text = "Scale cache: n/a"
         return {
             "debug_fps": f"FPS: {self._fps:.1f}",
             "debug_entities_tanks": f"Tanks: {tank_count}",
@@ -111,4 +124,5 @@ class DebugManagerSystem(System):
             "debug_entities_debug": f"Debug: {debug_fish_count}",
             "debug_tool": f"Tool: {active_tool or 'none'}",
             "debug_mouse": f"Mouse: ({mouse_state.x:.0f}, {mouse_state.y:.0f})" if mouse_state else "Mouse: n/a",
+            "debug_scale_cache": scale_text,
         }
@@ -5,6 +5,7 @@ from engine.ecs import System, World
 from engine.resources import ResourceStore
 from engine.game.components import Velocity
 from engine.game.components.falling import Falling
+from engine.game.systems.params import FallingParams, ParamBlock
 
 
 class FallingSystem(System):
@@ -14,20 +15,27 @@ class FallingSystem(System):
     """
     phase = "logic"
 
+    def __init__(self, resources: ResourceStore) -> None:
+        super().__init__(resources)
+        self._params: ParamBlock[FallingParams] = ParamBlock(FallingParams.from_config)
+
     def update(self, world: World, dt: float) -> None:
         resources: ResourceStore = self.resources  # type: ignore[assignment]
-        cfg = resources.try_get("falling_config", {}).get("defaults", {})
-        default_g = float(cfg.get("gravity", 0.0))
-        default_term = float(cfg.get("terminal_velocity", 0.0))
-        default_stop = bool(cfg.get("stop_on_floor", True))
-        default_wobble_amp = float(cfg.get("wobble_amplitude", 0.0))
-        default_wobble_freq = float(cfg.get("wobble_frequency", 0.0))
-        default_wobble_phase = float(cfg.get("wobble_phase", 0.0))
+        params = self._params.get(resources.try_get("falling_config"))
+        default_g = params.gravity
+        default_term = params.terminal_velocity
+        default_stop = params.stop_on_floor
+        default_wobble_amp = params.wobble_amplitude
+        default_wobble_freq = params.wobble_frequency
+        default_wobble_phase = params.wobble_phase
 
         for eid, vel, falling in world.view(Velocity, Falling):
             # Skip if already grounded and meant to stop.
             if falling.stop_on_floor and falling.grounded:
                 continue
+            # Only airborne entities are edited; landed pellets stay unmarked.
+            world.mark_changed(eid, Velocity)
+            world.mark_changed(eid, Falling)
 
             g = falling.gravity if falling.gravity is not None else default_g
             term = falling.terminal_velocity if falling.terminal_velocity is not None else default_term
@@ -5,10 +5,11 @@ import random
 from typing import Dict
 
 from engine.ecs import System, World
-from engine.resources import ResourceStore
+from engine.resources import EntityStreams, ResourceStore
 from engine.game.components import Fish, Brain, MovementIntent
 from engine.game.fsm.idle_state import IdleState
 from engine.game.fsm.cruise_state import CruiseState
+from engine.game.events.config_events import ConfigChanged
 from engine.app.constants import (
     FSM_IDLE_DURATION,
     FSM_CRUISE_DURATION,
@@ -48,9 +49,28 @@ class FishFSMSystem(System):
             else:
                 rng = random.Random(RNG_ROOT_SEED)
             resources.set("rng_ai", rng)
-        self._rng: random.Random = rng
-
-        # Configurable ranges/weights
+        # Per-fish counter-based streams: a fish's draws don't depend on
+        # how many other fish drew before it this tick.
+        self._streams = EntityStreams.derive(rng, "fish_fsm")
+        # Simulated seconds; brains store when they entered their state
+        # instead of a per-frame timer, so they only change on switches.
+        self.clock = 0.0
+
+        self._states: Dict[str, object] = {}
+        self._bind_config()
+
+        # Re-read tuning when fsm.json / species.json are hot-reloaded.
+        bus = resources.try_get("events")
+        if bus is not None:
+            bus.subscribe(ConfigChanged, self._on_config_changed)
+
+    def _on_config_changed(self, event: ConfigChanged) -> None:
+        if event.resource in ("fsm_config", "species_config"):
+            self._bind_config()
+
+    def _bind_config(self) -> None:
+        """Build the state objects, or reconfigure them in place so fish keep their targets."""
+        resources = self.resources
         fsm_cfg = resources.try_get("fsm_config", {})
         self._start_weights = fsm_cfg.get("start_state_weights", {"idle": 0.5, "cruise": 0.5})
         idle_range = fsm_cfg.get("idle_duration_range", [self.IDLE_DURATION, self.IDLE_DURATION])
@@ -70,22 +90,45 @@ class FishFSMSystem(System):
         # Optional species config (for speed ranges)
         species_cfg = resources.try_get("species_config", {})
 
-        # State registry
-        self._states: Dict[str, object] = {
-            "idle": IdleState(duration_range=idle_range, transition_weights=idle_transitions, fallback_next="cruise"),
-            "cruise": CruiseState(
-                duration_range=cruise_range,
-                species_cfg=species_cfg,
-                default_speed=self.DEFAULT_CRUISE_SPEED,
-                inner_margin=cruise_inner_margin,
-                fallback_radius=cruise_fallback_radius,
-                retarget_min_distance=cruise_retarget_min_distance,
-                retarget_distance_factor=cruise_retarget_distance_factor,
-                transition_weights=cruise_transitions,
-                fallback_next="idle",
-            ),
+        idle_args = dict(duration_range=idle_range, transition_weights=idle_transitions, fallback_next="cruise")
+        cruise_args = dict(
+            duration_range=cruise_range,
+            species_cfg=species_cfg,
+            default_speed=self.DEFAULT_CRUISE_SPEED,
+            inner_margin=cruise_inner_margin,
+            fallback_radius=cruise_fallback_radius,
+            retarget_min_distance=cruise_retarget_min_distance,
+            retarget_distance_factor=cruise_retarget_distance_factor,
+            transition_weights=cruise_transitions,
+            fallback_next="idle",
+        )
+        if not self._states:
+            # State registry
+            self._states = {
+                "idle": IdleState(**idle_args),
+                "cruise": CruiseState(**cruise_args),
+            }
+        else:
+            self._states["idle"].configure(**idle_args)
+            self._states["cruise"].configure(**cruise_args)
+
+    def snapshot_state(self) -> Dict[str, object]:
+        return {
+            "rng": self._streams.getstate(),
+            "clock": self.clock,
+            "states": {name: state.snapshot_state() for name, state in self._states.items()},
         }
 
+    def restore_state(self, state: Dict[str, object]) -> None:
+        state = state or {}
+        if state.get("rng") is not None:
+            self._streams.setstate(state["rng"])
+        self.clock = float(state.get("clock", 0.0))
+        for name, saved in state.get("states", {}).items():
+            target = self._states.get(name)
+            if target is not None and saved is not None:
+                target.restore_state(saved)
+
     def _enter_state(
         self,
         eid,
@@ -93,6 +136,7 @@ class FishFSMSystem(System):
         fish: Fish,
         brain: Brain,
         intent: MovementIntent,
+        rng: random.Random,
     ) -> None:
         """Call on_enter on whatever brain.state currently is."""
         state = self._states.get(brain.state)
@@ -100,9 +144,9 @@ class FishFSMSystem(System):
             # Fallback to idle if state name is unknown
             brain.state = "idle"
             state = self._states["idle"]
-        state.on_enter(eid, world, fish, brain, intent, self._rng)
+        state.on_enter(eid, world, fish, brain, intent, rng)
 
-    def _pick_start_state(self) -> str:
+    def _pick_start_state(self, rng: random.Random) -> str:
         weights = []
         names = []
         for name, w in self._start_weights.items():
@@ -113,7 +157,7 @@ class FishFSMSystem(System):
         total = sum(weights)
         if total <= 0:
             return names[0]
-        r = self._rng.uniform(0, total)
+        r = rng.uniform(0, total)
         acc = 0.0
         for name, w in zip(names, weights):
             acc += w
@@ -122,36 +166,49 @@ class FishFSMSystem(System):
         return names[-1]
 
     def update(self, world: World, dt: float) -> None:
+        # Intents are steered in place every frame; brains are marked one
+        # by one, only when a fish starts or switches state.
+        world.mark_all_changed(MovementIntent)
+        streams = self._streams
+        streams.advance()
+        self.clock += dt
+        for state in self._states.values():
+            state.now = self.clock
+
         for eid, fish, brain, intent in world.view(Fish, Brain, MovementIntent):
+            rng = streams.for_entity(eid)
             if not brain.initialized:
-                brain.state = self._pick_start_state()
-                self._enter_state(eid, world, fish, brain, intent)
+                brain.state = self._pick_start_state(rng)
+                self._enter_state(eid, world, fish, brain, intent, rng)
                 brain.initialized = True
-
-            brain.time_in_state += dt
+                # The start frame counts towards the first state.
+                brain.entered_at -= dt
+                world.mark_changed(eid, Brain)
 
             state = self._states.get(brain.state)
             if state is None:
                 brain.state = "idle"
                 state = self._states["idle"]
+                world.mark_changed(eid, Brain)
 
             next_state_name = state.update(
-                eid, world, fish, brain, intent, dt, self._rng
+                eid, world, fish, brain, intent, dt, rng
             )
 
             if not next_state_name or next_state_name == brain.state:
                 continue
 
             # Exit current state
-            state.on_exit(eid, world, fish, brain, intent, self._rng)
+            state.on_exit(eid, world, fish, brain, intent, rng)
 
             # Switch to next
             brain.state = next_state_name
-            brain.time_in_state = 0.0
+            brain.entered_at = self.clock
             brain.state_duration = 0.0
+            world.mark_changed(eid, Brain)
 
             new_state = self._states.get(next_state_name)
             if new_state is None:
                 brain.state = "idle"
                 new_state = self._states["idle"]
-            new_state.on_enter(eid, world, fish, brain, intent, self._rng)
+            new_state.on_enter(eid, world, fish, brain, intent, rng)
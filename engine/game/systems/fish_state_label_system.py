@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from engine.ecs import System, World
-from engine.resources import ResourceStore
-from engine.app.constants import FALLBACK_SCREEN_SIZE
+from engine.resources import ResourceStore, get_viewport
 from engine.game.components import Position, Fish, Brain, RectSprite, SpriteRef
+from engine.game.systems.params import FishStateLabelParams, ParamBlock
 
 
 class FishStateLabelSystem(System):
@@ -12,6 +12,10 @@ class FishStateLabelSystem(System):
     """
     phase = "render"
 
+    def __init__(self, resources: ResourceStore) -> None:
+        super().__init__(resources)
+        self._params: ParamBlock[FishStateLabelParams] = ParamBlock(FishStateLabelParams.from_styles)
+
     def update(self, world: World, dt: float) -> None:
         resources: ResourceStore = self.resources  # type: ignore[assignment]
         if not resources.try_get("debug_show_fish_state", False):
@@ -21,33 +25,24 @@ class FishStateLabelSystem(System):
         if renderer is None or not hasattr(renderer, "draw_text"):
             return
 
-        styles = resources.try_get("ui_styles", {})
-        style = styles.get("fish_state_text", {})
-        color = tuple(style.get("text_color", (255, 255, 255)))
-        font_size = int(style.get("font_size", 12))
-        font_name = style.get("font_name")
-        offset_y = float(style.get("offset_y", 8.0))
-
-        # Screen/logical sizes
-        screen_w, screen_h = resources.try_get("screen_size", FALLBACK_SCREEN_SIZE)
-        logical_w, logical_h = resources.try_get("logical_size", (screen_w, screen_h))
-        if logical_w <= 0:
-            logical_w = screen_w
-        if logical_h <= 0:
-            logical_h = screen_h
-
-        scale_x = screen_w / logical_w
-        scale_y = screen_h / logical_h
-        scale = min(scale_x, scale_y)
-        render_w = logical_w * scale
-        render_h = logical_h * scale
-        offset_x = (screen_w - render_w) / 2.0
-        offset_y_screen = (screen_h - render_h) / 2.0
+        params = self._params.get(resources.try_get("ui_styles"))
+        color = params.color
+        font_size = params.font_size
+        font_name = params.font_name
+        offset_y = params.offset_y
+
+        viewport = get_viewport(resources)
+        scale = viewport.scale
+        offset_x = viewport.offset_x
+        offset_y_screen = viewport.offset_y
 
         rect_store = world.get_components(RectSprite)
         sprite_store = world.get_components(SpriteRef)
+        culled = resources.try_get("culled_entities") or ()
 
         for eid, pos, fish, brain in world.view(Position, Fish, Brain):
+            if eid in culled:
+                continue
             height = 0.0
             rect = rect_store.get(eid)
             if rect is not None:
@@ -36,5 +36,7 @@ class KeyboardSystem(System):
 
         for evt in self._pending:
             kb.keys[evt.key] = evt.pressed
+        if self._pending:
+            world.mark_changed(eid, KeyboardState)
 
         self._pending = []
@@ -46,5 +46,8 @@ class MouseSystem(System):
         for click in self._clicks:
             ms.buttons[click.button] = True  # transient; cleared on release? (future)
 
+        if self._moves or self._clicks:
+            world.mark_changed(eid, MouseState)
+
         self._clicks = []
         self._moves = []
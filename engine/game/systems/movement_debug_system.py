@@ -2,14 +2,18 @@ from __future__ import annotations
 import math
 
 from engine.ecs import System, World
-from engine.resources import ResourceStore
-from engine.app.constants import FALLBACK_SCREEN_SIZE
+from engine.resources import ResourceStore, get_viewport
 from engine.game.components import Position, Velocity, MovementIntent, RectSprite
+from engine.game.systems.params import MovementDebugParams, ParamBlock
 
 
 class MovementDebugSystem(System):
     phase = "render"
 
+    def __init__(self, resources: ResourceStore) -> None:
+        super().__init__(resources)
+        self._params: ParamBlock[MovementDebugParams] = ParamBlock(MovementDebugParams.from_config)
+
     def update(self, world: World, dt: float) -> None:
         resources: ResourceStore = self.resources
         if not resources.try_get("debug_show_vectors", False):
@@ -19,24 +23,24 @@ class MovementDebugSystem(System):
         if renderer is None or not hasattr(renderer, "draw_line"):
             return
 
-        cfg = resources.try_get("movement_config", {})
-        dbg = cfg.get("debug", {})
-        scale = float(dbg.get("vector_scale", 0.2))
-        arrow_size = float(dbg.get("arrow_size", 6.0))
-        col_v = tuple(dbg.get("color_velocity", (0, 200, 255)))
-        col_i = tuple(dbg.get("color_intent", (255, 200, 0)))
-        col_t = tuple(dbg.get("color_target", (0, 255, 120)))
-
-        screen_w, screen_h = resources.try_get("screen_size", (1280, 720))
-        logical_w, logical_h = resources.try_get("logical_size", (1280, 720))
+        params = self._params.get(resources.try_get("movement_config"))
+        scale = params.vector_scale
+        arrow_size = params.arrow_size
+        col_v = params.color_velocity
+        col_i = params.color_intent
+        col_t = params.color_target
 
-        uniform = min(screen_w / logical_w, screen_h / logical_h)
-        off_x = (screen_w - logical_w * uniform) / 2.0
-        off_y = (screen_h - logical_h * uniform) / 2.0
+        viewport = get_viewport(resources)
+        uniform = viewport.scale
+        off_x = viewport.offset_x
+        off_y = viewport.offset_y
 
         intents = world.get_components(MovementIntent)
+        culled = resources.try_get("culled_entities") or ()
 
         for eid, pos, vel in world.view(Position, Velocity):
+            if eid in culled:
+                continue
             # Convert world pos → screen pos
             x = off_x + pos.x * uniform
             y = off_y + pos.y * uniform
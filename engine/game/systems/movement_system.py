@@ -1,9 +1,8 @@
 # engine/game/systems/movement_system.py
 from __future__ import annotations
 import math
-import random
 from engine.ecs import System, World
-from engine.resources import ResourceStore
+from engine.resources import EntityStreams, ResourceStore
 from engine.app.constants import FALLBACK_SCREEN_SIZE
 from engine.game.components.position import Position
 from engine.game.components.velocity import Velocity
@@ -13,6 +12,7 @@ from engine.game.components.in_tank import InTank
 from engine.game.components.tank_bounds import TankBounds
 from engine.game.components.movement_intent import MovementIntent
 from engine.game.components.falling import Falling
+from engine.game.systems.params import MovementParams, ParamBlock
 
 
 class MovementSystem(System):
@@ -31,6 +31,18 @@ class MovementSystem(System):
 
     phase = "logic"
 
+    def __init__(self, resources: ResourceStore) -> None:
+        super().__init__(resources)
+        self._params: ParamBlock[MovementParams] = ParamBlock(MovementParams.from_config)
+        # Per-entity streams for redirect jitter (independent of visit order).
+        self._streams = EntityStreams.derive(resources.try_get("rng_ai"), "movement_redirect")
+
+    def snapshot_state(self):
+        return {"rng": self._streams.getstate()}
+
+    def restore_state(self, state) -> None:
+        self._streams.setstate(state["rng"])
+
     def update(self, world: World, dt: float) -> None:
         resources: ResourceStore = self.resources  # type: ignore[assignment]
 
@@ -43,34 +55,39 @@ class MovementSystem(System):
             resources.try_get("screen_size", FALLBACK_SCREEN_SIZE),
         )
 
-        move_cfg = resources.try_get("movement_config", {})
-
-        # Basic movement caps
-        max_accel = float(move_cfg.get("max_accel", 0.0))
-        max_speed = float(move_cfg.get("max_speed", 0.0))
-
-        # NEW: soft-brake config when approaching walls
-        avoid_cfg = move_cfg.get("avoidance", {})
+        # Tuning compiled once per config object (see params.py)
+        params = self._params.get(resources.try_get("movement_config"))
+        max_accel = params.max_accel
+        max_speed = params.max_speed
         #  - avoid_margin: how close to the wall we start braking (logical units)
         #  - avoid_brake_min_factor: minimum speed factor at the wall (0..1)
-        avoid_margin = float(avoid_cfg.get("margin", 0.0))
-        avoid_brake_min_factor = float(avoid_cfg.get("brake_min_factor", move_cfg.get("avoid_brake_min_factor", 0.3)))
-        avoid_brake_min_factor = max(0.0, min(1.0, avoid_brake_min_factor))
-        avoid_strength = float(avoid_cfg.get("strength", 0.0))
-
-        # Redirect config when clamped
-        redirect_cfg = move_cfg.get("redirect", {})
-        redirect_min_speed = float(redirect_cfg.get("min_speed", 0.0))
-        redirect_tangent_jitter = float(redirect_cfg.get("tangent_jitter", 0.0))
-        rng_redirect: random.Random = resources.try_get("rng_ai", random.Random())
-
-        # Component stores for tank bounds and intents
-        in_tank_store = world.get_components(InTank)
-        tank_bounds_store = world.get_components(TankBounds)
+        avoid_margin = params.avoid_margin
+        avoid_brake_min_factor = params.avoid_brake_min_factor
+        avoid_strength = params.avoid_strength
+        redirect_min_speed = params.redirect_min_speed
+        redirect_tangent_jitter = params.redirect_tangent_jitter
+        streams = self._streams
+        streams.advance()
+
+        # Tank rects resolved once per frame; entities find theirs through
+        # the InTank relation index instead of a per-entity component lookup.
+        tank_rects = {
+            tank_eid: (b.x, b.y, b.x + b.width, b.y + b.height)
+            for tank_eid, b in world.get_components(TankBounds).items()
+        }
+        full_rect = (0.0, 0.0, float(logical_w), float(logical_h))
+
+        # Component stores for intents
         intent_store = world.get_components(MovementIntent)
         falling_store = world.get_components(Falling)
         sprite_ref_store = world.get_components(SpriteRef)
 
+        # Positions and velocities change for nearly every mover each frame:
+        # stamp those stores once. Facing, landing and wall redirects are
+        # rare and marked per entity where they happen.
+        world.mark_all_changed(Position)
+        world.mark_all_changed(Velocity)
+
         for eid, pos, vel, sprite in world.view(Position, Velocity, RectSprite):
             falling = falling_store.get(eid)
             if falling is not None and falling.stop_on_floor and falling.grounded:
@@ -110,20 +127,9 @@ class MovementSystem(System):
             # ------------------------------------------------------------
             # 2) Determine movement bounds for this entity
             # ------------------------------------------------------------
-            in_tank = in_tank_store.get(eid)
-            if in_tank is not None:
-                # Look up TankBounds for the tank id; fall back to full logical space
-                t_bounds = tank_bounds_store.get(in_tank.tank)
-                if t_bounds is not None:
-                    left = t_bounds.x
-                    top = t_bounds.y
-                    right = t_bounds.x + t_bounds.width
-                    bottom = t_bounds.y + t_bounds.height
-                else:
-                    left, top, right, bottom = 0.0, 0.0, float(logical_w), float(logical_h)
-            else:
-                # No tank: full logical area
-                left, top, right, bottom = 0.0, 0.0, float(logical_w), float(logical_h)
+            # No tank, or a tank without TankBounds: full logical area
+            tank_eid = world.parent(InTank, eid)
+            left, top, right, bottom = tank_rects.get(tank_eid, full_rect)
 
             # Keep the *sprite* fully inside the bounds
             min_x = left
@@ -231,7 +237,10 @@ class MovementSystem(System):
                 # Keep sprite facing the direction of travel when inside bounds.
                 sprite_ref = sprite_ref_store.get(eid)
                 if sprite_ref is not None and abs(vel.vx) > 1e-3:
-                    sprite_ref.facing_left = vel.vx < 0.0
+                    facing_left = vel.vx < 0.0
+                    if sprite_ref.facing_left != facing_left:
+                        sprite_ref.facing_left = facing_left
+                        world.mark_changed(eid, SpriteRef)
                 continue
 
             if intent is None:
@@ -245,6 +254,7 @@ class MovementSystem(System):
                         vel.vx = 0.0
                         vel.vy = 0.0
                         falling.grounded = True
+                        world.mark_changed(eid, Falling)
                     else:
                         vel.vy = -vel.vy
                 continue
@@ -275,6 +285,7 @@ class MovementSystem(System):
             # Tangential jitter to avoid sticking on axes
             if redirect_tangent_jitter > 0.0:
                 jitter = redirect_tangent_jitter
+                rng_redirect = streams.for_entity(eid)
                 if hit_left or hit_right:
                     dir_y += rng_redirect.uniform(-jitter, jitter)
                 if hit_top or hit_bottom:
@@ -292,13 +303,18 @@ class MovementSystem(System):
                 new_vx = 0.0
                 new_vy = 0.0
                 falling.grounded = True
+                world.mark_changed(eid, Falling)
 
             vel.vx = new_vx
             vel.vy = new_vy
             intent.target_vx = new_vx
             intent.target_vy = new_vy
+            world.mark_changed(eid, MovementIntent)
             # Redirect invalidates the old debug target; AI will pick a fresh one.
 
             sprite_ref = sprite_ref_store.get(eid)
             if sprite_ref is not None and abs(new_vx) > 1e-3:
-                sprite_ref.facing_left = new_vx < 0.0
+                facing_left = new_vx < 0.0
+                if sprite_ref.facing_left != facing_left:
+                    sprite_ref.facing_left = facing_left
+                    world.mark_changed(eid, SpriteRef)
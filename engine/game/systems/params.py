@@ -0,0 +1,124 @@
+# engine/game/systems/params.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, Mapping, Optional, Tuple, TypeVar
+
+P = TypeVar("P")
+
+Color = Tuple[int, int, int]
+
+# Stand-in for a missing config resource; a stable object so the identity
+# check in ParamBlock does not rebuild every frame.
+NO_CONFIG: Mapping[str, Any] = {}
+
+
+class ParamBlock(Generic[P]):
+    """
+    Holds one system's compiled parameters.
+
+    get(source) rebuilds only when `source` is a different object than last
+    time. Config resources are frozen and replaced wholesale on hot reload,
+    so identity is an O(1) and sufficient change check.
+    """
+
+    __slots__ = ("_build", "_source", "_params")
+
+    def __init__(self, build: Callable[[Mapping[str, Any]], P]) -> None:
+        self._build = build
+        self._source: Optional[object] = None
+        self._params: Optional[P] = None
+
+    def get(self, source: Optional[Mapping[str, Any]]) -> P:
+        if source is None:
+            source = NO_CONFIG
+        if self._params is None or source is not self._source:
+            self._params = self._build(source)
+            self._source = source
+        return self._params
+
+
+@dataclass(frozen=True, slots=True)
+class MovementParams:
+    max_accel: float
+    max_speed: float
+    avoid_margin: float
+    avoid_brake_min_factor: float
+    avoid_strength: float
+    redirect_min_speed: float
+    redirect_tangent_jitter: float
+
+    @classmethod
+    def from_config(cls, cfg: Mapping[str, Any]) -> "MovementParams":
+        avoid_cfg = cfg.get("avoidance", {})
+        redirect_cfg = cfg.get("redirect", {})
+        brake_min = float(avoid_cfg.get("brake_min_factor", cfg.get("avoid_brake_min_factor", 0.3)))
+        return cls(
+            max_accel=float(cfg.get("max_accel", 0.0)),
+            max_speed=float(cfg.get("max_speed", 0.0)),
+            avoid_margin=float(avoid_cfg.get("margin", 0.0)),
+            avoid_brake_min_factor=max(0.0, min(1.0, brake_min)),
+            avoid_strength=float(avoid_cfg.get("strength", 0.0)),
+            redirect_min_speed=float(redirect_cfg.get("min_speed", 0.0)),
+            redirect_tangent_jitter=float(redirect_cfg.get("tangent_jitter", 0.0)),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FallingParams:
+    gravity: float
+    terminal_velocity: float
+    stop_on_floor: bool
+    wobble_amplitude: float
+    wobble_frequency: float
+    wobble_phase: float
+
+    @classmethod
+    def from_config(cls, cfg: Mapping[str, Any]) -> "FallingParams":
+        defaults = cfg.get("defaults", {})
+        return cls(
+            gravity=float(defaults.get("gravity", 0.0)),
+            terminal_velocity=float(defaults.get("terminal_velocity", 0.0)),
+            stop_on_floor=bool(defaults.get("stop_on_floor", True)),
+            wobble_amplitude=float(defaults.get("wobble_amplitude", 0.0)),
+            wobble_frequency=float(defaults.get("wobble_frequency", 0.0)),
+            wobble_phase=float(defaults.get("wobble_phase", 0.0)),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MovementDebugParams:
+    vector_scale: float
+    arrow_size: float
+    color_velocity: Color
+    color_intent: Color
+    color_target: Color
+
+    @classmethod
+    def from_config(cls, cfg: Mapping[str, Any]) -> "MovementDebugParams":
+        dbg = cfg.get("debug", {})
+        return cls(
+            vector_scale=float(dbg.get("vector_scale", 0.2)),
+            arrow_size=float(dbg.get("arrow_size", 6.0)),
+            color_velocity=tuple(dbg.get("color_velocity", (0, 200, 255))),
+            color_intent=tuple(dbg.get("color_intent", (255, 200, 0))),
+            color_target=tuple(dbg.get("color_target", (0, 255, 120))),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FishStateLabelParams:
+    color: Color
+    font_size: int
+    font_name: Optional[str]
+    offset_y: float
+
+    @classmethod
+    def from_styles(cls, styles: Mapping[str, Any]) -> "FishStateLabelParams":
+        style = styles.get("fish_state_text", {})
+        return cls(
+            color=tuple(style.get("text_color", (255, 255, 255))),
+            font_size=int(style.get("font_size", 12)),
+            font_name=style.get("font_name"),
+            offset_y=float(style.get("offset_y", 8.0)),
+        )
@@ -6,6 +6,7 @@ from engine.resources import ResourceStore
 from engine.game.components import Position, RectSprite, InTank, TankBounds, Tank, UIHitbox, UIElement, MouseState
 from engine.game.components.pellet import Pellet
 from engine.game.events.input_events import ClickWorld
+from engine.game.events.config_events import ConfigChanged
 from engine.game.factories.pellet_factory import create_pellet_cmd
 import random
 
@@ -19,10 +20,15 @@ class PlacementSystem(System):
         bus = resources.get("events")
         bus.subscribe(ClickWorld, self._on_click)
         self._pellet_cfg = resources.try_get("pellet_config", {}).get("pellet", {})
+        bus.subscribe(ConfigChanged, self._on_config_changed)
         self._rng = resources.try_get("rng_spawns")
         if self._rng is None:
             self._rng = random.Random(42)
 
+    def _on_config_changed(self, event: ConfigChanged) -> None:
+        if event.resource == "pellet_config":
+            self._pellet_cfg = self.resources.try_get("pellet_config", {}).get("pellet", {})
+
     def _on_click(self, event: ClickWorld) -> None:
         self._pending.append(event)
 
@@ -1,10 +1,11 @@
 # engine/game/systems/rect_render_system.py
 from __future__ import annotations
+import math
 from engine.ecs import System, World
-from engine.resources import ResourceStore
-from engine.app.constants import FALLBACK_SCREEN_SIZE
+from engine.resources import ResourceStore, get_viewport
 from engine.game.components.position import Position
 from engine.game.components.rect_sprite import RectSprite
+from engine.game.components.velocity import Velocity
 from engine.game.components.sprite_ref import SpriteRef
 from engine.game.components.ui_element import UIElement
 
@@ -22,46 +23,144 @@ class RectRenderSystem(System):
         preserving aspect ratio (no stretching).
       - The game view is letterboxed (centered) if the window aspect
         ratio doesn't match the logical aspect ratio.
+
+    Static layers (renderers with begin_layer):
+      - Static rects (no Velocity) are pre-rendered into cached "world" and
+        "ui" layers, re-rendered only when their layout, style or visibility
+        changes, and blitted once per frame. Moving rects draw every frame.
+      - Static draws are only re-resolved when an input they depend on
+        changed: per-entity change ticks of Position/RectSprite/UIElement,
+        Velocity/SpriteRef membership, the viewport, styles, visibility
+        flags or culling. Otherwise only moving rects are visited.
+
+    Dirty-rect mode (renderer.dirty_rects):
+      - The composited static layers become the renderer's background and
+        the renderer restores/presents just the regions drawn on top.
     """
     phase = "render"
 
-    def update(self, world: World, dt: float) -> None:
-        resources: ResourceStore = self.resources  # type: ignore[assignment]
+    # Cached static layers, composited bottom to top.
+    STATIC_LAYERS = ("world", "ui")
 
-        renderer = resources.try_get("renderer")
-        if renderer is None:
-            return
+    def __init__(self, resources: ResourceStore) -> None:
+        super().__init__(resources)
+        # Resolved UI border per entity: {eid: (ui_elem, border_or_None)}.
+        # Entries are dropped when the UIElement is re-added/marked changed,
+        # and the whole cache is dropped when the ui_styles dict is replaced.
+        self._border_cache: dict = {}
+        self._styles_ref = None
+        self._last_tick = 0
+        # Signature of what each cached static layer currently holds
+        self._layer_sigs: dict = {}
+        # Static draws resolved at the last rebuild, the inputs they were
+        # resolved from, and the entities/flags those inputs must cover.
+        self._static_layers: dict = {name: [] for name in self.STATIC_LAYERS}
+        self._static_inputs: tuple | None = None
+        self._static_eids: set = set()
+        self._static_flags: tuple = ()
 
-        sprite_ref_store = world.get_components(SpriteRef)
+    def _resolve_border(self, eid, ui_elem: UIElement | None, styles: dict):
+        if ui_elem is None or not ui_elem.style:
+            return None
+        cached = self._border_cache.get(eid)
+        if cached is not None and cached[0] is ui_elem:
+            return cached[1]
+        border = None
+        style = styles.get(ui_elem.style, {})
+        if "border" in style or "border_width" in style or "corner_radius" in style:
+            border = (
+                tuple(style.get("border", (20, 40, 60))),
+                int(style.get("border_width", 0)),
+                int(style.get("corner_radius", 0)),
+            )
+        self._border_cache[eid] = (ui_elem, border)
+        return border
+
+    @staticmethod
+    def _draw(renderer, x_px, y_px, w_px, h_px, color, border) -> None:
+        if border:
+            border_color, border_width, corner_radius = border
+            renderer.draw_rect(x_px, y_px, w_px, h_px, border_color, outline_width=border_width, border_radius=corner_radius)
+            renderer.draw_rect(
+                x_px + border_width,
+                y_px + border_width,
+                w_px - 2 * border_width,
+                h_px - 2 * border_width,
+                color,
+                outline_width=0,
+                border_radius=max(0, corner_radius - border_width),
+            )
+        else:
+            renderer.draw_rect(x_px, y_px, w_px, h_px, color)
 
-        # Current window size (updated by PygameApp on resize)
-        screen_w, screen_h = resources.try_get("screen_size", FALLBACK_SCREEN_SIZE)
+    def _inputs(self, world: World, resources: ResourceStore, viewport, culled) -> tuple:
+        """What the static draws depend on; O(1) apart from flags and culled statics."""
+        return (
+            viewport.screen_size,
+            viewport.scale,
+            viewport.offset_x,
+            viewport.offset_y,
+            # Per-entity writes only: bulk marks come from systems that move
+            # entities with a Velocity, which never sit in a static layer.
+            world.last_change(Position, include_bulk=False),
+            world.last_change(RectSprite, include_bulk=False),
+            world.last_change(UIElement, include_bulk=False),
+            # Only membership matters here (static vs. moving vs. sprite).
+            len(world.get_components(Velocity)),
+            world.last_removal(Velocity),
+            len(world.get_components(SpriteRef)),
+            world.last_removal(SpriteRef),
+            id(resources.try_get("ui_borders")),
+            id(resources.try_get("ui_styles")),
+            id(resources.try_get("ui_panel_links")),
+            tuple((resources.try_get("panel_visibility", {}) or {}).items()),
+            tuple(bool(resources.try_get(flag, False)) for flag in self._static_flags),
+            frozenset(self._static_eids.intersection(culled)),
+        )
 
-        # Fixed logical size (from settings.json), or fall back to screen size
-        logical_w, logical_h = resources.try_get("logical_size", (screen_w, screen_h))
+    def _refresh_layers(self, renderer, static_layers: dict, screen_size) -> bool:
+        """Re-render every static layer whose draws changed; True if any did."""
+        changed = False
+        for name in self.STATIC_LAYERS:
+            draws = static_layers[name]
+            sig = (screen_size, tuple(draws))
+            if sig == self._layer_sigs.get(name) and renderer.has_layer(name):
+                continue
+            self._layer_sigs[name] = sig
+            changed = True
+            if not draws:
+                renderer.drop_layer(name)
+                continue
+            # Layer surface covers just the bounding box of its rects.
+            left = math.floor(min(d[0] for d in draws))
+            top = math.floor(min(d[1] for d in draws))
+            right = math.ceil(max(d[0] + d[2] for d in draws))
+            bottom = math.ceil(max(d[1] + d[3] for d in draws))
+            renderer.begin_layer(name, left, top, right - left, bottom - top)
+            for draw in draws:
+                self._draw(renderer, *draw)
+            renderer.end_layer()
+        return changed
 
-        # Avoid division by zero
-        if logical_w <= 0:
-            logical_w = screen_w
-        if logical_h <= 0:
-            logical_h = screen_h
+    def _blit_layers(self, renderer) -> None:
+        for name in self.STATIC_LAYERS:
+            if renderer.has_layer(name):
+                renderer.blit_layer(name)
 
-        # --- UNIFORM SCALE (keep proportions) ---
-        # scale = min(scale_x, scale_y)
-        scale_x = screen_w / logical_w
-        scale_y = screen_h / logical_h
-        scale = min(scale_x, scale_y)
+    def update(self, world: World, dt: float) -> None:
+        resources: ResourceStore = self.resources  # type: ignore[assignment]
 
-        # Size of the rendered logical area in screen pixels
-        render_w = logical_w * scale
-        render_h = logical_h * scale
+        renderer = resources.try_get("renderer")
+        if renderer is None:
+            return
 
-        # Center it (letterbox/pillarbox)
-        offset_x = (screen_w - render_w) / 2.0
-        offset_y = (screen_h - render_h) / 2.0
+        sprite_ref_store = world.get_components(SpriteRef)
 
-        # Clear whole screen first
-        renderer.clear()
+        # Shared logical -> screen transform (rebuilt only on resize)
+        viewport = get_viewport(resources)
+        scale = viewport.scale
+        offset_x = viewport.offset_x
+        offset_y = viewport.offset_y
 
         # Borders metadata from UI (optional)
         borders = resources.try_get("ui_borders", {})
@@ -69,14 +168,43 @@ class RectRenderSystem(System):
         ui_elem_store = world.get_components(UIElement)
         panel_visibility = resources.try_get("panel_visibility", {})
         panel_links = resources.try_get("ui_panel_links", {})
+        vel_store = world.get_components(Velocity)
+        # Entities CullingSystem found off screen (or in hidden tanks)
+        culled = resources.try_get("culled_entities") or ()
 
-        # Draw all entities that have Position + RectSprite
-        drew_any = False
-        for eid, pos, sprite in world.view(Position, RectSprite):
+        if styles is not self._styles_ref:
+            self._border_cache.clear()
+            self._styles_ref = styles
+        for eid, _ in world.changed(UIElement, self._last_tick):
+            self._border_cache.pop(eid, None)
+
+        # Resolve all visible rects first: (x, y, w, h, color, border).
+        # Entities with a Velocity are "dynamic"; everything else is static
+        # and grouped into a cached layer: UI elements vs. world geometry.
+        # Static draws are reused as-is while their inputs are unchanged.
+        rebuild = self._inputs(world, resources, viewport, culled) != self._static_inputs
+        if rebuild:
+            static_layers = {name: [] for name in self.STATIC_LAYERS}
+            static_eids: set = set()
+            static_flags: set = set()
+            candidates = world.view(Position, RectSprite)
+        else:
+            static_layers = self._static_layers
+            static_eids, static_flags = self._static_eids, set()  # only moving rects below
+            candidates = ((eid, pos, sprite) for eid, pos, sprite, _ in world.view(Position, RectSprite, Velocity))
+        dynamic_draws = []
+        for eid, pos, sprite in candidates:
             # If this entity also has a SpriteRef, skip drawing the fallback rect.
             if eid in sprite_ref_store:
                 continue
+            static = eid not in vel_store
             ui_elem = ui_elem_store.get(eid)
+            if static:
+                static_eids.add(eid)
+                if ui_elem is not None and ui_elem.visible_flag:
+                    static_flags.add(ui_elem.visible_flag)
+            if eid in culled:
+                continue
             if ui_elem and ui_elem.visible_flag:
                 if not resources.try_get(ui_elem.visible_flag, False):
                     continue
@@ -89,30 +217,49 @@ class RectRenderSystem(System):
             h_px = sprite.height * scale
             border = borders.get(eid)
             if border is None:
-                ui_elem = ui_elem_store.get(eid)
-                style_key = ui_elem.style if ui_elem else None
-                style = styles.get(style_key, {}) if style_key else {}
-                if "border" in style or "border_width" in style or "corner_radius" in style:
-                    border = (
-                        tuple(style.get("border", (20, 40, 60))),
-                        int(style.get("border_width", 0)),
-                        int(style.get("corner_radius", 0)),
-                    )
-            if border:
-                border_color, border_width, corner_radius = border
-                renderer.draw_rect(x_px, y_px, w_px, h_px, border_color, outline_width=border_width, border_radius=corner_radius)
-                renderer.draw_rect(
-                    x_px + border_width,
-                    y_px + border_width,
-                    w_px - 2 * border_width,
-                    h_px - 2 * border_width,
-                    sprite.color,
-                    outline_width=0,
-                    border_radius=max(0, corner_radius - border_width),
-                )
+                border = self._resolve_border(eid, ui_elem, styles)
+            draw = (x_px, y_px, w_px, h_px, sprite.color, border)
+            if not static:
+                dynamic_draws.append(draw)
+            elif ui_elem is not None:
+                static_layers["ui"].append(draw)
             else:
-                renderer.draw_rect(x_px, y_px, w_px, h_px, sprite.color)
-            drew_any = True
+                static_layers["world"].append(draw)
+        if rebuild:
+            self._static_layers = static_layers
+            self._static_eids = static_eids
+            self._static_flags = tuple(sorted(static_flags))
+            self._static_inputs = self._inputs(world, resources, viewport, culled)
+
+        if hasattr(renderer, "begin_layer"):
+            # Static layers are re-rendered only when their contents change
+            # and otherwise composited with one blit each.
+            layers_changed = False
+            if rebuild or not all(renderer.has_layer(n) for n in self.STATIC_LAYERS if static_layers[n]):
+                layers_changed = self._refresh_layers(renderer, static_layers, viewport.screen_size)
+            if getattr(renderer, "dirty_rects", False):
+                # Dirty-rect mode: the composited layers are the background.
+                if layers_changed or not renderer.has_background:
+                    renderer.invalidate_background()
+                    renderer.clear()
+                    self._blit_layers(renderer)
+                    renderer.capture_background()
+                else:
+                    renderer.clear()
+            else:
+                renderer.clear()
+                self._blit_layers(renderer)
+        else:
+            # Plain renderer: clear whole screen and draw everything.
+            renderer.clear()
+            for name in self.STATIC_LAYERS:
+                for draw in static_layers[name]:
+                    self._draw(renderer, *draw)
+        for draw in dynamic_draws:
+            self._draw(renderer, *draw)
+        drew_any = bool(dynamic_draws) or any(static_layers.values())
+
+        self._last_tick = world.change_tick
 
         # If sprites are present in the world, let SpriteRenderSystem own present().
         # Otherwise, present here for pure-rect scenes/tests.
@@ -0,0 +1,63 @@
+# engine/game/systems/shared_columns_system.py
+from __future__ import annotations
+
+import warnings
+from typing import Any, Optional, Sequence, Tuple, Type
+
+from engine.ecs import System, World
+from engine.ecs.shared_columns import SharedColumns, component_column_specs, gather_component_columns
+from engine.resources import ResourceStore
+from engine.game.components import Position, Velocity
+
+# Hot numeric fields external readers ask for (recorder, dashboards, renderers).
+HOT_FIELDS: Tuple[Tuple[Type[Any], str], ...] = (
+    (Position, "x"),
+    (Position, "y"),
+    (Velocity, "vx"),
+    (Velocity, "vy"),
+)
+
+
+class SharedColumnsSystem(System):
+    """
+    Publishes hot component columns to shared memory once per frame.
+
+    Last in post_update, so readers see the finished simulation state of
+    a frame. Other processes attach with
+    engine.ecs.shared_columns.SharedColumnsReader(name) and read columns
+    "eid", "Position.x", ... without pickling. Rows beyond `capacity` are
+    dropped (with a warning) because readers hold the block by name.
+    """
+
+    phase = "post_update"
+
+    def __init__(
+        self,
+        resources: ResourceStore,
+        name: Optional[str] = None,
+        capacity: int = 4096,
+        fields: Sequence[Tuple[Type[Any], str]] = HOT_FIELDS,
+    ) -> None:
+        super().__init__(resources)
+        self.fields = tuple(fields)
+        self.columns = SharedColumns(component_column_specs(self.fields), capacity, name=name)
+        self.frame = 0
+        self._warned = False
+
+    @property
+    def name(self) -> str:
+        return self.columns.name
+
+    def update(self, world: World, dt: float) -> None:
+        values = gather_component_columns(world, self.fields)
+        capacity = self.columns.capacity
+        if len(values["eid"]) > capacity:
+            if not self._warned:
+                warnings.warn(f"shared columns {self.name!r}: {len(values['eid'])} rows exceed capacity {capacity}")
+                self._warned = True
+            values = {key: column[:capacity] for key, column in values.items()}
+        self.frame += 1
+        self.columns.publish(values, frame=self.frame)
+
+    def close(self) -> None:
+        self.columns.close()
@@ -2,8 +2,7 @@
 from __future__ import annotations
 
 from engine.ecs import System, World
-from engine.resources import ResourceStore
-from engine.app.constants import FALLBACK_SCREEN_SIZE
+from engine.resources import ResourceStore, get_viewport
 from engine.game.components.position import Position
 from engine.game.components.velocity import Velocity
 from engine.game.components.sprite_ref import SpriteRef
@@ -18,8 +17,10 @@ class SpriteRenderSystem(System):
 
     Render space:
       - Uses the same uniform scaling + letterboxing as RectRenderSystem.
-      - Does NOT clear or present; we assume some other system (RectRenderSystem)
-        owns the frame lifecycle. This lets sprites draw on top of rectangles.
+      - Does NOT clear; we assume some other system (RectRenderSystem)
+        owns the start of the frame. This lets sprites draw on top of rectangles.
+      - Sprites are submitted to the renderer's queue (when available) and
+        go out in a single batched blit before present().
     """
 
     phase = "render"
@@ -33,35 +34,21 @@ class SpriteRenderSystem(System):
             # No renderer or assets yet (e.g. tests, headless) -> nothing to do.
             return
 
-        # Current window size (updated by PygameApp on resize)
-        screen_w, screen_h = resources.try_get("screen_size", FALLBACK_SCREEN_SIZE)
+        # Shared logical -> screen transform (rebuilt only on resize)
+        viewport = get_viewport(resources)
+        scale = viewport.scale
+        offset_x = viewport.offset_x
+        offset_y = viewport.offset_y
 
-        # Fixed logical size (from settings.json), or fall back to screen size
-        logical_w, logical_h = resources.try_get("logical_size", (screen_w, screen_h))
-
-        # Avoid division by zero
-        if logical_w <= 0:
-            logical_w = screen_w
-        if logical_h <= 0:
-            logical_h = screen_h
-
-        # --- UNIFORM SCALE (keep proportions) ---
-        scale_x = screen_w / logical_w
-        scale_y = screen_h / logical_h
-        scale = min(scale_x, scale_y)
-
-        # Size of the rendered logical area in screen pixels
-        render_w = logical_w * scale
-        render_h = logical_h * scale
-
-        # Center it (letterbox/pillarbox)
-        offset_x = (screen_w - render_w) / 2.0
-        offset_y = (screen_h - render_h) / 2.0
+        # Prefer the renderer's batched queue when it has one.
+        batched = hasattr(renderer, "submit_image")
 
         # Draw all entities that have Position + SpriteRef
         vel_store = world.get_components(Velocity)
+        # Entities CullingSystem found off screen (or in hidden tanks)
+        culled = resources.try_get("culled_entities") or ()
         for eid, pos, sprite in world.view(Position, SpriteRef):
-            if not assets.has_image(sprite.sprite_id):
+            if eid in culled or not assets.has_image(sprite.sprite_id):
                 continue
 
             image = assets.get_image(sprite.sprite_id)
@@ -78,7 +65,14 @@ class SpriteRenderSystem(System):
                 if vel is not None and abs(vel.vx) > 1e-3:
                     flip_x = vel.vx < 0.0
 
-            renderer.draw_image(image, x_px, y_px, w_px, h_px, flip_x=flip_x)
+            if batched:
+                renderer.submit_image(image, x_px, y_px, w_px, h_px, flip_x=flip_x, sprite_id=sprite.sprite_id)
+            else:
+                renderer.draw_image(image, x_px, y_px, w_px, h_px, flip_x=flip_x)
+
+        # Batched renderers blit everything queued above in one call.
+        if batched:
+            renderer.flush_images()
 
         # Present the composed frame after all sprites have been drawn.
         renderer.present()
@@ -21,6 +21,8 @@ class UIButtonSystem(System):
         bus = resources.get("events")
         bus.subscribe(ClickWorld, self._on_click)
         bus.subscribe(PointerMove, self._on_move)
+        # World change tick at the end of our last update (see World.changed)
+        self._last_tick = 0
 
     def _on_click(self, evt: ClickWorld) -> None:
         self._pending.append(evt)
@@ -33,6 +35,8 @@ class UIButtonSystem(System):
         moves = self._moves
         self._pending = []
         self._moves = []
+        if not events and not moves:
+            return
         styles = self.resources.try_get("ui_styles", {})
         ui_elem_store = world.get_components(UIElement)
 
@@ -64,13 +68,17 @@ class UIButtonSystem(System):
             }
             return tuple(palette.get(state, palette["inactive"]))
 
+        def set_state(eid, button: UIButton, active: bool, hover: bool) -> None:
+            # Only stamp a change when the button state actually flips, so the
+            # restyle pass below touches just those buttons.
+            if button.active != active or button.hover != hover:
+                button.active = active
+                button.hover = hover
+                world.mark_changed(eid, UIButton)
+
         def deactivate_all():
             for eid, _, _, other_btn in world.view(Position, UIHitbox, UIButton):
-                other_btn.active = False
-                other_btn.hover = False
-                rect = world.get_components(RectSprite).get(eid)
-                if rect is not None:
-                    rect.color = color_for_state(eid, "inactive")
+                set_state(eid, other_btn, False, False)
             self.resources.set("active_tool", None)
 
         def apply_style(eid, button: UIButton):
@@ -78,27 +86,23 @@ class UIButtonSystem(System):
             if rect is None:
                 return
             if button.active:
-                rect.color = color_for_state(eid, "active")
+                color = color_for_state(eid, "active")
             elif button.hover:
-                rect.color = color_for_state(eid, "hover")
+                color = color_for_state(eid, "hover")
             else:
-                rect.color = color_for_state(eid, "inactive")
+                color = color_for_state(eid, "inactive")
+            if rect.color != color:
+                rect.color = color
+                world.mark_changed(eid, RectSprite)
 
         # Hover handling
         for move in moves:
             for eid, pos, hitbox, button in world.view(Position, UIHitbox, UIButton):
                 if not is_visible(eid):
-                    button.hover = False
-                    apply_style(eid, button)
-                    continue
-                if not (pos.x <= move.x <= pos.x + hitbox.width and pos.y <= move.y <= pos.y + hitbox.height):
-                    button.hover = False
-                    apply_style(eid, button)
+                    set_state(eid, button, button.active, False)
                     continue
-
                 inside = pos.x <= move.x <= pos.x + hitbox.width and pos.y <= move.y <= pos.y + hitbox.height
-                button.hover = inside and not button.active
-                apply_style(eid, button)
+                set_state(eid, button, button.active, inside and not button.active)
 
         for evt in events:
             # Right-click anywhere should deactivate the current tool/buttons.
@@ -112,30 +116,24 @@ class UIButtonSystem(System):
                 if not (pos.x <= evt.x <= pos.x + hitbox.width and pos.y <= evt.y <= pos.y + hitbox.height):
                     continue
 
-                if evt.button == 1:
-                    button.active = not button.active
-                else:
+                if evt.button != 1:
                     continue
+                set_state(eid, button, not button.active, button.hover)
 
                 # If activating this button, deactivate others.
                 if button.active:
                     for other_eid, _, _, other_btn in world.view(Position, UIHitbox, UIButton):
                         if other_eid != eid:
-                            other_btn.active = False
-                            other_btn.hover = False
-                    # Exclusive group handling
-                    if button.exclusive_group:
-                        for other_eid, _, _, other_btn in world.view(Position, UIHitbox, UIButton):
-                            if other_eid != eid and other_btn.exclusive_group == button.exclusive_group:
-                                other_btn.active = False
-                                other_btn.hover = False
-                                apply_style(other_eid, other_btn)
+                            set_state(other_eid, other_btn, False, False)
                     if button.tool_id:
                         self.resources.set("active_tool", button.tool_id)
                 else:
                     if self.resources.try_get("active_tool") == button.tool_id:
                         self.resources.set("active_tool", None)
-                    button.hover = False
-
-                apply_style(eid, button)
+                    set_state(eid, button, button.active, False)
                 break
+
+        # Restyle only buttons whose state changed since our last run.
+        for eid, button in world.changed(UIButton, self._last_tick):
+            apply_style(eid, button)
+        self._last_tick = world.change_tick
@@ -9,6 +9,11 @@ from engine.game.components.ui_hitbox import UIHitbox
 class UILabelSystem(System):
     """
     Renders UILabels via the renderer's draw_text (adapter-provided).
+
+    Labels are deliberately not cached in RectRenderSystem's static layers:
+    antialiased glyph edges blend with whatever lies beneath them, so text
+    rendered into a transparent layer would not composite pixel-identically.
+    Each label is one blit of a cached text surface instead.
     """
     phase = "render"
 
@@ -1,4 +1,6 @@
 # engine/resources/__init__.py
 from .store import ResourceStore
+from .viewport import Viewport, get_viewport
+from .rng import CounterRandom, EntityStreams
 
-__all__ = ["ResourceStore"]
+__all__ = ["ResourceStore", "Viewport", "get_viewport", "CounterRandom", "EntityStreams"]
@@ -0,0 +1,181 @@
+# engine/resources/rng.py
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+from typing import Iterable, List, Optional, Tuple
+
+from engine.app.constants import RNG_ROOT_SEED
+
+_MASK64 = (1 << 64) - 1
+_GAMMA = 0x9E3779B97F4A7C15
+_TICK_GAMMA = 0xD1B54A32D192ED03
+_TWO_NEG53 = 2.0 ** -53
+
+
+def _mix64(z: int) -> int:
+    """splitmix64 finalizer: a bijective 64-bit avalanche mix."""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def _seed_key(a) -> int:
+    if a is None:
+        return int.from_bytes(os.urandom(8), "little")
+    if isinstance(a, str):
+        a = a.encode("utf-8")
+    if isinstance(a, (bytes, bytearray)):
+        return int.from_bytes(hashlib.blake2b(a, digest_size=8).digest(), "little")
+    if isinstance(a, float):
+        a = hash(a)
+    if not isinstance(a, int):
+        raise TypeError(
+            "The only supported seed types are: None, int, float, str, bytes, and bytearray."
+        )
+    return a & _MASK64
+
+
+class CounterRandom(random.Random):
+    """
+    random.Random whose n-th draw is a pure function of (key, n).
+
+    Draw n is splitmix64(key + (n + 1) * gamma), so a stream has no hidden
+    state beyond its key and counter; any stream can be recreated (or
+    skipped ahead) without replaying earlier draws. All of random.Random's
+    helpers (uniform, choice, randint, gauss, ...) work on top of it.
+    Seeds are taken like random.Random's: ints, floats, str/bytes (hashed)
+    or None for a key from os.urandom.
+    """
+
+    def __init__(self, x=None) -> None:
+        super().__init__(x)
+
+    def seed(self, a=None, version=2) -> None:
+        self._key: Optional[int] = _seed_key(a)
+        self._counter = 0
+        self.gauss_next = None
+
+    def _derive_key(self) -> int:
+        raise RuntimeError("CounterRandom has no key")
+
+    def _next64(self) -> int:
+        key = self._key
+        if key is None:
+            key = self._key = self._derive_key()
+        self._counter += 1
+        return _mix64((key + self._counter * _GAMMA) & _MASK64)
+
+    def random(self) -> float:
+        return (self._next64() >> 11) * _TWO_NEG53
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        out = 0
+        bits = 0
+        while bits < k:
+            out = (out << 64) | self._next64()
+            bits += 64
+        return out >> (bits - k)
+
+    def getstate(self) -> Tuple[Optional[int], int]:
+        return (self._key, self._counter)
+
+    def setstate(self, state) -> None:
+        self._key, self._counter = state
+        self.gauss_next = None
+
+
+class _EntityRandom(CounterRandom):
+    """Reusable per-entity view; the key is derived on the first draw only."""
+
+    def __init__(self, streams: "EntityStreams") -> None:
+        self._streams = streams
+        self._eid = 0
+        super().__init__(0)
+
+    def bind(self, eid: int) -> "_EntityRandom":
+        self._eid = eid
+        self._key = None
+        self._counter = 0
+        self.gauss_next = None
+        return self
+
+    def _derive_key(self) -> int:
+        return self._streams.key(self._eid)
+
+
+class EntityStreams:
+    """
+    Counter-based random streams keyed by (seed, entity, tick).
+
+    Each entity gets its own stream per tick, so what one fish draws never
+    depends on how many draws other fish made before it: systems may visit
+    entities in any order, in batches or in parallel, and get identical
+    results. The owning system calls advance() once per update.
+
+    for_entity() returns a shared, lazily keyed object (no allocation, no
+    hashing unless the entity actually draws), valid until the next call;
+    call it once per entity per tick, since binding again restarts that
+    entity's stream. stream() returns an independent object.
+    """
+
+    def __init__(self, seed: int) -> None:
+        self.seed = int(seed) & _MASK64
+        self._set_tick(0)
+        self._view = _EntityRandom(self)
+
+    @classmethod
+    def derive(cls, rng: Optional[random.Random], salt: str) -> "EntityStreams":
+        """
+        Streams seeded from a parent RNG (e.g. rng_ai) plus a per-user salt,
+        so two systems sharing a parent still draw independently.
+        """
+        base = rng.getrandbits(64) if rng is not None else RNG_ROOT_SEED
+        salt_bits = _seed_key(salt)
+        return cls(_mix64((base ^ salt_bits) & _MASK64))
+
+    def _set_tick(self, tick: int) -> None:
+        self.tick = tick
+        self._tick_key = _mix64((self.seed + (tick + 1) * _TICK_GAMMA) & _MASK64)
+
+    def advance(self) -> None:
+        self._set_tick(self.tick + 1)
+
+    def key(self, eid: int) -> int:
+        return _mix64((self._tick_key ^ ((int(eid) * _GAMMA) & _MASK64)) & _MASK64)
+
+    def for_entity(self, eid: int) -> CounterRandom:
+        return self._view.bind(eid)
+
+    def stream(self, eid: int) -> CounterRandom:
+        return CounterRandom(self.key(eid))
+
+    # ------------------------------------------------------------------
+    # Bulk draws
+    # ------------------------------------------------------------------
+    def random_many(self, eids: Iterable[int]) -> List[float]:
+        """First draw of each entity's stream this tick (== for_entity(e).random())."""
+        tick_key = self._tick_key
+        return [
+            (_mix64((_mix64((tick_key ^ ((int(e) * _GAMMA) & _MASK64)) & _MASK64) + _GAMMA) & _MASK64) >> 11)
+            * _TWO_NEG53
+            for e in eids
+        ]
+
+    def uniform_many(self, eids: Iterable[int], a: float, b: float) -> List[float]:
+        span = b - a
+        return [a + span * u for u in self.random_many(eids)]
+
+    # ------------------------------------------------------------------
+    # Persistence (systems forward these through snapshot_state)
+    # ------------------------------------------------------------------
+    def getstate(self) -> Tuple[int, int]:
+        return (self.seed, self.tick)
+
+    def setstate(self, state) -> None:
+        seed, tick = state
+        self.seed = int(seed) & _MASK64
+        self._set_tick(int(tick))
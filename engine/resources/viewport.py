@@ -0,0 +1,135 @@
+# engine/resources/viewport.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+from engine.app.constants import FALLBACK_SCREEN_SIZE
+
+Point = Tuple[float, float]
+
+
+@dataclass(frozen=True)
+class Viewport:
+    """
+    Uniform logical -> screen mapping with letterboxing.
+
+    Logical space is scaled by `scale` (the smaller of the two axis ratios)
+    and centred in the window, so:
+
+        screen = logical * scale + offset
+        logical = (screen - offset) * inv_scale
+
+    Instances are immutable; get_viewport() swaps in a new one whenever
+    screen_size or logical_size changes (i.e. on resize).
+    """
+
+    screen_size: Tuple[int, int]
+    logical_size: Tuple[float, float]
+    scale: float
+    inv_scale: float
+    offset_x: float
+    offset_y: float
+
+    @classmethod
+    def from_sizes(cls, screen_size, logical_size=None) -> "Viewport":
+        screen_w, screen_h = screen_size
+        logical_w, logical_h = _effective_logical(screen_size, logical_size)
+
+        scale = min(screen_w / logical_w, screen_h / logical_h) if logical_w and logical_h else 0.0
+        return cls(
+            screen_size=(screen_w, screen_h),
+            logical_size=(logical_w, logical_h),
+            scale=scale,
+            inv_scale=1.0 / scale if scale > 0 else 0.0,
+            offset_x=(screen_w - logical_w * scale) / 2.0,
+            offset_y=(screen_h - logical_h * scale) / 2.0,
+        )
+
+    # ------------------------------------------------------------------
+    # Affine forms
+    # ------------------------------------------------------------------
+    @property
+    def affine(self) -> Tuple[float, float, float, float, float, float]:
+        """Logical -> screen as (a, b, c, d, e, f): x' = a*x + b*y + c, y' = d*x + e*y + f."""
+        return (self.scale, 0.0, self.offset_x, 0.0, self.scale, self.offset_y)
+
+    @property
+    def inverse_affine(self) -> Tuple[float, float, float, float, float, float]:
+        """Screen -> logical, same layout as `affine`."""
+        s = self.inv_scale
+        return (s, 0.0, -self.offset_x * s, 0.0, s, -self.offset_y * s)
+
+    @property
+    def render_rect(self) -> Tuple[float, float, float, float]:
+        """Screen-space (x, y, w, h) covered by logical space."""
+        lw, lh = self.logical_size
+        return (self.offset_x, self.offset_y, lw * self.scale, lh * self.scale)
+
+    @property
+    def visible_logical_rect(self) -> Tuple[float, float, float, float]:
+        """Logical-space (x, y, w, h) of the whole window, letterbox bars included."""
+        if self.scale <= 0:
+            return (0.0, 0.0, 0.0, 0.0)
+        sw, sh = self.screen_size
+        s = self.inv_scale
+        return (-self.offset_x * s, -self.offset_y * s, sw * s, sh * s)
+
+    # ------------------------------------------------------------------
+    # Single values
+    # ------------------------------------------------------------------
+    def to_screen(self, x: float, y: float) -> Point:
+        return (self.offset_x + x * self.scale, self.offset_y + y * self.scale)
+
+    def to_logical(self, sx: float, sy: float) -> Point:
+        return ((sx - self.offset_x) * self.inv_scale, (sy - self.offset_y) * self.inv_scale)
+
+    def rect_to_screen(self, x: float, y: float, w: float, h: float) -> Tuple[float, float, float, float]:
+        s = self.scale
+        return (self.offset_x + x * s, self.offset_y + y * s, w * s, h * s)
+
+    def contains_screen(self, sx: float, sy: float) -> bool:
+        """True if a screen point lies inside the letterboxed logical area."""
+        ox, oy, rw, rh = self.render_rect
+        return ox <= sx <= ox + rw and oy <= sy <= oy + rh
+
+    def screen_to_logical(self, sx: float, sy: float) -> Optional[Point]:
+        """Map a screen point to logical space, or None if it falls in the letterbox."""
+        if self.scale <= 0 or not self.contains_screen(sx, sy):
+            return None
+        return self.to_logical(sx, sy)
+
+    # ------------------------------------------------------------------
+    # Batches
+    # ------------------------------------------------------------------
+    def to_screen_many(self, points: Iterable[Point]) -> List[Point]:
+        s, ox, oy = self.scale, self.offset_x, self.offset_y
+        return [(ox + x * s, oy + y * s) for x, y in points]
+
+    def to_logical_many(self, points: Iterable[Point]) -> List[Point]:
+        s, ox, oy = self.inv_scale, self.offset_x, self.offset_y
+        return [((x - ox) * s, (y - oy) * s) for x, y in points]
+
+
+def _effective_logical(screen_size, logical_size) -> Tuple[float, float]:
+    """Logical size with non-positive axes (or a missing size) following the screen."""
+    screen_w, screen_h = screen_size
+    if logical_size is None:
+        return (screen_w, screen_h)
+    logical_w, logical_h = logical_size
+    return (logical_w if logical_w > 0 else screen_w, logical_h if logical_h > 0 else screen_h)
+
+
+def get_viewport(resources) -> Viewport:
+    """
+    Return the shared "viewport" resource, rebuilding it only when
+    screen_size/logical_size no longer match (window resized, settings changed).
+    """
+    screen_size = tuple(resources.try_get("screen_size", FALLBACK_SCREEN_SIZE))
+    logical_size = _effective_logical(screen_size, resources.try_get("logical_size"))
+
+    viewport = resources.try_get("viewport")
+    if viewport is None or viewport.screen_size != screen_size or viewport.logical_size != logical_size:
+        viewport = Viewport.from_sizes(screen_size, logical_size)
+        resources.set("viewport", viewport)
+    return viewport
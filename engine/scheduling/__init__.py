@@ -1,4 +1,4 @@
 # engine/scheduling/__init__.py
-from .scheduler import Scheduler
+from .scheduler import UPDATE_PHASES, Scheduler
 
-__all__ = ["Scheduler"]
+__all__ = ["Scheduler", "UPDATE_PHASES"]
@@ -1,9 +1,12 @@
 # engine/scheduling/scheduler.py
 from __future__ import annotations
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 from engine.ecs import System, World
 
+# Phases run by Scheduler.update(), in order; commands are flushed after the last.
+UPDATE_PHASES = ("pre_update", "logic", "post_update")
+
 
 class Scheduler:
     """
@@ -33,12 +36,21 @@ class Scheduler:
             raise ValueError(f"Unknown phase: {ph!r}")
         self._systems_by_phase[ph].append(system)
 
+    def systems_in(self, phase: str) -> List[System]:
+        """Systems registered for one phase, in run order."""
+        return list(self._systems_by_phase[phase])
+
+    def systems(self) -> Iterator[System]:
+        """All registered systems, in phase then registration order."""
+        for systems in self._systems_by_phase.values():
+            yield from systems
+
     # ------------------------------------------------------------------
     # Update & render loops
     # ------------------------------------------------------------------
     def update(self, world: World, dt: float) -> None:
         # pre_update, logic, post_update
-        for phase in ("pre_update", "logic", "post_update"):
+        for phase in UPDATE_PHASES:
             for sys in self._systems_by_phase[phase]:
                 sys.update(world, dt)
             # After post_update, we want to apply entity commands
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import pygame
+
+from engine.adapters.asset_loader import Assets, DecodedImageCache
+
+
+def _write_png(path, color) -> None:
+    surf = pygame.Surface((5, 3), pygame.SRCALPHA)
+    surf.fill(color)
+    pygame.image.save(surf, str(path))
+
+
+def test_decoded_pixels_are_reused_from_disk(tmp_path):
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    try:
+        src = tmp_path / "fish.png"
+        _write_png(src, (10, 20, 30, 255))
+        cache_dir = tmp_path / "cache"
+
+        cold = DecodedImageCache(cache_dir)
+        first = cold.load(src)
+        assert (cold.hits, cold.misses) == (0, 1)
+        assert len(list(cache_dir.glob("*.raw"))) == 1
+
+        warm = DecodedImageCache(cache_dir)
+        assets = Assets(tmp_path, manifest={"fish": "fish.png"}, disk_cache=warm)
+        image = assets.get_image("fish")
+        assert (warm.hits, warm.misses) == (1, 0)
+        assert image.get_size() == first.get_size() == (5, 3)
+        assert image.get_at((4, 2)) == (10, 20, 30, 255)
+
+        # Editing the source changes its hash, so the old entry is not used.
+        _write_png(src, (200, 0, 0, 255))
+        changed = DecodedImageCache(cache_dir)
+        assert changed.load(src).get_at((0, 0)) == (200, 0, 0, 255)
+        assert changed.misses == 1
+    finally:
+        pygame.quit()
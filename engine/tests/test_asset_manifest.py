@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pygame
+
+from engine.adapters.asset_loader import Assets
+from engine.game.data.configs import (
+    load_asset_manifest,
+    load_pellet_config,
+    load_ui_config,
+    referenced_sprite_ids,
+)
+from engine.game.factories import load_species_config
+
+
+def test_manifest_covers_every_referenced_sprite():
+    ids = referenced_sprite_ids(load_species_config(), load_pellet_config(), load_ui_config())
+    assert {"goldfish", "pellet"} <= ids
+    assert ids <= set(load_asset_manifest()["images"])
+
+
+def _write_png(path, color) -> None:
+    surf = pygame.Surface((4, 4))
+    surf.fill(color)
+    pygame.image.save(surf, str(path))
+
+
+def test_assets_load_lazily_and_prefetch_in_background(tmp_path):
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    try:
+        _write_png(tmp_path / "a.png", (255, 0, 0))
+        _write_png(tmp_path / "b.png", (0, 255, 0))
+        assets = Assets(tmp_path, manifest={"a": "a.png", "b": "b.png", "broken": "missing.png"})
+
+        # Nothing decoded up front.
+        assert assets._images == {}
+        assert assets.has_image("a")
+        assert assets.get_image("a").get_at((0, 0))[:3] == (255, 0, 0)
+        assert not assets.has_image("broken")
+        assert not assets.has_image("unknown")
+
+        worker = assets.prefetch(background=True)
+        worker.join()
+        assert "b" not in assets._images  # converted on the main thread
+        assert assets.poll_prefetch() is True
+        assert assets.poll_prefetch() is False
+        assert assets.get_image("b").get_at((0, 0))[:3] == (0, 255, 0)
+    finally:
+        pygame.quit()
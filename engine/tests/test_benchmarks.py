@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import copy
+import json
+
+from engine.benchmarks import Scenario, compare_results, run_scenario, run_suite
+
+
+def test_scenario_times_systems_flush_and_views() -> None:
+    result = run_scenario(Scenario(fish=40, pellets=True, frames=4, warmup=1, pellet_every=2))
+
+    assert result["fish"] == 40
+    assert result["entities"] > 40  # pellets were flushed into the world
+    timings = result["timings"]
+    for key in (
+        "frame", "phase:logic", "FishFSMSystem", "MovementSystem", "FallingSystem",
+        "flush_commands", "view(Fish,Brain,MovementIntent)",
+    ):
+        assert timings[key]["mean_ms"] >= 0.0
+
+
+def test_baseline_comparison_flags_only_real_slowdowns() -> None:
+    baseline = run_suite(sizes=(20,), pellets=(False,), frames=2, warmup=0)
+    json.dumps(baseline)  # machine-readable
+
+    current = copy.deepcopy(baseline)
+    timings = current["scenarios"]["fish=20,pellets=off"]["timings"]
+    timings["MovementSystem"]["median_ms"] = 3 * timings["MovementSystem"]["median_ms"] + 1.0  # real slowdown
+    timings["FishFSMSystem"]["median_ms"] *= 1.1  # within tolerance
+
+    regressions = compare_results(current, baseline, tolerance=0.25)
+    assert [(r.scenario, r.key) for r in regressions] == [("fish=20,pellets=off", "MovementSystem")]
+    assert compare_results(baseline, baseline) == []
+
+
+def test_autosave_scenario_reports_the_autosave_share_of_a_frame() -> None:
+    scenario = Scenario(fish=40, pellets=False, frames=6, warmup=1, autosave=True)
+    assert scenario.name == "fish=40,pellets=off,autosave=on"
+
+    result = run_scenario(scenario)
+    assert result["timings"]["AutosaveSystem"]["max_ms"] >= 0.0
+    assert result["autosave_max_share"] >= 0.0
+    assert "autosave_max_share" not in run_scenario(Scenario(fish=40, pellets=False, frames=2, warmup=0))
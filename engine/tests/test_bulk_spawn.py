@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import random
+
+from engine.ecs import World
+from engine.ecs.commands import CreateEntitiesCmd
+from engine.game.components import Position, Velocity, RectSprite, SpriteRef, Fish, Brain, MovementIntent, InTank, Tank
+from engine.game.components.falling import Falling
+from engine.game.components.pellet import Pellet
+from engine.game.factories import load_species_config, create_fish, create_fish_batch
+from engine.game.factories.pellet_factory import create_pellet_cmd, create_pellets_cmd
+from engine.game.rules import count_fish_in_tank, spawn_fish_batch
+
+
+def test_create_fish_batch_matches_single_fish_components() -> None:
+    species_cfg = load_species_config()
+    world = World()
+
+    single = create_fish(world, species_cfg, "debug_fish", 5.0, 6.0, random.Random(1))
+    batch = create_fish_batch(world, species_cfg, "debug_fish", [(1.0, 2.0), (3.0, 4.0)], random.Random(1))
+
+    assert batch == [single + 1, single + 2]
+    for ctype in (Position, Velocity, RectSprite, SpriteRef, Fish, Brain, MovementIntent):
+        store = world.get_components(ctype)
+        assert single in store
+        assert all(eid in store for eid in batch)
+
+    positions = world.get_components(Position)
+    assert (positions[batch[1]].x, positions[batch[1]].y) == (3.0, 4.0)
+    # Each fish gets its own component instances.
+    assert world.get_components(Brain)[batch[0]] is not world.get_components(Brain)[batch[1]]
+
+
+def test_spawn_fish_batch_caps_at_remaining_capacity() -> None:
+    world = World()
+    tank = world.create_entity()
+    world.add_component(tank, Tank(tank_id="cap", max_fish=5))
+    species_cfg = load_species_config()
+    rng = random.Random(3)
+
+    first = spawn_fish_batch(world, tank, species_cfg, "debug_fish", [(10.0, 10.0)] * 3, rng)
+    second = spawn_fish_batch(world, tank, species_cfg, "debug_fish", [(20.0, 20.0)] * 3, rng)
+    third = spawn_fish_batch(world, tank, species_cfg, "debug_fish", [(30.0, 30.0)], rng)
+
+    assert len(first) == 3
+    assert len(second) == 2
+    assert third == []
+    assert count_fish_in_tank(world, tank) == 5
+    in_tank = world.get_components(InTank)
+    assert all(in_tank[eid].tank == tank for eid in first + second)
+
+
+def test_spawn_fish_batch_invalidates_cached_views() -> None:
+    world = World()
+    tank = world.create_entity()
+    species_cfg = load_species_config()
+
+    assert list(world.view(Fish, InTank)) == []
+    spawn_fish_batch(world, tank, species_cfg, "debug_fish", [(0.0, 0.0), (1.0, 1.0)], random.Random(0))
+    assert len(list(world.view(Fish, InTank))) == 2
+
+
+def test_create_pellets_cmd_matches_single_pellet_draws() -> None:
+    cfg = {
+        "size": 10.0,
+        "color": [1, 2, 3],
+        "sprite_id": "pellet",
+        "falling": {
+            "wobble_amplitude_range": [1.0, 3.0],
+            "wobble_frequency_range": [0.5, 1.5],
+            "wobble_phase_range": [0.0, 3.14],
+        },
+    }
+    positions = [(1.0, 1.0), (2.0, 2.0), (3.0, 3.0)]
+
+    rng_single = random.Random(7)
+    singles = [create_pellet_cmd(x, y, 1, pellet_cfg=cfg, rng=rng_single) for x, y in positions]
+    batch = create_pellets_cmd(positions, 1, pellet_cfg=cfg, rng=random.Random(7))
+
+    assert isinstance(batch, CreateEntitiesCmd)
+    assert batch.count == 3
+    for i, cmd in enumerate(singles):
+        assert batch.components[Falling][i] == cmd.components[Falling]
+        assert batch.components[SpriteRef][i] == cmd.components[SpriteRef]
+
+
+def test_flush_applies_batched_pellet_command() -> None:
+    world = World()
+    world.queue_command(create_pellets_cmd([(0.0, 0.0)] * 4, 1, pellet_cfg={"size": 4.0}))
+    world.queue_command(create_pellet_cmd(9.0, 9.0, 1, pellet_cfg={"size": 4.0}))
+    world.flush_commands()
+
+    pellets = list(world.view(Pellet, Position, InTank))
+    assert len(pellets) == 5
+    assert sorted(eid for eid, *_ in pellets) == [1, 2, 3, 4, 5]
+
+
+def test_spawn_fish_batch_handles_large_counts() -> None:
+    world = World()
+    tank = world.create_entity()
+    world.add_component(tank, Tank(tank_id="big", max_fish=10_000))
+    species_cfg = load_species_config()
+    positions = [(float(i % 100), float(i // 100)) for i in range(10_000)]
+
+    eids = spawn_fish_batch(world, tank, species_cfg, "debug_fish", positions, random.Random(0))
+
+    assert len(eids) == 10_000
+    assert len(world.get_components(Fish)) == 10_000
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from engine.ecs import World
+from engine.resources import ResourceStore
+from engine.events import EventBus
+from engine.game.components import Position, Velocity, UILabel
+from engine.game.systems import DebugManagerSystem
+
+
+def test_changed_reports_adds_and_marks_after_since_tick() -> None:
+    world = World()
+    a = world.create_entity()
+    b = world.create_entity()
+    world.add_component(a, Position(x=0.0, y=0.0))
+    world.add_component(b, Position(x=1.0, y=1.0))
+
+    since = world.change_tick
+    assert world.changed(Position, since) == []
+
+    # In-place edits are invisible until marked.
+    world.get_components(Position)[a].x = 5.0
+    assert world.changed(Position, since) == []
+
+    world.mark_changed(a, Position)
+    changed = world.changed(Position, since)
+    assert [eid for eid, _ in changed] == [a]
+    assert changed[0][1].x == 5.0
+
+
+def test_get_mut_marks_and_reorders_by_latest_change() -> None:
+    world = World()
+    a = world.create_entity()
+    b = world.create_entity()
+    world.add_component(a, Position(x=0.0, y=0.0))
+    world.add_component(b, Position(x=0.0, y=0.0))
+    since = world.change_tick
+
+    world.get_mut(b, Position).x = 1.0
+    world.get_mut(a, Position).x = 2.0
+    assert world.get_mut(a, Velocity) is None
+
+    assert [eid for eid, _ in world.changed(Position, since)] == [b, a]
+    assert [eid for eid, _ in world.changed(Position, 0)] == [b, a]
+
+
+def test_removed_components_drop_out_of_changed() -> None:
+    world = World()
+    a = world.create_entity()
+    b = world.create_entity()
+    world.add_components(Position, [a, b], [Position(x=0.0, y=0.0), Position(x=1.0, y=1.0)])
+    before = world.last_change(Position)
+
+    world.remove_component(a, Position)
+    world.destroy_entity(b)
+
+    assert world.changed(Position, 0) == []
+    assert world.last_change(Position) > before
+
+
+def test_debug_manager_marks_only_labels_whose_text_changed() -> None:
+    resources = ResourceStore()
+    resources.register("events", EventBus())
+    resources.set("debug_panels_config", {"panels": []})
+    world = World()
+    fps_label = world.create_entity()
+    world.add_component(fps_label, UILabel(text="debug_fps", text_key="debug_fps"))
+    static_label = world.create_entity()
+    world.add_component(static_label, UILabel(text="Motion Debug", text_key=""))
+
+    sys = DebugManagerSystem(resources)
+    since = world.change_tick
+    sys.update(world, dt=0.5)
+
+    assert [eid for eid, _ in world.changed(UILabel, since)] == [fps_label]
+
+    # Static text and an unchanged tool label produce no further changes.
+    since = world.change_tick
+    sys.update(world, dt=0.0)
+    assert world.changed(UILabel, since) == []
+
+
+def test_mark_all_changed_reports_whole_store_in_constant_time() -> None:
+    world = World()
+    a = world.create_entity()
+    b = world.create_entity()
+    world.add_component(a, Position(x=0.0, y=0.0))
+    world.add_component(b, Position(x=1.0, y=1.0))
+    since = world.change_tick
+
+    world.mark_all_changed(Position)
+
+    assert [eid for eid, _ in world.changed(Position, since)] == [a, b]
+    assert world.last_change(Position) == world.change_tick
+    assert world.changed(Position, world.change_tick) == []
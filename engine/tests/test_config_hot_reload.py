@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import os
+
+from engine.ecs import World
+from engine.events import EventBus
+from engine.resources import ResourceStore
+from engine.game.data.registry import ConfigRegistry
+from engine.game.events.config_events import ConfigChanged
+from engine.game.systems import ConfigReloadSystem, FishFSMSystem
+
+
+def _write(path, payload, stamp: int) -> None:
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    os.utime(path, ns=(stamp, stamp))
+
+
+def test_reloaded_fsm_config_rebinds_states_without_touching_fish(tmp_path):
+    fsm_path = tmp_path / "fsm.json"
+    _write(fsm_path, {"_version": 1, "idle_duration_range": [1.0, 1.0]}, 1)
+
+    registry = ConfigRegistry(data_dir=tmp_path, cache_dir=None)
+    resources = ResourceStore()
+    bus = EventBus()
+    resources.register("events", bus)
+    resources.set("config_registry", registry)
+    resources.set("fsm_config", registry.get("fsm"))
+
+    seen = []
+    bus.subscribe(ConfigChanged, seen.append)
+    fsm = FishFSMSystem(resources)
+    reload_sys = ConfigReloadSystem(resources, poll_interval=0.5)
+    cruise = fsm._states["cruise"]
+    cruise._targets[7] = (1.0, 2.0)
+
+    world = World()
+    _write(fsm_path, {"_version": 1, "idle_duration_range": [3.0, 4.0]}, 2)
+    reload_sys.update(world, 0.1)  # before the poll interval: nothing yet
+    assert seen == []
+
+    reload_sys.update(world, 0.5)
+    assert seen == [ConfigChanged(name="fsm", resource="fsm_config")]
+    assert resources.get("fsm_config")["idle_duration_range"] == (3.0, 4.0)
+    assert fsm._states["idle"]._dur_range == (3.0, 4.0)
+    assert fsm._states["cruise"] is cruise
+    assert cruise._targets[7] == (1.0, 2.0)
+
+    # A broken edit keeps the previous config and publishes nothing.
+    fsm_path.write_text("{ not json", encoding="utf-8")
+    os.utime(fsm_path, ns=(3, 3))
+    reload_sys.update(world, 0.5)
+    assert len(seen) == 1
+    assert resources.get("fsm_config")["idle_duration_range"] == (3.0, 4.0)
+
+
+def test_watcher_survives_a_file_deleted_between_polls(tmp_path, monkeypatch):
+    from engine.game.data.watcher import ConfigWatcher
+
+    path = tmp_path / "fsm.json"
+    _write(path, {"_version": 1, "idle": 1.0}, 1)
+    registry = ConfigRegistry(data_dir=tmp_path, cache_dir=None)
+    assert registry.get("fsm")["idle"] == 1.0
+    watcher = ConfigWatcher(registry, ["fsm"])
+
+    # An atomic save: the watcher sees the new stamp, then the file is
+    # renamed away before the registry reads it.
+    _write(path, {"_version": 1, "idle": 2.0}, 2)
+    load = registry._load
+
+    def load_after_delete(name):
+        path.unlink()
+        return load(name)
+
+    monkeypatch.setattr(registry, "_load", load_after_delete)
+    assert watcher.poll() == []
+    assert isinstance(watcher.errors["fsm"], FileNotFoundError)
+    assert registry.get("fsm")["idle"] == 1.0
+
+    # The replacement lands; the next poll picks it up and clears the error.
+    monkeypatch.setattr(registry, "_load", load)
+    _write(path, {"_version": 1, "idle": 3.0}, 3)
+    assert watcher.poll() == ["fsm"]
+    assert "fsm" not in watcher.errors
+    assert registry.get("fsm")["idle"] == 3.0
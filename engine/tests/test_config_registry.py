@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import os
+import pickle
+
+import pytest
+
+from engine.game.data.registry import ConfigError, ConfigRegistry, FrozenDict
+
+
+def _write(path, payload) -> None:
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def test_registry_freezes_and_caches_compiled_configs(tmp_path):
+    data = tmp_path / "data"
+    data.mkdir()
+    _write(data / "movement.json", {"_version": 1, "max_speed": 120.0, "debug": {"color": [1, 2, 3]}})
+    cache = tmp_path / "cache"
+
+    first = ConfigRegistry(data_dir=data, cache_dir=cache)
+    cfg = first.get("movement")
+    assert isinstance(cfg, FrozenDict)
+    assert cfg["debug"]["color"] == (1, 2, 3)
+    assert first.get("movement") is cfg  # loaded once
+    with pytest.raises(TypeError):
+        cfg["max_speed"] = 1.0
+    assert pickle.loads(pickle.dumps(cfg)) == cfg
+
+    # A second registry reads the compiled pickle instead of the JSON file.
+    (data / "movement.json").write_text("not json", encoding="utf-8")
+    stat = (data / "movement.json").stat()
+    compiled = next(cache.glob("movement.*.pickle"))
+    payload = pickle.loads(compiled.read_bytes())
+    payload["stamp"] = (stat.st_mtime_ns, stat.st_size)
+    compiled.write_bytes(pickle.dumps(payload))
+    assert ConfigRegistry(data_dir=data, cache_dir=cache).get("movement")["max_speed"] == 120.0
+
+
+def test_registries_over_different_data_dirs_share_a_cache_dir(tmp_path):
+    cache = tmp_path / "cache"
+    dirs = []
+    for speed in (1.0, 2.0):
+        data = tmp_path / f"data{int(speed)}"
+        data.mkdir()
+        path = data / "movement.json"
+        _write(path, {"_version": 1, "max_speed": speed})
+        os.utime(path, ns=(1, 1))  # identical (mtime_ns, size) stamps
+        dirs.append(data)
+
+    for data, speed in zip(dirs, (1.0, 2.0)):
+        assert ConfigRegistry(data_dir=data, cache_dir=cache).get("movement")["max_speed"] == speed
+    for data, speed in zip(dirs, (1.0, 2.0)):
+        assert ConfigRegistry(data_dir=data, cache_dir=cache).get("movement")["max_speed"] == speed
+    assert len(list(cache.glob("movement.*.pickle"))) == 2
+    assert not list(cache.glob("*.tmp"))
+
+
+def test_registry_reload_and_validation(tmp_path):
+    data = tmp_path / "data"
+    data.mkdir()
+    path = data / "fsm.json"
+    _write(path, {"_version": 1, "idle": 1.0})
+    reg = ConfigRegistry(data_dir=data, cache_dir=None)
+    assert reg.get("fsm")["idle"] == 1.0
+
+    assert reg.reload("fsm") is False  # untouched
+    _write(path, {"_version": 1, "idle": 2.5})
+    os.utime(path, ns=(1, 1))
+    assert reg.reload("fsm") is True
+    assert reg.get("fsm")["idle"] == 2.5
+
+    _write(data / "ui.json", {"_version": 1, "components": [{"type": "panel", "style": "missing"}]})
+    with pytest.raises(ConfigError):
+        reg.get("ui")
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from engine.ecs import World
+from engine.resources import ResourceStore
+from engine.game.components import InTank, Position, RectSprite, Tank, TankBounds
+from engine.game.systems import CullingSystem, RectRenderSystem
+
+
+class FakeRenderer:
+    def __init__(self) -> None:
+        self.draw_calls = []
+
+    def clear(self) -> None:
+        pass
+
+    def present(self) -> None:
+        pass
+
+    def draw_rect(self, x, y, w, h, color, outline_width=0) -> None:
+        self.draw_calls.append((x, y, w, h, color, outline_width))
+
+
+def _tank(world: World, x: float, visible: bool = True) -> int:
+    eid = world.create_entity()
+    world.add_component(eid, Tank(tank_id=f"tank_{eid}", max_fish=10, visible=visible))
+    world.add_component(eid, TankBounds(x=x, y=0.0, width=100.0, height=100.0))
+    return eid
+
+
+def _fish(world: World, tank: int, x: float, color) -> int:
+    eid = world.create_entity()
+    world.add_component(eid, Position(x=x, y=10.0))
+    world.add_component(eid, RectSprite(width=10.0, height=10.0, color=color))
+    world.add_component(eid, InTank(tank=tank))
+    return eid
+
+
+def test_culling_skips_offscreen_and_hidden_tank_contents():
+    world = World()
+    resources = ResourceStore()
+    renderer = FakeRenderer()
+    resources.set("renderer", renderer)
+    resources.set("screen_size", (200, 200))
+    resources.set("logical_size", (200, 200))
+
+    on_screen = _tank(world, 0.0)
+    far_away = _tank(world, 1000.0)
+    hidden = _tank(world, 0.0, visible=False)
+
+    shown = _fish(world, on_screen, 10.0, (1, 1, 1))
+    edge = _fish(world, on_screen, 195.0, (2, 2, 2))  # partly visible
+    outside = _fish(world, on_screen, 250.0, (3, 3, 3))  # strayed off screen
+    remote = _fish(world, far_away, 1010.0, (4, 4, 4))
+    ghost = _fish(world, hidden, 10.0, (5, 5, 5))
+
+    CullingSystem(resources).update(world, 0.0)
+    assert resources.get("culled_entities") == {outside, remote, ghost}
+
+    RectRenderSystem(resources).update(world, 0.0)
+    colors = {call[4] for call in renderer.draw_calls}
+    assert colors == {(1, 1, 1), (2, 2, 2)}
+    assert shown not in resources.get("culled_entities")
+    assert edge not in resources.get("culled_entities")
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from engine.ecs import World
+from engine.ecs.commands import DestroyEntityCmd
+from engine.ecs.snapshot import apply_delta, capture_world, encode_capture, load_world
+from engine.game.components import Brain, Fish, Position, SpriteRef, Velocity
+from engine.game.data.registry import ConfigRegistry
+
+
+def _stores(world: World, *ctypes) -> dict:
+    return {ctype: dict(world.get_components(ctype)) for ctype in ctypes}
+
+
+def test_delta_holds_only_changes_and_replays_removals() -> None:
+    world = World()
+    eids = world.create_entities(3)
+    world.add_components(Position, eids, [Position(float(i), 0.0) for i in range(3)])
+    world.add_components(Fish, eids, [Fish(species_id="goldfish") for _ in eids])
+    base = capture_world(world)
+
+    world.get_mut(eids[0], Position).x = 10.0
+    world.destroy_entity(eids[2])
+    delta = capture_world(world, since_tick=base.change_tick)
+
+    assert [s.ctype for s in delta.stores] == [Position]
+    assert delta.stores[0].eids == [eids[0]]
+    assert set(delta.live) == {Position, Fish}
+
+    restored, _ = load_world(encode_capture(base))
+    apply_delta(restored, encode_capture(delta))
+    assert _stores(restored, Position, Fish) == _stores(world, Position, Fish)
+
+
+def test_delta_leaves_out_unchanged_sprite_and_brain_rows() -> None:
+    from engine.app.boot import build_tank_engine
+
+    engine = build_tank_engine("tank_1", ConfigRegistry(cache_dir=None), fish=300)
+    for _ in range(10):
+        engine.update(1 / 60)
+    world = engine.world
+    base = capture_world(world)
+    facing = {eid: s.facing_left for eid, s in world.get_components(SpriteRef).items()}
+    brains = {eid: (b.state, b.entered_at) for eid, b in world.get_components(Brain).items()}
+
+    for _ in range(60):
+        engine.update(1 / 60)
+    delta = capture_world(world, since_tick=base.change_tick)
+    rows = {s.ctype: set(s.eids) for s in delta.stores}
+
+    flipped = {eid for eid, s in world.get_components(SpriteRef).items() if s.facing_left != facing[eid]}
+    switched = {eid for eid, b in world.get_components(Brain).items() if (b.state, b.entered_at) != brains[eid]}
+    # A fish may turn and turn back between checkpoints, so SpriteRef rows
+    # can include unflipped fish; brains change on every switch.
+    assert flipped <= rows[SpriteRef] and len(rows[SpriteRef]) < len(facing)
+    assert rows[Brain] == switched and 0 < len(switched) < len(brains)
+    # Positions really do change every frame and stay bulk-marked.
+    assert rows[Position] == set(world.get_components(Position))
+
+
+def test_captured_values_do_not_follow_later_edits() -> None:
+    world = World()
+    eid = world.create_entity()
+    world.add_component(eid, Position(1.0, 2.0))
+
+    capture = capture_world(world)
+    world.get_components(Position)[eid].x = 99.0
+
+    restored, _ = load_world(encode_capture(capture))
+    assert restored.get_components(Position)[eid].x == 1.0
+
+
+def test_autosave_chain_restores_latest_checkpoint(tmp_path) -> None:
+    from engine.app.autosave import AutosaveSystem, load_autosave
+    from engine.app.boot import build_engine
+
+    registry = ConfigRegistry(cache_dir=None)
+    engine = build_engine(registry)
+    autosave = AutosaveSystem(
+        engine.resources, engine.scheduler, tmp_path, interval=0.0, keyframe_every=100
+    )
+    engine.scheduler.add_system(autosave, phase="pre_update")
+    try:
+        for frame in range(30):
+            if frame == 10:
+                victim = next(iter(engine.world.get_components(Fish)))
+                engine.world.queue_command(DestroyEntityCmd(entity_id=victim))
+            engine.update(1 / 60)
+        assert autosave.writer.flush(timeout=5.0)
+        autosave.checkpoint(engine.world)
+        assert autosave.writer.flush(timeout=5.0)
+    finally:
+        autosave.close()
+    assert autosave.writer.last_error is None
+
+    other = build_engine(registry)
+    applied = load_autosave(other, tmp_path)
+
+    assert applied >= 1
+    assert list((tmp_path).glob("*.tmp")) == []
+    assert _stores(other.world, Position, Velocity, Fish) == _stores(engine.world, Position, Velocity, Fish)
+    assert victim not in other.world.get_components(Fish)
+
+    # ...and continues in lockstep with the original.
+    for _ in range(20):
+        engine.update(1 / 60)
+        other.update(1 / 60)
+    assert _stores(other.world, Position) == _stores(engine.world, Position)
+
+
+def test_incremental_capture_is_consistent_at_its_last_step() -> None:
+    from engine.ecs.snapshot import IncrementalCapture
+
+    world = World()
+    eids = world.create_entities(3000)
+    world.add_components(Position, eids, [Position(float(i), 0.0) for i in range(3000)])
+    world.add_components(Fish, eids, [Fish(species_id="goldfish") for _ in eids])
+    world.add_components(Brain, eids, [Brain() for _ in eids])
+
+    capture = IncrementalCapture(world)
+    steps = 0
+    while not capture.step(0.0):
+        steps += 1
+        # Edits between slices, the way systems make them.
+        for pos in world.get_components(Position).values():
+            pos.x += 1.0
+        world.mark_all_changed(Position)
+        world.get_mut(eids[steps], Brain).state = "cruise"
+        world.get_mut(eids[-steps], Fish).species_id = "guppy"
+        world.destroy_entity(eids[1000 + steps])
+        newcomer = world.create_entity()
+        world.add_component(newcomer, Fish(species_id="newt"))
+    assert steps > 1
+
+    restored, _ = load_world(encode_capture(capture.finish()))
+    for ctype in (Position, Fish, Brain):
+        assert list(restored.get_components(ctype).items()) == list(world.get_components(ctype).items())
+
+
+def test_autosave_copies_one_slice_per_frame_until_it_finishes(tmp_path) -> None:
+    from engine.app.autosave import AutosaveSystem
+    from engine.app.boot import build_tank_engine
+
+    engine = build_tank_engine("tank_1", ConfigRegistry(cache_dir=None), fish=300)
+    engine.update(1 / 60)
+    world = engine.world
+    # A zero budget still copies one slice per step, then stops.
+    autosave = AutosaveSystem(
+        engine.resources, engine.scheduler, tmp_path, interval=0.0, keyframe_every=1, step_budget=0.0
+    )
+    steps = 0
+    finishes: list[int] = []
+    try:
+        for _ in range(40):
+            capture = autosave._capture
+            if capture is None or capture.done:
+                autosave.update(world, 1 / 60)
+                if capture is not None:  # this frame finished it
+                    assert autosave._capture is None
+                    finishes.append(steps)
+                    steps = 0
+                    assert autosave.writer.flush(timeout=5.0)
+                    assert autosave.writer.written == len(finishes)
+                else:
+                    steps += 1
+            else:
+                left = len(capture._slices)
+                autosave.update(world, 1 / 60)
+                assert len(capture._slices) == left - 1
+                steps += 1
+            engine.update(1 / 60)
+    finally:
+        autosave.close()
+    assert len(finishes) >= 2
+    # Fish, RectSprite, SpriteRef, Brain and InTank each take a slice.
+    assert all(n >= 5 for n in finishes), finishes
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pygame
+
+from engine.ecs import World
+from engine.resources import ResourceStore
+from engine.adapters.pygame_render.renderer import Renderer
+from engine.game.components import Position, RectSprite, Velocity
+from engine.game.systems import RectRenderSystem
+
+
+def _scene(dirty: bool):
+    world = World()
+    resources = ResourceStore()
+    surface = pygame.Surface((200, 100))
+    renderer = Renderer(surface, bg_color=(10, 20, 30), dirty_rects=dirty)
+    resources.set("renderer", renderer)
+    resources.set("screen_size", (200, 100))
+    resources.set("logical_size", (200, 100))
+
+    panel = world.create_entity()
+    world.add_component(panel, Position(x=0.0, y=0.0))
+    world.add_component(panel, RectSprite(width=200.0, height=20.0, color=(50, 50, 50)))
+
+    fish = world.create_entity()
+    world.add_component(fish, Position(x=10.0, y=40.0))
+    world.add_component(fish, Velocity(vx=0.0, vy=0.0))
+    world.add_component(fish, RectSprite(width=10.0, height=10.0, color=(255, 0, 0)))
+    return world, RectRenderSystem(resources), renderer, surface, panel, fish
+
+
+def _frames_match(step, check=None) -> None:
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    try:
+        full = _scene(dirty=False)
+        dirty = _scene(dirty=True)
+        for frame in range(4):
+            for world, sys, renderer, surface, panel, fish in (full, dirty):
+                step(world, frame, panel, fish)
+                sys.update(world, dt=0.016)
+            assert pygame.image.tobytes(full[3], "RGB") == pygame.image.tobytes(dirty[3], "RGB")
+            if check is not None:
+                check(frame, full[3])
+    finally:
+        pygame.quit()
+
+
+def test_dirty_rect_mode_matches_full_redraw_for_moving_entities() -> None:
+    def step(world, frame, panel, fish):
+        world.get_components(Position)[fish].x += 15.0
+
+    _frames_match(step)
+
+
+def test_dirty_rect_mode_recaptures_background_when_statics_change() -> None:
+    def step(world, frame, panel, fish):
+        if frame == 2:
+            world.get_mut(panel, RectSprite).color = (0, 200, 0)
+
+    def check(frame, surface):
+        expected = (0, 200, 0) if frame >= 2 else (50, 50, 50)
+        assert surface.get_at((100, 10))[:3] == expected
+
+    _frames_match(step, check)
+
+
+def test_unmarked_static_edits_stay_invisible_until_marked() -> None:
+    def step(world, frame, panel, fish):
+        if frame == 1:
+            world.get_components(RectSprite)[panel].color = (0, 200, 0)  # not marked
+        if frame == 3:
+            world.mark_changed(panel, RectSprite)
+
+    def check(frame, surface):
+        expected = (0, 200, 0) if frame >= 3 else (50, 50, 50)
+        assert surface.get_at((100, 10))[:3] == expected
+
+    _frames_match(step, check)
+
+
+def test_dirty_rect_renderer_tracks_only_draws_after_capture() -> None:
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    try:
+        renderer = Renderer(pygame.Surface((50, 50)), dirty_rects=True)
+        renderer.clear()
+        renderer.draw_rect(0, 0, 50, 10, (1, 2, 3))
+        renderer.capture_background()
+        renderer.draw_rect(5, 20, 4, 4, (9, 9, 9))
+        assert renderer._dirty == [pygame.Rect(5, 20, 4, 4)]
+        renderer.present()
+
+        # Next frame restores last frame's rect from the background.
+        renderer.clear()
+        assert renderer.screen.get_at((6, 21))[:3] == renderer.bg_color
+
+        renderer.set_screen(pygame.Surface((60, 60)))
+        assert renderer.has_background is False
+    finally:
+        pygame.quit()
@@ -24,3 +24,27 @@ def test_draw_text_uses_font_path_if_exists(tmp_path) -> None:
             assert True
     finally:
         pygame.quit()
+
+
+def test_draw_text_reuses_rendered_surfaces(monkeypatch) -> None:
+    import pygame
+    pygame.init()
+    screen = pygame.display.set_mode((10, 10))
+    try:
+        renderer = Renderer(screen)
+        exists_calls = []
+        real_exists = Path.exists
+        monkeypatch.setattr(Path, "exists", lambda self: exists_calls.append(self) or real_exists(self))
+
+        for _ in range(3):
+            renderer.draw_text("idle", 0, 0, color=(255, 255, 255), font_name="no_such_font.ttf")
+            renderer.draw_text("cruise", 0, 0, color=(255, 255, 255), font_name="no_such_font.ttf")
+        renderer.draw_text("idle", 0, 0, color=(255, 0, 0), font_name="no_such_font.ttf")
+
+        # Font path resolved once; one surface per (text, color) combination.
+        assert len(exists_calls) == 1
+        stats = renderer._text_cache.stats()
+        assert stats["entries"] == 3
+        assert stats["misses"] == 3 and stats["hits"] == 4
+    finally:
+        pygame.quit()
@@ -21,6 +21,8 @@ def _make_world_and_fsm() -> tuple[World, ResourceStore, FishFSMSystem]:
     # Deterministic RNG for FSM decisions
     rng_ai = random.Random(123)
     resources.set("rng_ai", rng_ai)
+    # Start every fish idle; the start-state draw is covered elsewhere.
+    resources.set("fsm_config", {"start_state_weights": {"idle": 1.0}})
 
     fsm_sys = FishFSMSystem(resources)
     return world, resources, fsm_sys
@@ -53,8 +55,8 @@ def test_fish_fsm_idle_to_cruise_to_idle() -> None:
 
     assert brain.state == "cruise"
     assert brain.initialized is True
-    # Entering cruise resets time_in_state
-    assert brain.time_in_state == 0.0
+    # Entering cruise restarts the state timer
+    assert brain.entered_at == fsm_sys.clock
     # Cruise should have non-zero intent
     assert (intent.target_vx != 0.0) or (intent.target_vy != 0.0)
 
@@ -181,7 +183,7 @@ def test_fsm_respects_configured_durations() -> None:
     # Advance exactly idle duration -> should enter cruise
     fsm_sys.update(world, dt=0.1)
     assert brain.state == "cruise"
-    assert brain.time_in_state == 0.0
+    assert brain.entered_at == fsm_sys.clock
 
     # Advance exactly cruise duration -> should return to idle
     fsm_sys.update(world, dt=0.2)
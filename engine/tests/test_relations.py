@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from engine.ecs import World, EntityId, parent_link
+from engine.ecs.commands import DestroyEntityCmd
+from engine.game.components import Fish, InTank, Position, Tank
+
+
+def _tank_with_fish(world: World, count: int):
+    tank = world.create_entity()
+    world.add_component(tank, Tank(tank_id="t", max_fish=10))
+    fish = []
+    for _ in range(count):
+        eid = world.create_entity()
+        world.add_component(eid, Fish(species_id="debug_fish"))
+        world.add_component(eid, InTank(tank=tank))
+        fish.append(eid)
+    return tank, fish
+
+
+def test_relation_index_tracks_children_and_parent() -> None:
+    world = World()
+    tank_a, fish_a = _tank_with_fish(world, 2)
+    tank_b, fish_b = _tank_with_fish(world, 1)
+
+    assert set(world.children(InTank, tank_a)) == set(fish_a)
+    assert set(world.children(InTank, tank_b)) == set(fish_b)
+    assert world.parent(InTank, fish_a[0]) == tank_a
+    assert world.parent(InTank, tank_a) is None
+
+
+def test_relation_index_follows_readd_and_remove() -> None:
+    world = World()
+    tank_a, fish_a = _tank_with_fish(world, 1)
+    tank_b, _ = _tank_with_fish(world, 0)
+    eid = fish_a[0]
+
+    # Re-adding the link component moves the child.
+    world.add_component(eid, InTank(tank=tank_b))
+    assert eid not in world.children(InTank, tank_a)
+    assert world.parent(InTank, eid) == tank_b
+
+    world.remove_component(eid, InTank)
+    assert world.parent(InTank, eid) is None
+    assert len(world.children(InTank, tank_b)) == 0
+
+
+def test_relink_after_in_place_edit() -> None:
+    world = World()
+    tank_a, fish_a = _tank_with_fish(world, 1)
+    tank_b, _ = _tank_with_fish(world, 0)
+
+    world.get_components(InTank)[fish_a[0]].tank = tank_b
+    world.relink(fish_a[0], InTank)
+
+    assert world.parent(InTank, fish_a[0]) == tank_b
+
+
+def test_destroying_tank_cascades_to_children_on_flush() -> None:
+    world = World()
+    tank, fish = _tank_with_fish(world, 3)
+    other_tank, other_fish = _tank_with_fish(world, 1)
+
+    world.queue_command(DestroyEntityCmd(entity_id=tank))
+    world.flush_commands()
+
+    assert tank not in world.get_components(Tank)
+    assert all(eid not in world.get_components(Fish) for eid in fish)
+    assert other_fish[0] in world.get_components(Fish)
+    assert len(world.children(InTank, tank)) == 0
+    assert set(world.children(InTank, other_tank)) == set(other_fish)
+
+
+def test_non_cascading_link_only_detaches_children() -> None:
+    @parent_link("owner", cascade_destroy=False)
+    @dataclass
+    class OwnedBy:
+        owner: EntityId
+
+    world = World()
+    owner = world.create_entity()
+    world.add_component(owner, Position(x=0.0, y=0.0))
+    child = world.create_entity()
+    world.add_component(child, OwnedBy(owner=owner))
+
+    world.destroy_entity(owner)
+
+    assert child in world.get_components(OwnedBy)
+    assert world.parent(OwnedBy, child) is None
+
+
+def test_relation_queries_reject_plain_components() -> None:
+    world = World()
+    with pytest.raises(TypeError):
+        world.children(Position, EntityId(1))
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import pygame
+
+from engine.adapters.pygame_render.renderer import Renderer
+from engine.adapters.pygame_render.scale_cache import SurfaceLRU, surface_bytes
+
+
+def test_lru_evicts_oldest_over_budget():
+    a = pygame.Surface((10, 10))
+    b = pygame.Surface((10, 10))
+    c = pygame.Surface((10, 10))
+    cache = SurfaceLRU(budget_bytes=surface_bytes(a) * 2)
+
+    cache.put("a", a)
+    cache.put("b", b)
+    assert cache.get("a") is a  # refresh "a"; "b" is now oldest
+    cache.put("c", c)
+
+    assert "b" not in cache
+    assert cache.get("a") is a and cache.get("c") is c
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3 and stats["misses"] == 1
+    assert stats["bytes"] <= stats["budget"]
+
+
+def test_renderer_buckets_sizes_and_keys_by_sprite_id():
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    try:
+        renderer = Renderer(pygame.Surface((64, 64)), scale_bucket_px=4)
+        image = pygame.Surface((8, 8))
+
+        renderer.draw_image(image, 0, 0, 17, 17, sprite_id="fish")
+        renderer.draw_image(image, 0, 0, 15, 15, sprite_id="fish")
+        stats = renderer.scale_cache_stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1 and stats["misses"] == 1
+
+        # Same size, different sprite id -> separate entry even for one surface.
+        renderer.draw_image(image, 0, 0, 16, 16, sprite_id="other")
+        assert renderer.scale_cache_stats()["entries"] == 2
+    finally:
+        pygame.quit()
+
+
+def test_prebake_installs_variants_before_first_draw():
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    try:
+        renderer = Renderer(pygame.Surface((64, 64)))
+        image = pygame.Surface((8, 8))
+        variants = [(image, 16, 16, False, "fish"), (image, 16, 16, True, "fish")]
+
+        worker = renderer.prebake(variants, background=True)
+        assert worker is not None
+        worker.join()
+        # Baked variants are swapped in at the next frame boundary.
+        assert renderer.scale_cache_stats()["entries"] == 0
+        renderer.clear()
+        assert renderer.scale_cache_stats()["entries"] == 2
+
+        renderer.draw_image(image, 0, 0, 16, 16, flip_x=True, sprite_id="fish")
+        stats = renderer.scale_cache_stats()
+        assert stats["hits"] == 1 and stats["misses"] == 0
+
+        # Already-cached variants are not rebuilt.
+        assert renderer.prebake(variants, background=True) is None
+    finally:
+        pygame.quit()
+
+
+def test_newer_prebake_supersedes_older_ones():
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    try:
+        renderer = Renderer(pygame.Surface((64, 64)))
+        image = pygame.Surface((32, 32))
+        # A resize drag: one request per intermediate scale, then the final one.
+        stale = [renderer.prebake([(image, w, w, False, "fish")], background=True) for w in range(10, 40)]
+        final = renderer.prebake([(image, 48, 48, False, "fish")], background=True)
+        assert final.join(timeout=5.0)
+        assert all(request.join(timeout=5.0) for request in stale if request is not None)
+        assert not final.cancelled
+
+        renderer.clear()
+        stats = renderer.scale_cache_stats()
+        assert stats["entries"] == 1
+        renderer.draw_image(image, 0, 0, 48, 48, sprite_id="fish")
+        assert renderer.scale_cache_stats()["hits"] == 1
+    finally:
+        pygame.quit()
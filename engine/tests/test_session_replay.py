@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+
+from engine.app.boot import build_engine
+from engine.app.replay import SessionRecorder, replay_session
+from engine.game.components import Position, TankBounds, UIButton, UIHitbox
+from engine.game.components.pellet import Pellet
+from engine.game.data.registry import ConfigRegistry
+from engine.game.events.input_events import ClickWorld, KeyEvent, PointerMove
+
+
+def _positions(engine) -> dict:
+    return {eid: (p.x, p.y) for eid, p in engine.world.get_components(Position).items()}
+
+
+def test_replayed_session_reproduces_recorded_world(tmp_path) -> None:
+    registry = ConfigRegistry(cache_dir=None)
+    session = tmp_path / "session.jsonl"
+
+    recorded = build_engine(registry)
+    recorder = SessionRecorder(recorded.resources, session)
+    recorded.scheduler.add_system(recorder, phase="pre_update")
+    bus = recorded.resources.get("events")
+    bounds = next(iter(recorded.world.get_components(TankBounds).values()))
+    cx, cy = bounds.x + bounds.width / 2, bounds.y + bounds.height / 3
+    button = next(eid for eid, b in recorded.world.get_components(UIButton).items() if b.tool_id == "pellet")
+    bpos = recorded.world.get_components(Position)[button]
+    bbox = recorded.world.get_components(UIHitbox)[button]
+
+    for frame in range(90):
+        if frame == 2:
+            bus.publish(ClickWorld(x=bpos.x + bbox.width / 2, y=bpos.y + bbox.height / 2, button=1))
+        if frame == 5:
+            bus.publish(PointerMove(x=cx, y=cy))
+            bus.publish(ClickWorld(x=cx, y=cy, button=1))
+        if frame == 20:
+            bus.publish(KeyEvent(key="f1", pressed=True))
+            bus.publish(KeyEvent(key="f1", pressed=False))
+        # Uneven frame times, like a real session.
+        recorded.update(1 / 60 if frame % 3 else 1 / 45)
+    recorder.close()
+
+    lines = [json.loads(line) for line in session.read_text(encoding="utf-8").splitlines()]
+    assert lines[0]["kind"] == "header"
+    assert sum(1 for rec in lines if rec["kind"] == "frame") == 90
+    assert sum(1 for rec in lines if rec["kind"] == "event") == 5
+
+    replayed = build_engine(registry)
+    result = replay_session(replayed, session)
+
+    assert (result.frames, result.events) == (90, 5)
+    assert replayed.world.get_components(Pellet)
+    assert _positions(replayed) == _positions(recorded)
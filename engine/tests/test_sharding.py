@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from engine.app.boot import build_tank_engine
+from engine.app.sharding import ShardedEngine, TankSpec, assign_shards, tank_specs
+from engine.ecs.state_hash import StateHasher
+from engine.game.components import Brain, Position, RectSprite, Velocity
+from engine.game.data.registry import ConfigRegistry
+
+
+def test_tank_specs_and_assignment() -> None:
+    specs = tank_specs(["tank_1", "small_test_tank", "tank_1"], fish=None)
+    assert [s.name for s in specs] == ["tank_1", "small_test_tank", "tank_1#2"]
+
+    weighted = [TankSpec("a", "tank_1", fish=100), TankSpec("b", "tank_1", fish=60), TankSpec("c", "tank_1", fish=50)]
+    groups = assign_shards(weighted, 2, ConfigRegistry(cache_dir=None))
+    assert sorted(sorted(s.name for s in g) for g in groups) == [["a"], ["b", "c"]]
+
+
+def test_sharded_tanks_match_in_process_simulation() -> None:
+    specs = [
+        TankSpec("left", "tank_1", fish=30),
+        TankSpec("small", "small_test_tank"),
+        TankSpec("right", "tank_1", fish=30),
+    ]
+    registry = ConfigRegistry(cache_dir=None)
+    local = {s.name: build_tank_engine(s.tank_id, registry, name=s.name, fish=s.fish) for s in specs}
+
+    # Tiny capacity forces the workers to grow their render buffers.
+    with ShardedEngine(specs, workers=2, capacity=8) as sharded:
+        for _ in range(20):
+            sharded.update(1 / 60)
+            for engine in local.values():
+                engine.update(1 / 60)
+        digests = sharded.digests()
+        rows = [row for frame in sharded.frames() for row in frame.rows()]
+        assert {frame.frame for frame in sharded.frames()} == {20}
+
+    types = (Position, Velocity, Brain)
+    assert digests == {name: StateHasher(types).digest(e.world) for name, e in local.items()}
+    # Identically configured tanks with different names evolve differently.
+    assert digests["left"] != digests["right"]
+
+    expected = {
+        (name, eid): (pos.x, pos.y)
+        for name, engine in local.items()
+        for eid, pos in engine.world.get_components(Position).items()
+        if eid in engine.world.get_components(RectSprite)
+    }
+    assert {(name, eid): (x, y) for name, eid, x, y, _ in rows} == expected
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+
+import pytest
+
+from engine.ecs import World
+from engine.ecs.shared_columns import SharedColumns, SharedColumnsReader
+from engine.game.components import Position, Velocity
+from engine.game.systems import SharedColumnsSystem
+from engine.resources import ResourceStore
+
+
+def test_reader_sees_whole_frames_and_detects_being_lapped() -> None:
+    writer = SharedColumns([("eid", "q"), ("x", "d")], capacity=4)
+    reader = SharedColumnsReader(writer.name)
+    try:
+        frame, columns = reader.read()
+        assert (frame, len(columns["eid"])) == (0, 0)
+
+        writer.publish({"eid": [1, 2], "x": [0.5, 1.5]})
+        with reader.acquire() as view:
+            assert (view.frame, list(view["eid"]), list(view["x"])) == (1, [1, 2], [0.5, 1.5])
+            writer.publish({"eid": [3], "x": [2.5]}, frame=7)
+            assert view.valid()  # the next frame went to the other buffer
+            writer.publish({"eid": [4], "x": [3.5]})
+            assert not view.valid()  # ...but this one reused ours
+
+        frame, columns = reader.read()
+        assert (frame, list(columns["eid"]), list(columns["x"])) == (3, [4], [3.5])
+        with pytest.raises(ValueError):
+            writer.publish({"eid": list(range(5)), "x": [0.0] * 5})
+    finally:
+        reader.close()
+        writer.close()
+
+
+def _read_in_child(name, conn) -> None:
+    reader = SharedColumnsReader(name)
+    frame, columns = reader.read()
+    conn.send((frame, list(columns["eid"]), list(columns["Position.x"])))
+    reader.close()
+
+
+def test_system_publishes_hot_columns_to_other_processes() -> None:
+    world = World()
+    eids = world.create_entities(3)
+    for i, eid in enumerate(eids):
+        world.add_component(eid, Position(x=10.0 * i, y=1.0))
+        if i != 1:
+            world.add_component(eid, Velocity(vx=float(i), vy=0.0))
+
+    system = SharedColumnsSystem(ResourceStore(), capacity=8)
+    try:
+        system.update(world, 1 / 60)
+        parent, child = mp.Pipe()
+        proc = mp.Process(target=_read_in_child, args=(system.name, child))
+        proc.start()
+        frame, ids, xs = parent.recv()
+        proc.join()
+        # Only entities with both Position and Velocity are published.
+        assert (frame, ids, xs) == (1, [eids[0], eids[2]], [0.0, 20.0])
+    finally:
+        system.close()
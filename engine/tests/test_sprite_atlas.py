@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pygame
+
+from engine.adapters.asset_loader import Assets, SpriteAtlas
+from engine.adapters.pygame_render.renderer import Renderer
+
+
+def _solid(size, color) -> pygame.Surface:
+    surf = pygame.Surface(size, pygame.SRCALPHA)
+    surf.fill(color)
+    return surf
+
+
+def test_atlas_packs_without_overlap_and_spills_to_new_pages(tmp_path):
+    pygame.init()
+    try:
+        images = {f"s{i}": _solid((30, 20 + i), (i * 10, 0, 0, 255)) for i in range(10)}
+        images["big"] = _solid((80, 80), (0, 0, 255, 255))
+        atlas = SpriteAtlas.build(images, page_size=64, padding=1)
+
+        assert len(atlas.pages) > 1
+        rects_by_page = {}
+        for sid, region in atlas.regions.items():
+            page = atlas.pages[region.page]
+            assert page.get_rect().contains(region.rect)
+            for other in rects_by_page.get(region.page, []):
+                assert not region.rect.colliderect(other)
+            rects_by_page.setdefault(region.page, []).append(region.rect)
+            sub = atlas.subsurface(sid)
+            assert sub.get_size() == images[sid].get_size()
+            assert sub.get_at((0, 0)) == images[sid].get_at((0, 0))
+
+        atlas.save(tmp_path)
+        loaded = SpriteAtlas.load(tmp_path)
+        assert loaded.regions == atlas.regions
+        assert loaded.subsurface("s3").get_at((1, 1)) == images["s3"].get_at((1, 1))
+    finally:
+        pygame.quit()
+
+
+def test_batched_atlas_draws_match_separate_surfaces():
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    try:
+        assets = Assets(base_path=".")
+        assets._images = {"a": _solid((4, 4), (255, 0, 0, 255)), "b": _solid((6, 3), (0, 255, 0, 255))}
+        plain = {sid: assets.get_image(sid) for sid in ("a", "b")}
+        atlas = assets.build_atlas(page_size=32)
+        assert assets.get_image("a").get_abs_parent() is atlas.pages[0]
+
+        expected = pygame.Surface((20, 20))
+        actual = pygame.Surface((20, 20))
+        r1 = Renderer(expected, bg_color=(0, 0, 0))
+        r2 = Renderer(actual, bg_color=(0, 0, 0))
+        r1.clear()
+        r2.clear()
+        for sid, pos in (("a", (1, 1)), ("b", (8, 10))):
+            w, h = plain[sid].get_size()
+            r1.draw_image(plain[sid], pos[0], pos[1], w, h)
+            r2.submit_image(assets.get_image(sid), pos[0], pos[1], w, h, sprite_id=sid)
+        r2.flush_images()
+
+        assert pygame.image.tobytes(expected, "RGB") == pygame.image.tobytes(actual, "RGB")
+    finally:
+        pygame.quit()
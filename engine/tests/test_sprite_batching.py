@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pygame
+
+from engine.adapters.pygame_render.renderer import Renderer
+
+
+def _sprite() -> pygame.Surface:
+    image = pygame.Surface((4, 2))
+    image.fill((0, 200, 0))
+    image.fill((200, 0, 0), pygame.Rect(0, 0, 2, 2))
+    return image
+
+
+def test_submitted_images_match_immediate_draws():
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    try:
+        image = _sprite()
+        draws = [(5, 5, 8, 4, False), (20, 10, 8, 4, True), (30, 30, 4, 2, False)]
+
+        immediate = pygame.Surface((64, 64))
+        batched = pygame.Surface((64, 64))
+        r1 = Renderer(immediate, bg_color=(0, 0, 0))
+        r2 = Renderer(batched, bg_color=(0, 0, 0))
+        r1.clear()
+        r2.clear()
+
+        for x, y, w, h, flip in draws:
+            r1.draw_image(image, x, y, w, h, flip_x=flip)
+            r2.submit_image(image, x, y, w, h, flip_x=flip)
+
+        # Nothing is drawn until the queue is flushed.
+        assert batched.get_at((6, 6))[:3] == (0, 0, 0)
+        r2.flush_images()
+
+        assert pygame.image.tobytes(immediate, "RGB") == pygame.image.tobytes(batched, "RGB")
+        # Flipped sprite: red half ends up on the right.
+        assert batched.get_at((21, 11))[:3] == (0, 200, 0)
+        assert batched.get_at((27, 11))[:3] == (200, 0, 0)
+    finally:
+        pygame.quit()
+
+
+def test_flush_tracks_dirty_rects():
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    try:
+        surface = pygame.Surface((64, 64))
+        renderer = Renderer(surface, bg_color=(0, 0, 0), dirty_rects=True)
+        renderer.clear()
+        renderer.capture_background()
+        renderer.submit_image(_sprite(), 10, 10, 4, 2)
+        renderer.flush_images()
+        assert pygame.Rect(10, 10, 4, 2) in renderer._dirty
+    finally:
+        pygame.quit()
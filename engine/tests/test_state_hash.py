@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import itertools
+
+from engine.app.boot import build_engine
+from engine.app.desync import compare_engines
+from engine.ecs import System, World
+from engine.ecs.state_hash import StateHasher, first_difference
+from engine.game.components import Brain, Fish, Position
+from engine.game.data.registry import ConfigRegistry
+
+
+def _world(order) -> World:
+    world = World()
+    eids = world.create_entities(3)
+    for i in order:
+        world.add_component(eids[i], Position(x=float(i), y=2.0 * i))
+        world.add_component(eids[i], Brain(state="cruise" if i else "idle"))
+    return world
+
+
+def test_digest_ignores_insertion_order_but_not_values() -> None:
+    types = (Position, Brain)
+    a, b = _world([0, 1, 2]), _world([2, 0, 1])
+    assert StateHasher(types).digest(a) == StateHasher(types).digest(b)
+
+    hasher = StateHasher(types)
+    before = hasher.digest(b)
+    eid = min(b.get_components(Position))
+    b.get_mut(eid, Position).x = -0.0  # same value, different bits
+    assert hasher.digest(b) != before
+
+    diff = first_difference(a, b, types)
+    assert (diff.component_type, diff.eid, diff.field) == (Position, eid, "x")
+
+
+def test_incremental_digest_follows_change_ticks() -> None:
+    world = _world([0, 1, 2])
+    hasher = StateHasher((Position, Brain))
+    first = hasher.digest(world)
+
+    # Unmarked in-place edit: the cached store digest is reused...
+    eid = min(world.get_components(Brain))
+    world.get_components(Brain)[eid].state = "cruise"
+    assert hasher.digest(world) == first
+    assert StateHasher((Position, Brain), incremental=False).digest(world) != first
+    # ...until the store is marked.
+    world.mark_all_changed(Brain)
+    assert hasher.digest(world) != first
+
+    world.remove_component(eid, Position)
+    assert first_difference(world, _world([0, 1, 2]), (Position,)).field is None
+
+
+class _Nudge(System):
+    """Perturbs one fish at a given tick, standing in for a nondeterministic system."""
+
+    phase = "post_update"
+
+    def __init__(self, resources, at_tick: int) -> None:
+        super().__init__(resources)
+        self.at_tick = at_tick
+        self.tick = 0
+        self.eid = None
+
+    def update(self, world: World, dt: float) -> None:
+        self.tick += 1
+        if self.tick == self.at_tick:
+            self.eid = min(world.get_components(Fish))
+            world.get_mut(self.eid, Position).x += 0.5
+
+
+def test_compare_engines_reports_first_divergent_tick_and_entity() -> None:
+    registry = ConfigRegistry(cache_dir=None)
+
+    def frames(n: int):
+        return itertools.repeat(([], 1 / 60), n)
+
+    same = compare_engines(build_engine(registry), build_engine(registry), frames(60), every=5)
+    assert (same.ticks, same.checks, same.diverged) == (60, 12, False)
+
+    a, b = build_engine(registry), build_engine(registry)
+    nudge = _Nudge(b.resources, at_tick=23)
+    b.scheduler.add_system(nudge, phase="post_update")
+    result = compare_engines(a, b, frames(60), every=5)
+
+    assert result.divergent_tick == 25
+    assert result.ticks == 25
+    assert result.difference.eid == nudge.eid
+    assert (result.difference.component_type, result.difference.field) == (Position, "x")
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import pygame
+
+from engine.ecs import World
+from engine.resources import ResourceStore
+from engine.adapters.pygame_render.renderer import Renderer
+from engine.game.components import Position, RectSprite, UIElement, Velocity
+from engine.game.systems import RectRenderSystem
+
+
+class CountingRenderer(Renderer):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.layer_renders: list[str] = []
+
+    def begin_layer(self, name, x, y, width, height) -> None:
+        self.layer_renders.append(name)
+        super().begin_layer(name, x, y, width, height)
+
+
+def _scene():
+    world = World()
+    resources = ResourceStore()
+    renderer = CountingRenderer(pygame.Surface((200, 100)), bg_color=(10, 20, 30))
+    resources.set("renderer", renderer)
+    resources.set("screen_size", (200, 100))
+    resources.set("logical_size", (200, 100))
+    resources.set("ui_styles", {"panel": {"border": [1, 1, 1], "border_width": 2, "corner_radius": 4}})
+
+    panel = world.create_entity()
+    world.add_component(panel, Position(x=10.0, y=10.0))
+    world.add_component(panel, RectSprite(width=60.0, height=30.0, color=(50, 50, 50)))
+    world.add_component(panel, UIElement(width=60.0, height=30.0, style="panel", visible_flag="show_panel"))
+    resources.set("show_panel", True)
+
+    rock = world.create_entity()
+    world.add_component(rock, Position(x=120.0, y=70.0))
+    world.add_component(rock, RectSprite(width=20.0, height=20.0, color=(90, 90, 90)))
+
+    fish = world.create_entity()
+    world.add_component(fish, Position(x=30.0, y=20.0))
+    world.add_component(fish, Velocity(vx=0.0, vy=0.0))
+    world.add_component(fish, RectSprite(width=10.0, height=10.0, color=(255, 0, 0)))
+    return world, resources, renderer
+
+
+def test_static_layers_render_once_and_match_direct_drawing() -> None:
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    try:
+        world, resources, renderer = _scene()
+        sys = RectRenderSystem(resources)
+        for _ in range(3):
+            sys.update(world, dt=0.016)
+        assert sorted(renderer.layer_renders) == ["ui", "world"]
+
+        # Same frame drawn rect by rect on a fresh surface.
+        direct = Renderer(pygame.Surface((200, 100)), bg_color=(10, 20, 30))
+        direct.clear()
+        RectRenderSystem._draw(direct, 120.0, 70.0, 20.0, 20.0, (90, 90, 90), None)
+        RectRenderSystem._draw(direct, 10.0, 10.0, 60.0, 30.0, (50, 50, 50), ((1, 1, 1), 2, 4))
+        RectRenderSystem._draw(direct, 30.0, 20.0, 10.0, 10.0, (255, 0, 0), None)
+        assert pygame.image.tobytes(direct.screen, "RGB") == pygame.image.tobytes(renderer.screen, "RGB")
+    finally:
+        pygame.quit()
+
+
+def test_static_layer_rerenders_on_visibility_and_resize() -> None:
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    try:
+        world, resources, renderer = _scene()
+        sys = RectRenderSystem(resources)
+        sys.update(world, dt=0.016)
+        renderer.layer_renders.clear()
+
+        resources.set("show_panel", False)
+        sys.update(world, dt=0.016)
+        assert renderer.layer_renders == []  # ui layer emptied -> dropped
+        assert not renderer.has_layer("ui")
+
+        resources.set("show_panel", True)
+        sys.update(world, dt=0.016)
+        assert renderer.layer_renders == ["ui"]
+
+        renderer.layer_renders.clear()
+        renderer.set_screen(pygame.Surface((400, 200)))
+        resources.set("screen_size", (400, 200))
+        sys.update(world, dt=0.016)
+        assert sorted(renderer.layer_renders) == ["ui", "world"]
+    finally:
+        pygame.quit()
+
+
+def _rock(world):
+    """The static world-layer rect of _scene()."""
+    statics = set(world.get_components(RectSprite)) - set(world.get_components(Velocity))
+    return next(iter(statics - set(world.get_components(UIElement))))
+
+
+def test_layers_keep_colorkey_colored_rects() -> None:
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    try:
+        world, resources, renderer = _scene()
+        world.get_components(RectSprite)[_rock(world)].color = (255, 0, 255)  # the old layer colorkey
+        sys = RectRenderSystem(resources)
+        sys.update(world, dt=0.016)
+        assert renderer.screen.get_at((130, 80))[:3] == (255, 0, 255)
+    finally:
+        pygame.quit()
+
+
+def test_static_draws_are_reused_until_a_static_input_changes() -> None:
+    pygame.init()
+    pygame.display.set_mode((10, 10))
+    try:
+        world, resources, renderer = _scene()
+        sys = RectRenderSystem(resources)
+        sys.update(world, dt=0.016)
+        layers = sys._static_layers
+        renderer.layer_renders.clear()
+
+        # Moving rects are bulk-marked every frame; static draws are kept.
+        fish = next(eid for eid, *_ in world.view(Position, Velocity))
+        world.get_components(Position)[fish].x += 5.0
+        world.mark_all_changed(Position)
+        sys.update(world, dt=0.016)
+        assert sys._static_layers is layers
+        assert renderer.layer_renders == []
+        assert renderer.screen.get_at((40, 25))[:3] == (255, 0, 0)  # moved fish drawn
+
+        # A per-entity write to a static rect rebuilds its layer only.
+        world.get_mut(_rock(world), Position).x = 100.0
+        sys.update(world, dt=0.016)
+        assert sys._static_layers is not layers
+        assert renderer.layer_renders == ["world"]
+    finally:
+        pygame.quit()
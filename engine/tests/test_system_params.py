@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from engine.ecs import World
+from engine.resources import ResourceStore
+from engine.game.components import Position, Velocity, RectSprite
+from engine.game.components.falling import Falling
+from engine.game.data.registry import freeze
+from engine.game.systems import FallingSystem
+from engine.game.systems.params import MovementParams, ParamBlock
+
+
+def test_param_block_rebuilds_only_when_source_object_changes() -> None:
+    builds = []
+
+    def build(cfg):
+        builds.append(cfg)
+        return MovementParams.from_config(cfg)
+
+    block = ParamBlock(build)
+    cfg = freeze({"max_speed": 40, "avoidance": {"brake_min_factor": 2.0}})
+
+    first = block.get(cfg)
+    assert block.get(cfg) is first
+    assert len(builds) == 1
+    assert first.max_speed == 40.0
+    assert first.avoid_brake_min_factor == 1.0  # clamped
+
+    # Missing resource falls back to defaults once, not every call.
+    block.get(None)
+    block.get(None)
+    assert len(builds) == 2
+
+    replaced = block.get(freeze({"max_speed": 80}))
+    assert replaced.max_speed == 80.0
+    assert len(builds) == 3
+
+
+def test_falling_system_picks_up_replaced_config() -> None:
+    resources = ResourceStore()
+    resources.set("falling_config", freeze({"defaults": {"gravity": 10.0, "terminal_velocity": 100.0}}))
+
+    world = World()
+    eid = world.create_entity()
+    world.add_component(eid, Position(x=0.0, y=0.0))
+    world.add_component(eid, Velocity(vx=0.0, vy=0.0))
+    world.add_component(eid, RectSprite(width=1.0, height=1.0, color=(0, 0, 0)))
+    world.add_component(eid, Falling())
+
+    falling_sys = FallingSystem(resources)
+    falling_sys.update(world, dt=1.0)
+    assert world.get_components(Velocity)[eid].vy == 10.0
+
+    # Hot reload swaps the whole resource; the next frame uses the new values.
+    resources.set("falling_config", freeze({"defaults": {"gravity": 1.0, "terminal_velocity": 100.0}}))
+    falling_sys.update(world, dt=1.0)
+    assert world.get_components(Velocity)[eid].vy == 11.0
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from engine.resources import ResourceStore, Viewport, get_viewport
+
+
+def test_viewport_letterbox_roundtrip():
+    vp = Viewport.from_sizes((1000, 600), (400, 300))
+    assert vp.scale == 2.0
+    assert (vp.offset_x, vp.offset_y) == (100.0, 0.0)
+
+    assert vp.to_screen(10.0, 20.0) == (120.0, 40.0)
+    assert vp.to_logical(120.0, 40.0) == (10.0, 20.0)
+    assert vp.screen_to_logical(50.0, 40.0) is None  # pillarbox bar
+
+    pts = [(0.0, 0.0), (400.0, 300.0)]
+    assert vp.to_logical_many(vp.to_screen_many(pts)) == pts
+
+    a, b, c, d, e, f = vp.affine
+    assert (a * 10.0 + b * 20.0 + c, d * 10.0 + e * 20.0 + f) == (120.0, 40.0)
+
+
+def test_get_viewport_rebuilds_only_when_sizes_change():
+    resources = ResourceStore()
+    resources.set("screen_size", (800, 600))
+    resources.set("logical_size", (0, 300))  # non-positive axis follows the screen
+
+    first = get_viewport(resources)
+    assert first.logical_size == (800, 300)
+    assert get_viewport(resources) is first
+
+    resources.set("screen_size", (1600, 600))
+    second = get_viewport(resources)
+    assert second is not first
+    assert resources.get("viewport") is second
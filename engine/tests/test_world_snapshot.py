@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+
+from engine.ecs import World, SnapshotError, dump_world, load_world
+from engine.ecs.snapshot import available_codecs
+from engine.game.components import Position, Velocity, Brain, Fish, InTank, Tank
+from engine.game.data.registry import ConfigRegistry
+
+
+class Opaque:
+    """Not a dataclass: stored as a pickled column."""
+
+    def __init__(self, tag: str) -> None:
+        self.tag = tag
+
+
+def _world() -> tuple[World, int]:
+    world = World()
+    tank = world.create_entity()
+    world.add_component(tank, Tank(tank_id="t", max_fish=5))
+    eids = world.create_entities(3)
+    world.add_components(Position, eids, [Position(float(i), 2.5 * i) for i in range(3)])
+    world.add_components(Fish, eids, [Fish(species_id="goldfish") for _ in eids])
+    world.add_components(InTank, eids, [InTank(tank=tank) for _ in eids])
+    world.add_component(eids[0], Brain(state="cruise", entered_at=0.25, initialized=True))
+    world.add_component(eids[1], Opaque("x"))
+    world.destroy_entity(eids[2])
+    return world, tank
+
+
+@pytest.mark.parametrize("codec", available_codecs())
+def test_snapshot_round_trips_components_relations_and_ids(codec) -> None:
+    world, tank = _world()
+    data = dump_world(world, extras={"note": 1}, codec=codec)
+
+    restored, extras = load_world(data)
+
+    assert extras == {"note": 1}
+    for ctype in (Position, Fish, InTank, Brain, Tank):
+        assert restored.get_components(ctype) == world.get_components(ctype)
+    assert restored.get_components(Opaque)[3].tag == "x"
+    assert restored.children(InTank, tank) == {2, 3}
+    assert restored.create_entity() == world.create_entity()
+
+
+def test_restored_components_count_as_changed_after_tick_floor() -> None:
+    world, _ = _world()
+    restored, _ = load_world(dump_world(world), tick_floor=1000)
+
+    assert restored.change_tick > 1000
+    assert {eid for eid, _ in restored.changed(Position, 1000)} == {2, 3}
+
+
+def test_load_rejects_foreign_data() -> None:
+    with pytest.raises(SnapshotError):
+        load_world(b"not a snapshot")
+
+
+def test_restored_engine_continues_deterministically() -> None:
+    from engine.app.boot import build_engine
+    from engine.app.savegame import restore_engine, snapshot_engine
+
+    registry = ConfigRegistry(cache_dir=None)
+    engine = build_engine(registry)
+    for _ in range(20):
+        engine.update(1 / 60)
+    data = snapshot_engine(engine)
+    for _ in range(40):
+        engine.update(1 / 60)
+    expected = {eid: (p.x, p.y) for eid, p in engine.world.get_components(Position).items()}
+
+    other = build_engine(registry)
+    restore_engine(other, data)
+    for _ in range(40):
+        other.update(1 / 60)
+
+    assert {eid: (p.x, p.y) for eid, p in other.world.get_components(Position).items()} == expected
+    assert other.world.get_components(Velocity)